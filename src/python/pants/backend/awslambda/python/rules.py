@@ -15,6 +15,7 @@ from pants.backend.awslambda.python.target_types import (
     PythonAWSLambdaLayer,
     PythonAwsLambdaLayerDependenciesField,
     PythonAwsLambdaRuntime,
+    PythonAwsLambdaSeparateDependenciesLayerField,
 )
 from pants.backend.python.util_rules.faas import (
     BuildPythonFaaSRequest,
@@ -35,6 +36,19 @@ from pants.util.logging import LogLevel
 logger = logging.getLogger(__name__)
 
 
+# See
+# https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html#configuration-layers-path
+#
+# Runtime | Path
+# ...
+# Python  | `python`
+#         | `python/lib/python3.10/site-packages`
+# ...
+#
+# The one independent on the runtime-version is more convenient:
+_LAYER_PREFIX = "python"
+
+
 @dataclass(frozen=True)
 class _BaseFieldSet(PackageFieldSet):
     include_requirements: PythonAwsLambdaIncludeRequirements
@@ -53,6 +67,7 @@ class PythonAwsLambdaFieldSet(_BaseFieldSet):
     required_fields = (PythonAwsLambdaHandlerField,)
 
     handler: PythonAwsLambdaHandlerField
+    separate_dependencies_layer: PythonAwsLambdaSeparateDependenciesLayerField
 
 
 @dataclass(frozen=True)
@@ -82,6 +97,8 @@ async def package_python_aws_lambda_function(
             pex_build_extra_args=field_set.pex_build_extra_args,
             layout=field_set.layout,
             reexported_handler_module=PythonAwsLambdaHandlerField.reexported_handler_module,
+            separate_dependencies_layer=field_set.separate_dependencies_layer.value,
+            dependencies_layer_prefix=_LAYER_PREFIX,
         )
     )
 
@@ -103,17 +120,7 @@ async def package_python_aws_lambda_layer(
             pex3_venv_create_extra_args=field_set.pex3_venv_create_extra_args,
             pex_build_extra_args=field_set.pex_build_extra_args,
             layout=field_set.layout,
-            # See
-            # https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html#configuration-layers-path
-            #
-            # Runtime | Path
-            # ...
-            # Python  | `python`
-            #         | `python/lib/python3.10/site-packages`
-            # ...
-            #
-            # The one independent on the runtime-version is more convenient:
-            prefix_in_artifact="python",
+            prefix_in_artifact=_LAYER_PREFIX,
             # a layer doesn't have a handler, just pulls in things via `dependencies`
             handler=None,
             reexported_handler_module=None,
@@ -20,6 +20,7 @@ from pants.backend.python.util_rules.faas import (
     PythonFaaSPex3VenvCreateExtraArgsField,
     PythonFaaSPexBuildExtraArgs,
     PythonFaaSRuntimeField,
+    PythonFaaSSeparateDependenciesLayerField,
 )
 from pants.backend.python.util_rules.faas import rules as faas_rules
 from pants.core.environments.target_types import EnvironmentField
@@ -92,6 +93,18 @@ class PythonAwsLambdaIncludeSources(BoolField):
     )
 
 
+class PythonAwsLambdaSeparateDependenciesLayerField(PythonFaaSSeparateDependenciesLayerField):
+    help = help_text(
+        f"""
+        {PythonFaaSSeparateDependenciesLayerField.help}
+
+        The dependencies artifact uses the directory structure expected of a Lambda Layer, so it can
+        be published as a layer and attached to the function.
+        https://docs.aws.amazon.com/lambda/latest/dg/configuration-layers.html
+        """
+    )
+
+
 PYTHON_RUNTIME_REGEX = r"python(?P<major>\d)\.(?P<minor>\d+)"
 
 
@@ -240,6 +253,7 @@ class PythonAWSLambda(_AWSLambdaBaseTarget):
         PythonFaaSDependencies,
         PythonAwsLambdaHandlerField,
         AWSLambdaArchitectureField,
+        PythonAwsLambdaSeparateDependenciesLayerField,
     )
     help = help_text(
         f"""
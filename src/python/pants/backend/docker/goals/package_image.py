@@ -34,7 +34,12 @@ from pants.backend.docker.target_types import (
     DockerImageTargetStageField,
     get_docker_image_tags,
 )
-from pants.backend.docker.util_rules.docker_binary import DockerBinary
+from pants.backend.docker.util_rules.docker_binary import (
+    DockerBinary,
+    IncrementalBuildContext,
+    LocalBuildCache,
+    get_docker_build_context_tools,
+)
 from pants.backend.docker.util_rules.docker_build_context import (
     DockerBuildContext,
     DockerBuildContextRequest,
@@ -444,6 +449,20 @@ async def build_docker_image(
         "__UPSTREAM_IMAGE_IDS": ",".join(context.upstream_image_ids),
     }
     context_root = field_set.get_context_root(options.default_context_root)
+    use_local_build_cache = options.local_build_cache and options.use_buildx
+    tools = None
+    if options.incremental_build_context or use_local_build_cache:
+        tools = await get_docker_build_context_tools(**implicitly())
+    incremental_context = None
+    if tools and options.incremental_build_context:
+        incremental_context = IncrementalBuildContext(
+            name=field_set.address.path_safe_spec,
+            layers=context.layers,
+            tools=tools,
+        )
+    local_build_cache = None
+    if tools and use_local_build_cache:
+        local_build_cache = LocalBuildCache(name=field_set.address.path_safe_spec, tools=tools)
     process = docker.build_image(
         build_args=context.build_args,
         digest=context.digest,
@@ -463,6 +482,8 @@ async def build_docker_image(
                 target=wrapped_target.target,
             )
         ),
+        incremental_context=incremental_context,
+        local_build_cache=local_build_cache,
     )
     result = await execute_process(process, **implicitly())
 
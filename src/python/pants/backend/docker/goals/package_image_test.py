@@ -34,7 +34,11 @@ from pants.backend.docker.target_types import (
     DockerImageTagsRequest,
     DockerImageTarget,
 )
-from pants.backend.docker.util_rules.docker_binary import DockerBinary
+from pants.backend.docker.util_rules.docker_binary import (
+    DockerBinary,
+    DockerBuildContextTools,
+    generate_local_build_cache_script,
+)
 from pants.backend.docker.util_rules.docker_build_args import (
     DockerBuildArgs,
     DockerBuildArgsRequest,
@@ -49,6 +53,7 @@ from pants.backend.docker.util_rules.docker_build_env import (
     DockerBuildEnvironmentRequest,
 )
 from pants.backend.docker.util_rules.docker_build_env import rules as build_env_rules
+from pants.core.util_rules.system_binaries import BashBinary, BinaryShims
 from pants.engine.addresses import Address
 from pants.engine.fs import (
     EMPTY_DIGEST,
@@ -180,6 +185,8 @@ def assert_build(
         opts.setdefault("use_buildx", False)
         opts.setdefault("env_vars", [])
         opts.setdefault("suggest_renames", True)
+        opts.setdefault("incremental_build_context", False)
+        opts.setdefault("local_build_cache", False)
 
         docker_options = create_subsystem(
             DockerOptions,
@@ -211,6 +218,9 @@ def assert_build(
             ),
             "pants.engine.intrinsics.execute_process": run_process_mock,
             "pants.engine.intrinsics.create_digest": mock_get_info_file,
+            "pants.backend.docker.util_rules.docker_binary.get_docker_build_context_tools": lambda **_: DockerBuildContextTools(
+                BashBinary("/bin/bash"), BinaryShims(EMPTY_DIGEST, "docker_build_context_tools")
+            ),
         },
         union_membership=union_membership,
         show_warnings=False,
@@ -1174,6 +1184,53 @@ def test_docker_cache_from_option(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_docker_local_build_cache_option(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "docker/test/BUILD": dedent(
+                """\
+                docker_image(
+                  name="img1",
+                )
+                """
+            ),
+        }
+    )
+
+    def check_docker_proc(process: Process):
+        assert process.argv == (
+            "/bin/bash",
+            "-c",
+            generate_local_build_cache_script(
+                ".cache/docker_buildkit_cache/docker.test.img1",
+                (
+                    "/dummy/docker",
+                    "buildx",
+                    "build",
+                    "--output=type=docker",
+                    "--pull=False",
+                    "--cache-from=type=local,src=.cache/docker_buildkit_cache/docker.test.img1",
+                    "--cache-to=type=local,dest=.cache/docker_buildkit_cache/docker.test.img1.new,mode=max",
+                    "--tag",
+                    "img1:latest",
+                    "--file",
+                    "docker/test/Dockerfile",
+                    ".",
+                ),
+            ),
+        )
+        assert process.append_only_caches == FrozenDict(
+            {"docker_buildkit_cache": ".cache/docker_buildkit_cache"}
+        )
+
+    assert_build(
+        rule_runner,
+        Address("docker/test", target_name="img1"),
+        process_assertions=check_docker_proc,
+        options=dict(use_buildx=True, local_build_cache=True),
+    )
+
+
 def test_docker_output_option(rule_runner: RuleRunner) -> None:
     """Testing non-default output type 'image'.
 
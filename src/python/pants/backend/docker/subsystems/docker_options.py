@@ -279,6 +279,50 @@ class DockerOptions(Subsystem):
         ),
         advanced=True,
     )
+    local_build_cache = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, export the BuildKit cache of each `docker_image` to a local directory in an
+            append-only named cache, and import it again on the next build of the image. This
+            lets repeated builds on the same machine, such as CI runs, reuse the layers of
+            previous builds without a registry.
+
+            BuildKit never prunes a local cache which it exports to, so a cache which is exported
+            to the same directory on every build grows without bound. Pants instead exports the
+            cache of each build to a fresh directory, and only replaces the previous cache with it
+            once the build succeeded. The cache of an image thus only holds the layers of its
+            latest successful build. Caches of images which no longer exist are not removed: to
+            reclaim their space, delete the `docker_buildkit_cache` directory in
+            `[GLOBAL].named_caches_dir`.
+
+            Has no effect unless `[docker].use_buildx` is enabled. Exporting a local cache
+            requires a builder which supports it, such as one using the `docker-container`
+            driver.
+            """
+        ),
+        advanced=True,
+    )
+    incremental_build_context = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, assemble the build context of each `docker_image` in a directory which is
+            kept between builds, rather than copying the whole context into the sandbox of
+            every build.
+
+            The Dockerfile, the context files and each packaged dependency are materialized
+            once per version into an append-only named cache, and hard linked into the
+            directory of the image (falling back to a copy when hard links are not supported).
+            Because the path of that directory and the metadata of unchanged files are stable
+            between builds, BuildKit only transfers the files of the context that changed.
+
+            Concurrent builds of the same image by separate Pants runs are not supported in this
+            mode.
+            """
+        ),
+        advanced=True,
+    )
 
     @property
     def build_args(self) -> tuple[str, ...]:
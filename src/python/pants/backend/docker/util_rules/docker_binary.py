@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import os
+import shlex
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import cast
@@ -12,15 +13,17 @@ from typing import cast
 from pants.backend.docker.subsystems.docker_options import DockerOptions
 from pants.backend.docker.util_rules.docker_build_args import DockerBuildArgs
 from pants.core.util_rules.system_binaries import (
+    BashBinary,
     BinaryPath,
     BinaryPathRequest,
     BinaryPathTest,
     BinaryShims,
     BinaryShimsRequest,
+    SystemBinariesSubsystem,
     create_binary_shims,
     find_binary,
 )
-from pants.engine.fs import Digest
+from pants.engine.fs import EMPTY_DIGEST, Digest
 from pants.engine.internals.selectors import concurrently
 from pants.engine.process import Process, ProcessCacheScope
 from pants.engine.rules import collect_rules, implicitly, rule
@@ -29,6 +32,48 @@ from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
+_BUILD_CONTEXT_CACHE_NAME = "docker_build_context"
+_BUILD_CONTEXT_CACHE_DIR = ".cache/docker_build_context"
+_BUILD_CONTEXT_LAYERS_DIR = "__docker_context_layers"
+_BUILDKIT_CACHE_NAME = "docker_buildkit_cache"
+_BUILDKIT_CACHE_DIR = ".cache/docker_buildkit_cache"
+
+
+@dataclass(frozen=True)
+class DockerBuildContextTools:
+    """The tools used to assemble a build context or rotate a BuildKit cache outside of the
+    sandbox."""
+
+    bash: BashBinary
+    shims: BinaryShims
+
+
+@dataclass(frozen=True)
+class IncrementalBuildContext:
+    """A build context which is assembled from its layers in a directory kept between builds.
+
+    Each layer (such as the sources or a packaged dependency) is materialized once per digest as
+    an immutable input, and is then hard linked into the directory named `name`, so that unchanged
+    layers are neither copied into the sandbox nor re-transferred by BuildKit.
+    """
+
+    name: str
+    layers: tuple[Digest, ...]
+    tools: DockerBuildContextTools
+
+
+@dataclass(frozen=True)
+class LocalBuildCache:
+    """A BuildKit cache which is imported from, and exported to, a directory kept between builds.
+
+    BuildKit never prunes a local cache which it exports to, so each build exports a fresh cache
+    next to the directory named `name`, and only replaces that directory once the build succeeded.
+    The cache thus holds the layers of the latest successful build, rather than of every build.
+    """
+
+    name: str
+    tools: DockerBuildContextTools
+
 
 @dataclass(frozen=True)
 class DockerBinary(BinaryPath):
@@ -74,6 +119,8 @@ class DockerBinary(BinaryPath):
         env: Mapping[str, str],
         use_buildx: bool,
         extra_args: tuple[str, ...] = (),
+        incremental_context: IncrementalBuildContext | None = None,
+        local_build_cache: LocalBuildCache | None = None,
     ) -> Process:
         if use_buildx:
             build_commands = ["buildx", "build"]
@@ -82,23 +129,56 @@ class DockerBinary(BinaryPath):
 
         args = [self.path, *build_commands, *extra_args]
 
+        local_build_cache_dir = None
+        if local_build_cache:
+            local_build_cache_dir = os.path.join(_BUILDKIT_CACHE_DIR, local_build_cache.name)
+            # BuildKit warns about, but otherwise ignores, a cache which has not been exported yet.
+            args.extend(
+                [
+                    f"--cache-from=type=local,src={local_build_cache_dir}",
+                    f"--cache-to=type=local,dest={local_build_cache_dir}.new,mode=max",
+                ]
+            )
+
         for tag in tags:
             args.extend(["--tag", tag])
 
         for build_arg in build_args:
             args.extend(["--build-arg", build_arg])
 
+        description = f"Building docker image {tags[0]}" + (
+            f" +{pluralize(len(tags) - 1, 'additional tag')}." if len(tags) > 1 else ""
+        )
+        if incremental_context:
+            return self._build_image_incrementally(
+                incremental_context,
+                args,
+                dockerfile,
+                context_root,
+                env,
+                description,
+                local_build_cache_dir,
+            )
+
         args.extend(["--file", dockerfile])
 
         # Docker context root.
         args.append(context_root)
 
+        if local_build_cache and local_build_cache_dir:
+            return self._build_image_with_script(
+                generate_local_build_cache_script(local_build_cache_dir, args),
+                local_build_cache.tools,
+                env,
+                description,
+                input_digest=digest,
+                immutable_input_digests={},
+                append_only_caches={_BUILDKIT_CACHE_NAME: _BUILDKIT_CACHE_DIR},
+            )
+
         return Process(
             argv=tuple(args),
-            description=(
-                f"Building docker image {tags[0]}"
-                + (f" +{pluralize(len(tags) - 1, 'additional tag')}." if len(tags) > 1 else "")
-            ),
+            description=description,
             env=self._get_process_environment(env),
             input_digest=digest,
             immutable_input_digests=self.extra_input_digests,
@@ -107,6 +187,73 @@ class DockerBinary(BinaryPath):
             cache_scope=ProcessCacheScope.PER_SESSION,
         )
 
+    def _build_image_incrementally(
+        self,
+        incremental_context: IncrementalBuildContext,
+        build_args: Sequence[str],
+        dockerfile: str,
+        context_root: str,
+        env: Mapping[str, str],
+        description: str,
+        local_build_cache_dir: str | None,
+    ) -> Process:
+        layers = {
+            os.path.join(_BUILD_CONTEXT_LAYERS_DIR, str(index)): layer
+            for index, layer in enumerate(incremental_context.layers)
+            if layer != EMPTY_DIGEST
+        }
+        script = generate_incremental_build_context_script(
+            os.path.join(_BUILD_CONTEXT_CACHE_DIR, incremental_context.name),
+            tuple(layers),
+            build_args,
+            dockerfile,
+            context_root,
+            local_build_cache_dir=local_build_cache_dir,
+        )
+        append_only_caches = {_BUILD_CONTEXT_CACHE_NAME: _BUILD_CONTEXT_CACHE_DIR}
+        if local_build_cache_dir:
+            append_only_caches[_BUILDKIT_CACHE_NAME] = _BUILDKIT_CACHE_DIR
+        return self._build_image_with_script(
+            script,
+            incremental_context.tools,
+            env,
+            description,
+            input_digest=EMPTY_DIGEST,
+            immutable_input_digests=layers,
+            append_only_caches=append_only_caches,
+        )
+
+    def _build_image_with_script(
+        self,
+        script: str,
+        tools: DockerBuildContextTools,
+        env: Mapping[str, str],
+        description: str,
+        *,
+        input_digest: Digest,
+        immutable_input_digests: Mapping[str, Digest],
+        append_only_caches: Mapping[str, str],
+    ) -> Process:
+        process_env = self._get_process_environment(env)
+        return Process(
+            argv=(tools.bash.path, "-c", script),
+            description=description,
+            env={
+                **process_env,
+                "PATH": os.pathsep.join(
+                    p for p in (tools.shims.path_component, process_env.get("PATH")) if p
+                ),
+            },
+            input_digest=input_digest,
+            immutable_input_digests={
+                **(self.extra_input_digests or {}),
+                **tools.shims.immutable_input_digests,
+                **immutable_input_digests,
+            },
+            append_only_caches=append_only_caches,
+            cache_scope=ProcessCacheScope.PER_SESSION,
+        )
+
     def push_image(self, tag: str, env: Mapping[str, str] | None = None) -> Process:
         return Process(
             argv=(self.path, "push", tag),
@@ -133,6 +280,83 @@ class DockerBinary(BinaryPath):
         )
 
 
+def generate_incremental_build_context_script(
+    context_dir: str,
+    layer_dirs: Sequence[str],
+    build_args: Sequence[str],
+    dockerfile: str,
+    context_root: str,
+    *,
+    local_build_cache_dir: str | None = None,
+) -> str:
+    """Generate a bash script which assembles the build context in `context_dir` from the given
+    layers, and then builds it with the given `docker build` arguments."""
+    lines = [
+        "set -euo pipefail",
+        f"context_dir={shlex.quote(context_dir)}",
+        # The directories of immutable inputs are read-only, and copying them keeps their mode, so
+        # they must be made writable before another layer or a fallback copy can write into them.
+        # The files must stay read-only: they share their inode with the immutable inputs.
+        'make_dirs_writable() { find "$context_dir" -type d -exec chmod u+w {} +; }',
+        'if [ -d "$context_dir" ]; then',
+        "  make_dirs_writable",
+        '  rm -rf "$context_dir"',
+        "fi",
+        'mkdir -p "$context_dir"',
+    ]
+    for layer_dir in layer_dirs:
+        source = shlex.quote(f"{layer_dir}/.")
+        # Hard links preserve the modification times of unchanged files, which BuildKit uses to
+        # skip them when transferring the context. Fall back to a copy which preserves them too.
+        lines.extend(
+            [
+                f'cp -RPl {source} "$context_dir/" 2>/dev/null || '
+                f'{{ make_dirs_writable; cp -RPpf {source} "$context_dir/"; }}',
+                "make_dirs_writable",
+            ]
+        )
+    lines.extend(
+        [
+            # Resolve the named cache symlink, so that the context path is stable between builds.
+            'context_dir="$(cd "$context_dir" && pwd -P)"',
+            *_build_command_lines(
+                " ".join(
+                    (
+                        *(shlex.quote(arg) for arg in build_args),
+                        "--file",
+                        f'"$context_dir"/{shlex.quote(dockerfile)}',
+                        f'"$context_dir"/{shlex.quote(context_root)}',
+                    )
+                ),
+                local_build_cache_dir,
+            ),
+        ]
+    )
+    return "\n".join(lines)
+
+
+def generate_local_build_cache_script(cache_dir: str, build_args: Sequence[str]) -> str:
+    """Generate a bash script which builds with the given `docker build` arguments, and then
+    replaces the BuildKit cache in `cache_dir` with the one exported next to it."""
+    return "\n".join(
+        ["set -euo pipefail", *_build_command_lines(shlex.join(build_args), cache_dir)]
+    )
+
+
+def _build_command_lines(build_command: str, local_build_cache_dir: str | None) -> list[str]:
+    if not local_build_cache_dir:
+        return [f"exec {build_command}"]
+    return [
+        f"cache_dir={shlex.quote(local_build_cache_dir)}",
+        # Drop the leftovers of an interrupted build. Under `set -e`, a failed build leaves the
+        # previous cache in place.
+        'rm -rf "$cache_dir.new"',
+        build_command,
+        'rm -rf "$cache_dir"',
+        'mv "$cache_dir.new" "$cache_dir"',
+    ]
+
+
 async def _get_docker_tools_shims(
     *,
     tools: Sequence[str],
@@ -242,5 +466,25 @@ async def get_docker(
     )
 
 
+@rule(desc="Finding tools to assemble Docker build contexts", level=LogLevel.DEBUG)
+async def get_docker_build_context_tools(
+    bash: BashBinary, system_binaries: SystemBinariesSubsystem.EnvironmentAware
+) -> DockerBuildContextTools:
+    shims = await create_binary_shims(
+        BinaryShimsRequest.for_binaries(
+            "chmod",
+            "cp",
+            "find",
+            "mkdir",
+            "mv",
+            "rm",
+            rationale="assemble Docker build contexts and rotate BuildKit caches",
+            search_path=system_binaries.system_binary_paths,
+        ),
+        bash,
+    )
+    return DockerBuildContextTools(bash, shims)
+
+
 def rules():
     return collect_rules()
@@ -1,16 +1,29 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import os
+import subprocess
 from hashlib import sha256
+from pathlib import Path
 from unittest import mock
 
 import pytest
 
 from pants.backend.docker.subsystems.docker_options import DockerOptions
-from pants.backend.docker.util_rules.docker_binary import DockerBinary, get_docker, rules
+from pants.backend.docker.util_rules.docker_binary import (
+    DockerBinary,
+    DockerBuildContextTools,
+    IncrementalBuildContext,
+    LocalBuildCache,
+    generate_incremental_build_context_script,
+    generate_local_build_cache_script,
+    get_docker,
+    rules,
+)
 from pants.backend.docker.util_rules.docker_build_args import DockerBuildArgs
 from pants.backend.experimental.docker.podman.register import rules as podman_rules
 from pants.core.util_rules.system_binaries import (
+    BashBinary,
     BinaryNotFoundError,
     BinaryPath,
     BinaryPathRequest,
@@ -89,6 +102,170 @@ def test_docker_binary_build_image(docker_path: str, docker: DockerBinary) -> No
     assert build_request.description == "Building docker image test:0.1.0 +1 additional tag."
 
 
+def test_docker_binary_build_image_incrementally(docker_path: str, docker: DockerBinary) -> None:
+    sources = Digest(sha256(b"sources").hexdigest(), 123)
+    package = Digest(sha256(b"package").hexdigest(), 456)
+    shims = BinaryShims(Digest(sha256(b"shims").hexdigest(), 789), "cache_name")
+    build_request = docker.build_image(
+        tags=("test:0.1.0",),
+        digest=Digest(sha256().hexdigest(), 123),
+        dockerfile="src/test/repo/Dockerfile",
+        build_args=DockerBuildArgs(),
+        context_root="",
+        env={"PATH": "/usr/bin"},
+        use_buildx=True,
+        incremental_context=IncrementalBuildContext(
+            name="src.test.repo",
+            layers=(sources, EMPTY_DIGEST, package),
+            tools=DockerBuildContextTools(BashBinary("/bin/bash"), shims),
+        ),
+    )
+
+    assert build_request.argv == (
+        "/bin/bash",
+        "-c",
+        generate_incremental_build_context_script(
+            ".cache/docker_build_context/src.test.repo",
+            ("__docker_context_layers/0", "__docker_context_layers/2"),
+            (docker_path, "buildx", "build", "--tag", "test:0.1.0"),
+            "src/test/repo/Dockerfile",
+            "",
+        ),
+    )
+    assert build_request.input_digest == EMPTY_DIGEST
+    assert dict(build_request.immutable_input_digests) == {
+        "cache_name": shims.digest,
+        "__docker_context_layers/0": sources,
+        "__docker_context_layers/2": package,
+    }
+    assert dict(build_request.append_only_caches) == {
+        "docker_build_context": ".cache/docker_build_context"
+    }
+    assert build_request.env["PATH"] == "{chroot}/cache_name:/usr/bin"
+
+
+def test_generate_incremental_build_context_script() -> None:
+    script = generate_incremental_build_context_script(
+        "cache/my image", ("layers/0",), ("/bin/docker", "build"), "Dockerfile", "ctx"
+    )
+    assert "context_dir='cache/my image'" in script
+    assert (
+        'cp -RPl layers/0/. "$context_dir/" 2>/dev/null || '
+        '{ make_dirs_writable; cp -RPpf layers/0/. "$context_dir/"; }\nmake_dirs_writable' in script
+    )
+    assert script.endswith(
+        'exec /bin/docker build --file "$context_dir"/Dockerfile "$context_dir"/ctx'
+    )
+
+
+def test_incremental_build_context_script_assembles_overlapping_layers(tmp_path: Path) -> None:
+    # Immutable inputs are materialized with read-only directories, and the layers of a context
+    # usually share some, such as the directory of both the Dockerfile and the sources.
+    layers = {
+        "layers/0": {"src/docker/Dockerfile": "FROM scratch"},
+        "layers/1": {"src/docker/app.py": "print('hello')", "src/lib/util.py": ""},
+    }
+    for layer_dir, files in layers.items():
+        for path, content in files.items():
+            (tmp_path / layer_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / layer_dir / path).write_text(content)
+        for dirpath, _, _ in os.walk(tmp_path / layer_dir):
+            os.chmod(dirpath, 0o555)
+
+    script = generate_incremental_build_context_script(
+        "context", tuple(layers), ("true",), "src/docker/Dockerfile", "src/docker"
+    )
+    # The second run replaces the context assembled by the first one.
+    for _ in range(2):
+        subprocess.run(["bash", "-c", script], cwd=tmp_path, check=True)
+
+    context = tmp_path / "context"
+    assert {
+        str(path.relative_to(context)): path.read_text()
+        for path in context.rglob("*")
+        if path.is_file()
+    } == {path: content for files in layers.values() for path, content in files.items()}
+
+
+def test_docker_binary_build_image_with_local_build_cache(
+    docker_path: str, docker: DockerBinary
+) -> None:
+    digest = Digest(sha256().hexdigest(), 123)
+    shims = BinaryShims(Digest(sha256(b"shims").hexdigest(), 789), "cache_name")
+    build_request = docker.build_image(
+        tags=("test:0.1.0",),
+        digest=digest,
+        dockerfile="src/test/repo/Dockerfile",
+        build_args=DockerBuildArgs(),
+        context_root="",
+        env={},
+        use_buildx=True,
+        local_build_cache=LocalBuildCache(
+            name="src.test.repo", tools=DockerBuildContextTools(BashBinary("/bin/bash"), shims)
+        ),
+    )
+
+    assert build_request.argv == (
+        "/bin/bash",
+        "-c",
+        generate_local_build_cache_script(
+            ".cache/docker_buildkit_cache/src.test.repo",
+            (
+                docker_path,
+                "buildx",
+                "build",
+                "--cache-from=type=local,src=.cache/docker_buildkit_cache/src.test.repo",
+                "--cache-to=type=local,dest=.cache/docker_buildkit_cache/src.test.repo.new,mode=max",
+                "--tag",
+                "test:0.1.0",
+                "--file",
+                "src/test/repo/Dockerfile",
+                "",
+            ),
+        ),
+    )
+    assert build_request.input_digest == digest
+    assert dict(build_request.immutable_input_digests) == {"cache_name": shims.digest}
+    assert dict(build_request.append_only_caches) == {
+        "docker_buildkit_cache": ".cache/docker_buildkit_cache"
+    }
+
+
+def test_generate_local_build_cache_script() -> None:
+    script = generate_local_build_cache_script("cache/my image", ("/bin/docker", "build", "."))
+    # The exported cache only replaces the previous one once the build succeeded.
+    assert script == "\n".join(
+        [
+            "set -euo pipefail",
+            "cache_dir='cache/my image'",
+            'rm -rf "$cache_dir.new"',
+            "/bin/docker build .",
+            'rm -rf "$cache_dir"',
+            'mv "$cache_dir.new" "$cache_dir"',
+        ]
+    )
+
+    script = generate_incremental_build_context_script(
+        "context",
+        (),
+        ("/bin/docker", "build"),
+        "Dockerfile",
+        "ctx",
+        local_build_cache_dir="cache/image",
+    )
+    assert script.endswith(
+        "\n".join(
+            [
+                "cache_dir=cache/image",
+                'rm -rf "$cache_dir.new"',
+                '/bin/docker build --file "$context_dir"/Dockerfile "$context_dir"/ctx',
+                'rm -rf "$cache_dir"',
+                'mv "$cache_dir.new" "$cache_dir"',
+            ]
+        )
+    )
+
+
 def test_docker_binary_push_image(docker_path: str, docker: DockerBinary) -> None:
     image_ref = "registry/repo/name:tag"
     push_request = docker.push_image(image_ref)
@@ -121,6 +121,9 @@ class DockerBuildContext:
     interpolation_context: InterpolationContext
     copy_source_vs_context_source: tuple[tuple[str, str], ...]
     stages: tuple[str, ...]
+    # The digests which were merged into `digest`: the Dockerfile, the context files and each
+    # packaged dependency.
+    layers: tuple[Digest, ...] = ()
 
     @classmethod
     def create(
@@ -131,6 +134,7 @@ class DockerBuildContext:
         upstream_image_ids: Iterable[str],
         dockerfile_info: DockerfileInfo,
         should_suggest_renames: bool = True,
+        layers: Iterable[Digest] = (),
     ) -> DockerBuildContext:
         interpolation_context: dict[str, dict[str, str] | InterpolationValue] = {}
 
@@ -181,6 +185,7 @@ class DockerBuildContext:
             interpolation_context=InterpolationContext.from_dict(interpolation_context),
             copy_source_vs_context_source=copy_source_vs_context_source,
             stages=tuple(sorted(stage_names)),
+            layers=tuple(layers),
         )
 
     @classmethod
@@ -333,10 +338,12 @@ async def create_docker_build_context(
         logger.debug("Did not build any packages for Docker image")
 
     embedded_pkgs_digest = [built_package.digest for built_package in embedded_pkgs]
-    all_digests = (dockerfile_info.digest, sources.snapshot.digest, *embedded_pkgs_digest)
+    all_digests = tuple(
+        d for d in (dockerfile_info.digest, sources.snapshot.digest, *embedded_pkgs_digest) if d
+    )
 
     # Merge all digests to get the final docker build context digest.
-    context_request = digest_to_snapshot(**implicitly(MergeDigests(d for d in all_digests if d)))
+    context_request = digest_to_snapshot(**implicitly(MergeDigests(all_digests)))
 
     # Requests for build args and env
     build_args_request = docker_build_args(DockerBuildArgsRequest(docker_image), **implicitly())
@@ -418,6 +425,7 @@ async def create_docker_build_context(
         dockerfile_info=dockerfile_info,
         build_env=build_env,
         should_suggest_renames=options.suggest_renames,
+        layers=all_digests,
     )
 
 
@@ -7,10 +7,10 @@ import dataclasses
 import json
 import logging
 import os
-from collections import deque
+import shlex
+from collections import defaultdict, deque
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any
 
 from pants.backend.go.subsystems.gotest import GoTestSubsystem
 from pants.backend.go.target_type_rules import (
@@ -19,6 +19,7 @@ from pants.backend.go.target_type_rules import (
 )
 from pants.backend.go.target_types import (
     GoPackageSourcesField,
+    GoTestBatchCompatibilityTagField,
     GoTestExtraEnvVarsField,
     GoTestTimeoutField,
     SkipGoTestsField,
@@ -71,7 +72,9 @@ from pants.build_graph.address import Address
 from pants.core.goals.test import TestExtraEnv, TestFieldSet, TestRequest, TestResult, TestSubsystem
 from pants.core.target_types import FileSourceField
 from pants.core.util_rules.env_vars import environment_vars_subset
+from pants.core.util_rules.partitions import Partition, PartitionerType, Partitions
 from pants.core.util_rules.source_files import SourceFilesRequest, determine_source_files
+from pants.core.util_rules.system_binaries import BashBinary
 from pants.engine.env_vars import EnvironmentVarsRequest
 from pants.engine.fs import EMPTY_FILE_DIGEST, AddPrefix, Digest, MergeDigests
 from pants.engine.internals.graph import resolve_targets
@@ -92,6 +95,7 @@ from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import Dependencies, DependenciesRequest, SourcesField, Target
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +142,7 @@ class GoTestFieldSet(TestFieldSet):
     dependencies: Dependencies
     timeout: GoTestTimeoutField
     extra_env_vars: GoTestExtraEnvVarsField
+    batch_compatibility_tag: GoTestBatchCompatibilityTagField
 
     @classmethod
     def opt_out(cls, tgt: Target) -> bool:
@@ -148,6 +153,20 @@ class GoTestRequest(TestRequest):
     tool_subsystem = GoTestSubsystem  # type: ignore[assignment]
     field_set_type = GoTestFieldSet
 
+    partitioner_type = PartitionerType.CUSTOM
+
+
+@dataclass(frozen=True)
+class GoTestMetadata:
+    """Parameters that must be constant for all packages in a batched Go test run."""
+
+    extra_env_vars: tuple[str, ...]
+    compatibility_tag: str | None = None
+
+    @property
+    def description(self) -> str | None:
+        return self.compatibility_tag
+
 
 @dataclass(frozen=True)
 class PrepareGoTestBinaryCoverageConfig:
@@ -587,53 +606,58 @@ def _ensure_no_profile_options(args: Sequence[str]) -> None:
                 )
 
 
-@rule(desc="Test with Go", level=LogLevel.DEBUG)
-async def run_go_tests(
-    batch: GoTestRequest.Batch[GoTestFieldSet, Any],
+def _go_test_outputs_are_per_package(
+    test_subsystem: TestSubsystem, go_test_subsystem: GoTestSubsystem
+) -> bool:
+    return (
+        test_subsystem.use_coverage
+        or go_test_subsystem.output_test_binary
+        or go_test_subsystem.block_profile
+        or go_test_subsystem.cpu_profile
+        or go_test_subsystem.mem_profile
+        or go_test_subsystem.mutex_profile
+        or go_test_subsystem.trace
+    )
+
+
+@rule(desc="Partition Go tests", level=LogLevel.DEBUG)
+async def partition_go_tests(
+    request: GoTestRequest.PartitionRequest[GoTestFieldSet],
     test_subsystem: TestSubsystem,
     go_test_subsystem: GoTestSubsystem,
-    test_extra_env: TestExtraEnv,
-    goroot: GoRoot,
-) -> TestResult:
-    field_set = batch.single_element
-
-    coverage: PrepareGoTestBinaryCoverageConfig | None = None
-    if test_subsystem.use_coverage:
-        coverage = PrepareGoTestBinaryCoverageConfig(
-            coverage_mode=go_test_subsystem.coverage_mode,
-            coverage_packages=go_test_subsystem.coverage_packages,
+) -> Partitions[GoTestFieldSet, GoTestMetadata]:
+    # Coverage data, profiles and test binaries are all extracted from the sandbox per package, so
+    # batching is disabled whenever any of them are requested.
+    can_batch = not _go_test_outputs_are_per_package(test_subsystem, go_test_subsystem)
+
+    partitions = []
+    compatible_tests = defaultdict(list)
+    for field_set in request.field_sets:
+        metadata = GoTestMetadata(
+            extra_env_vars=field_set.extra_env_vars.sorted(),
+            compatibility_tag=field_set.batch_compatibility_tag.value,
         )
 
-    fallible_test_binary = await prepare_go_test_binary(
-        PrepareGoTestBinaryRequest(field_set=field_set, coverage=coverage), **implicitly()
-    )
+        if not can_batch or not metadata.compatibility_tag:
+            partitions.append(Partition((field_set,), metadata))
+        else:
+            compatible_tests[metadata].append(field_set)
 
-    if fallible_test_binary.exit_code != 0:
-        return TestResult(
-            exit_code=fallible_test_binary.exit_code,
-            stdout_bytes=fallible_test_binary.stdout.encode(),
-            stderr_bytes=fallible_test_binary.stderr.encode(),
-            stdout_digest=EMPTY_FILE_DIGEST,
-            stderr_digest=EMPTY_FILE_DIGEST,
-            addresses=(field_set.address,),
-            output_setting=test_subsystem.output,
-            result_metadata=None,
-        )
+    for metadata, field_sets in compatible_tests.items():
+        partitions.append(Partition(tuple(field_sets), metadata))
+
+    return Partitions(partitions)
 
-    test_binary = fallible_test_binary.binary
-    if test_binary is None:
-        return TestResult.no_tests_found(field_set.address, output_setting=test_subsystem.output)
 
+async def _setup_go_test_input_digest(
+    field_set: GoTestFieldSet, test_binary: PrepareGoTestBinaryResult
+) -> Digest:
     # To emulate Go's test runner, we set the working directory to the path of the `go_package`.
     # This allows tests to open dependencies on `file` targets regardless of where they are
     # located. See https://dave.cheney.net/2016/05/10/test-fixtures-in-go.
-    working_dir = field_set.address.spec_path
-    field_set_extra_env, dependencies, binary_with_prefix = await concurrently(
-        environment_vars_subset(
-            EnvironmentVarsRequest(field_set.extra_env_vars.value or ()), **implicitly()
-        ),
+    dependencies, binary_with_prefix = await concurrently(
         resolve_targets(**implicitly(DependenciesRequest(field_set.dependencies))),
-        add_prefix(AddPrefix(test_binary.test_binary_digest, working_dir)),
+        add_prefix(AddPrefix(test_binary.test_binary_digest, field_set.address.spec_path)),
     )
     files_sources = await determine_source_files(
         SourceFilesRequest(
@@ -642,10 +666,15 @@ async def run_go_tests(
             enable_codegen=True,
         )
     )
-    test_input_digest = await merge_digests(
-        MergeDigests((binary_with_prefix, files_sources.snapshot.digest))
-    )
+    return await merge_digests(MergeDigests((binary_with_prefix, files_sources.snapshot.digest)))
 
+
+async def _setup_go_test_env(
+    field_set: GoTestFieldSet, test_extra_env: TestExtraEnv, goroot: GoRoot
+) -> dict[str, str]:
+    field_set_extra_env = await environment_vars_subset(
+        EnvironmentVarsRequest(field_set.extra_env_vars.value or ()), **implicitly()
+    )
     extra_env = {
         **test_extra_env.env,
         # NOTE: field_set_extra_env intentionally after `test_extra_env` to allow overriding within
@@ -660,17 +689,191 @@ async def run_go_tests(
         extra_env["PATH"] = f"{goroot_bin_path}:{extra_env['PATH']}"
     else:
         extra_env["PATH"] = goroot_bin_path
+    return extra_env
 
-    cache_scope = (
-        ProcessCacheScope.PER_SESSION if test_subsystem.force else ProcessCacheScope.SUCCESSFUL
-    )
 
+def _go_test_flags(
+    field_set: GoTestFieldSet, test_subsystem: TestSubsystem, go_test_subsystem: GoTestSubsystem
+) -> tuple[str, ...]:
     test_flags = transform_test_args(
         go_test_subsystem.args,
         field_set.timeout.calculate_from_global_options(test_subsystem),
     )
-
     _ensure_no_profile_options(test_flags)
+    return test_flags
+
+
+def _go_test_cache_scope(test_subsystem: TestSubsystem) -> ProcessCacheScope:
+    return ProcessCacheScope.PER_SESSION if test_subsystem.force else ProcessCacheScope.SUCCESSFUL
+
+
+def generate_batched_go_test_script(
+    test_runs: Sequence[tuple[str, str, Sequence[str]]],
+) -> str:
+    """Generate a bash script that runs several Go test binaries concurrently.
+
+    Each entry of `test_runs` is a `(description, working_directory, argv)` triple. Every binary
+    runs in its own working directory with its output captured to a log file, and the logs are
+    then printed in order so that the output of each package stays contiguous. The script exits
+    with the exit code of the first failing test binary.
+
+    Only bash builtins are used, since `PATH` is restricted to `$GOROOT/bin` for Go tests.
+    """
+    lines = []
+    for i, (_, working_dir, argv) in enumerate(test_runs):
+        lines.append(
+            f"(cd {shlex.quote(working_dir or '.')} && exec {shlex.join(argv)}) "
+            f"> __go_test_{i}.log 2>&1 &"
+        )
+        lines.append(f"pid_{i}=$!")
+    lines.append("exit_code=0")
+    for i, (description, _, _) in enumerate(test_runs):
+        lines.extend(
+            [
+                f'wait "$pid_{i}"',
+                "rc=$?",
+                f'echo {shlex.quote(f"==> {description}")} "(exit code $rc)"',
+                f'echo "$(< __go_test_{i}.log)"',
+                'if [ "$rc" -ne 0 ] && [ "$exit_code" -eq 0 ]; then exit_code=$rc; fi',
+            ]
+        )
+    lines.append('exit "$exit_code"')
+    return "\n".join(lines)
+
+
+async def _run_go_test_batch(
+    batch: GoTestRequest.Batch[GoTestFieldSet, GoTestMetadata],
+    test_subsystem: TestSubsystem,
+    go_test_subsystem: GoTestSubsystem,
+    test_extra_env: TestExtraEnv,
+    goroot: GoRoot,
+    bash: BashBinary,
+) -> TestResult:
+    fallible_test_binaries = await concurrently(
+        prepare_go_test_binary(
+            PrepareGoTestBinaryRequest(field_set=field_set, coverage=None), **implicitly()
+        )
+        for field_set in batch.elements
+    )
+
+    for field_set, fallible_test_binary in zip(batch.elements, fallible_test_binaries):
+        if fallible_test_binary.exit_code != 0:
+            return TestResult(
+                exit_code=fallible_test_binary.exit_code,
+                stdout_bytes=fallible_test_binary.stdout.encode(),
+                stderr_bytes=(
+                    f"Failed to build the Go test binary for {field_set.address}:\n"
+                    f"{fallible_test_binary.stderr}"
+                ).encode(),
+                stdout_digest=EMPTY_FILE_DIGEST,
+                stderr_digest=EMPTY_FILE_DIGEST,
+                addresses=tuple(fs.address for fs in batch.elements),
+                output_setting=test_subsystem.output,
+                result_metadata=None,
+                partition_description=batch.partition_metadata.description,
+            )
+
+    packages_with_tests = [
+        (field_set, fallible_test_binary.binary)
+        for field_set, fallible_test_binary in zip(batch.elements, fallible_test_binaries)
+        if fallible_test_binary.binary is not None
+    ]
+    if not packages_with_tests:
+        return TestResult.no_tests_found_in_batch(batch, output_setting=test_subsystem.output)
+
+    # All packages in a partition share `test_extra_env_vars`, so the environment of the first
+    # package applies to the whole batch.
+    input_digests = await concurrently(
+        _setup_go_test_input_digest(field_set, test_binary)
+        for field_set, test_binary in packages_with_tests
+    )
+    test_input_digest, extra_env = await concurrently(
+        merge_digests(MergeDigests(input_digests)),
+        _setup_go_test_env(batch.elements[0], test_extra_env, goroot),
+    )
+
+    script = generate_batched_go_test_script(
+        [
+            (
+                field_set.address.spec,
+                field_set.address.spec_path,
+                (
+                    test_binary.test_binary_path,
+                    *_go_test_flags(field_set, test_subsystem, go_test_subsystem),
+                ),
+            )
+            for field_set, test_binary in packages_with_tests
+        ]
+    )
+
+    go_test_process = Process(
+        argv=(bash.path, "-c", script),
+        env=extra_env,
+        input_digest=test_input_digest,
+        description=(
+            f"Run Go tests for {pluralize(len(packages_with_tests), 'package')}: "
+            f"{', '.join(field_set.address.spec for field_set, _ in packages_with_tests)}"
+        ),
+        cache_scope=_go_test_cache_scope(test_subsystem),
+        concurrency_available=len(packages_with_tests),
+        level=LogLevel.DEBUG,
+    )
+    results = await execute_process_with_retry(
+        ProcessWithRetries(go_test_process, test_subsystem.attempts_default)
+    )
+    return TestResult.from_batched_fallible_process_result(
+        results.results, batch=batch, output_setting=test_subsystem.output
+    )
+
+
+@rule(desc="Test with Go", level=LogLevel.DEBUG)
+async def run_go_tests(
+    batch: GoTestRequest.Batch[GoTestFieldSet, GoTestMetadata],
+    test_subsystem: TestSubsystem,
+    go_test_subsystem: GoTestSubsystem,
+    test_extra_env: TestExtraEnv,
+    goroot: GoRoot,
+    bash: BashBinary,
+) -> TestResult:
+    if len(batch.elements) > 1:
+        return await _run_go_test_batch(
+            batch, test_subsystem, go_test_subsystem, test_extra_env, goroot, bash
+        )
+
+    field_set = batch.single_element
+
+    coverage: PrepareGoTestBinaryCoverageConfig | None = None
+    if test_subsystem.use_coverage:
+        coverage = PrepareGoTestBinaryCoverageConfig(
+            coverage_mode=go_test_subsystem.coverage_mode,
+            coverage_packages=go_test_subsystem.coverage_packages,
+        )
+
+    fallible_test_binary = await prepare_go_test_binary(
+        PrepareGoTestBinaryRequest(field_set=field_set, coverage=coverage), **implicitly()
+    )
+
+    if fallible_test_binary.exit_code != 0:
+        return TestResult(
+            exit_code=fallible_test_binary.exit_code,
+            stdout_bytes=fallible_test_binary.stdout.encode(),
+            stderr_bytes=fallible_test_binary.stderr.encode(),
+            stdout_digest=EMPTY_FILE_DIGEST,
+            stderr_digest=EMPTY_FILE_DIGEST,
+            addresses=(field_set.address,),
+            output_setting=test_subsystem.output,
+            result_metadata=None,
+        )
+
+    test_binary = fallible_test_binary.binary
+    if test_binary is None:
+        return TestResult.no_tests_found(field_set.address, output_setting=test_subsystem.output)
+
+    test_input_digest, extra_env = await concurrently(
+        _setup_go_test_input_digest(field_set, test_binary),
+        _setup_go_test_env(field_set, test_extra_env, goroot),
+    )
+    test_flags = _go_test_flags(field_set, test_subsystem, go_test_subsystem)
 
     output_files = []
     maybe_profile_args = []
@@ -713,8 +916,8 @@ async def run_go_tests(
         env=extra_env,
         input_digest=test_input_digest,
         description=f"Run Go tests: {field_set.address}",
-        cache_scope=cache_scope,
-        working_directory=working_dir,
+        cache_scope=_go_test_cache_scope(test_subsystem),
+        working_directory=field_set.address.spec_path,
         output_files=output_files,
         level=LogLevel.DEBUG,
     )
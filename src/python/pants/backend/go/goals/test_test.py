@@ -8,7 +8,13 @@ import textwrap
 import pytest
 
 from pants.backend.go import target_type_rules
-from pants.backend.go.goals.test import GoTestFieldSet, GoTestRequest, transform_test_args
+from pants.backend.go.goals.test import (
+    GoTestFieldSet,
+    GoTestMetadata,
+    GoTestRequest,
+    generate_batched_go_test_script,
+    transform_test_args,
+)
 from pants.backend.go.goals.test import rules as test_rules
 from pants.backend.go.target_types import GoModTarget, GoPackageTarget
 from pants.backend.go.util_rules import (
@@ -104,6 +110,33 @@ def test_transform_test_args() -> None:
     )
 
 
+def test_generate_batched_go_test_script() -> None:
+    script = generate_batched_go_test_script(
+        [
+            ("foo", "foo", ("./test_runner", "-test.v")),
+            ("//:root", "", ("./test_runner", "-test.run", "Test Foo")),
+        ]
+    )
+    assert script.splitlines() == [
+        "(cd foo && exec ./test_runner -test.v) > __go_test_0.log 2>&1 &",
+        "pid_0=$!",
+        "(cd . && exec ./test_runner -test.run 'Test Foo') > __go_test_1.log 2>&1 &",
+        "pid_1=$!",
+        "exit_code=0",
+        'wait "$pid_0"',
+        "rc=$?",
+        "echo '==> foo' \"(exit code $rc)\"",
+        'echo "$(< __go_test_0.log)"',
+        'if [ "$rc" -ne 0 ] && [ "$exit_code" -eq 0 ]; then exit_code=$rc; fi',
+        'wait "$pid_1"',
+        "rc=$?",
+        "echo '==> //:root' \"(exit code $rc)\"",
+        'echo "$(< __go_test_1.log)"',
+        'if [ "$rc" -ne 0 ] && [ "$exit_code" -eq 0 ]; then exit_code=$rc; fi',
+        'exit "$exit_code"',
+    ]
+
+
 def test_all_the_tests_are_successful(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -755,3 +788,45 @@ def test_external_test_with_use_coverage(rule_runner: RuleRunner) -> None:
         TestResult, [GoTestRequest.Batch("", (GoTestFieldSet.create(tgt),), None)]
     )
     assert result.exit_code == 0
+
+
+def test_batched_packages(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "foo/BUILD": "go_mod(name='mod')\ngo_package(test_batch_compatibility_tag='go')",
+            "foo/go.mod": "module foo",
+            "foo/add_test.go": textwrap.dedent(
+                """
+                package foo
+                import "testing"
+                func TestAdd(t *testing.T) {
+                  if 2+3 != 5 {
+                    t.Fail()
+                  }
+                }
+                """
+            ),
+            "foo/bar/BUILD": "go_package(test_batch_compatibility_tag='go')",
+            "foo/bar/sub_test.go": textwrap.dedent(
+                """
+                package bar
+                import "testing"
+                func TestSub(t *testing.T) {
+                  t.Fail()
+                }
+                """
+            ),
+        }
+    )
+    field_sets = tuple(
+        GoTestFieldSet.create(rule_runner.get_target(address))
+        for address in (Address("foo"), Address("foo/bar"))
+    )
+    metadata = GoTestMetadata(extra_env_vars=(), compatibility_tag="go")
+    result = rule_runner.request(TestResult, [GoTestRequest.Batch("", field_sets, metadata)])
+    assert result.exit_code == 1
+    assert result.addresses == (Address("foo"), Address("foo/bar"))
+    assert b"==> foo (exit code 0)" in result.stdout_bytes
+    assert b"PASS: TestAdd" in result.stdout_bytes
+    assert b"==> foo/bar (exit code 1)" in result.stdout_bytes
+    assert b"FAIL: TestSub" in result.stdout_bytes
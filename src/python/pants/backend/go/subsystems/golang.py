@@ -272,6 +272,24 @@ class GolangSubsystem(Subsystem):
         advanced=True,
     )
 
+    shared_package_archives = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, provide the compiled archives of a Go package's dependencies to its compile
+            process as immutable inputs, rather than copying them into its sandbox.
+
+            Immutable inputs are stored once, keyed by their digest, in an append-only named
+            cache, and are only symlinked into each sandbox. This greatly reduces the cost of
+            setting up the sandbox to compile a package with many transitive dependencies (such
+            as most of the standard library), which dominates incremental builds.
+
+            This does not change the output of compilation, which remains cached by the compile
+            action's inputs, including the Go compile action ID.
+            """
+        ),
+    )
     asdf_bin_relpath = StrOption(
         default="bin",
         help=softwrap(
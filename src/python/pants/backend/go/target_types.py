@@ -9,7 +9,11 @@ from collections.abc import Iterable, Sequence
 from pants.core.environments.target_types import EnvironmentField
 from pants.core.goals.package import OutputPathField
 from pants.core.goals.run import RestartableField
-from pants.core.goals.test import TestExtraEnvVarsField, TestTimeoutField
+from pants.core.goals.test import (
+    TestExtraEnvVarsField,
+    TestsBatchCompatibilityTagField,
+    TestTimeoutField,
+)
 from pants.engine.addresses import Address
 from pants.engine.target import (
     COMMON_TARGET_FIELDS,
@@ -389,6 +393,27 @@ class GoTestTimeoutField(TestTimeoutField):
     valid_numbers = ValidNumbers.positive_and_zero
 
 
+class GoTestBatchCompatibilityTagField(TestsBatchCompatibilityTagField):
+    alias = "test_batch_compatibility_tag"
+    help = help_text(
+        """
+        An arbitrary value used to mark the tests of this `go_package` as valid for batched
+        execution.
+
+        Each `go_package` is still compiled and linked into its own test binary, but the test
+        binaries of a batch run concurrently within a single sandboxed process instead of one
+        process per package. This saves sandbox setup and process startup for packages with
+        small test suites.
+
+        If this field is left unset, the package's tests always run in a dedicated process.
+        Packages with the same value _may_ be batched together, subject to the
+        `[test].batch_size` option and to having the same `test_extra_env_vars`. Packages are
+        never batched when running with `--test-use-coverage`, with Go profiling enabled, or
+        with `[go-test].output_test_binary`, since those outputs are collected per package.
+        """
+    )
+
+
 class GoPackageTarget(Target):
     alias = "go_package"
     core_fields = (
@@ -397,6 +422,7 @@ class GoPackageTarget(Target):
         GoPackageSourcesField,
         GoTestExtraEnvVarsField,
         GoTestTimeoutField,
+        GoTestBatchCompatibilityTagField,
         GoTestRaceDetectorEnabledField,
         GoTestMemorySanitizerEnabledField,
         GoTestAddressSanitizerEnabledField,
@@ -10,6 +10,7 @@ from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import PurePath
 
+from pants.backend.go.subsystems.golang import GolangSubsystem
 from pants.backend.go.util_rules import cgo, coverage
 from pants.backend.go.util_rules.assembly import (
     AssembleGoAssemblyFilesRequest,
@@ -302,6 +303,9 @@ class BuiltGoPackage:
     digest: Digest
     import_paths_to_pkg_a_files: FrozenDict[str, str]
     coverage_metadata: BuiltGoPackageCodeCoverageMetadata | None = None
+    # The digest of each package's own `__pkg__.a` file (without the `__pkgs__` prefix), which
+    # allows each archive to be provided to dependents separately.
+    import_paths_to_pkg_a_digests: FrozenDict[str, Digest] = FrozenDict()
 
 
 @dataclass(frozen=True)
@@ -572,13 +576,15 @@ async def _gather_transitive_prebuilt_object_files(
 # (triggered by `FallibleBuiltGoPackage` subclassing `EngineAwareReturnType`).
 @rule(desc="Compile with Go", level=LogLevel.DEBUG)
 async def build_go_package(
-    request: BuildGoPackageRequest, go_root: GoRoot
+    request: BuildGoPackageRequest, go_root: GoRoot, golang: GolangSubsystem
 ) -> FallibleBuiltGoPackage:
     maybe_built_deps = await concurrently(
-        build_go_package(build_request, go_root) for build_request in request.direct_dependencies
+        build_go_package(build_request, go_root, golang)
+        for build_request in request.direct_dependencies
     )
 
     import_paths_to_pkg_a_files: dict[str, str] = {}
+    import_paths_to_pkg_a_digests: dict[str, Digest] = {}
     dep_digests = []
     for maybe_dep in maybe_built_deps:
         if maybe_dep.output is None:
@@ -589,6 +595,10 @@ async def build_go_package(
         for dep_import_path, pkg_archive_path in dep.import_paths_to_pkg_a_files.items():
             if dep_import_path not in import_paths_to_pkg_a_files:
                 import_paths_to_pkg_a_files[dep_import_path] = pkg_archive_path
+                if dep_import_path in dep.import_paths_to_pkg_a_digests:
+                    import_paths_to_pkg_a_digests[dep_import_path] = (
+                        dep.import_paths_to_pkg_a_digests[dep_import_path]
+                    )
                 dep_digests.append(dep.digest)
 
     merged_deps_digest, import_config, embedcfg, action_id_result = await concurrently(
@@ -605,12 +615,24 @@ async def build_go_package(
     )
 
     unmerged_input_digests = [
-        merged_deps_digest,
         import_config.digest,
         embedcfg.digest,
         request.digest,
     ]
 
+    # The compiled archives of dependencies are only needed to compile the Go sources, and are
+    # either provided to that process as immutable inputs, or merged into every input digest.
+    compile_immutable_input_digests: dict[str, Digest] = {}
+    if golang.shared_package_archives and len(import_paths_to_pkg_a_digests) == len(
+        import_paths_to_pkg_a_files
+    ):
+        compile_immutable_input_digests = {
+            os.path.dirname(import_paths_to_pkg_a_files[import_path]): pkg_a_digest
+            for import_path, pkg_a_digest in import_paths_to_pkg_a_digests.items()
+        }
+    else:
+        unmerged_input_digests.insert(0, merged_deps_digest)
+
     # If coverage is enabled for this package, then replace the Go source files with versions modified to
     # contain coverage code.
     go_files = request.go_files
@@ -895,6 +917,7 @@ async def build_go_package(
                 output_files=("__pkg__.a", *([asm_header_path] if asm_header_path else [])),
                 env={"__PANTS_GO_COMPILE_ACTION_ID": action_id_result.action_id},
                 replace_sandbox_root_in_args=True,
+                immutable_input_digests=compile_immutable_input_digests,
             )
         )
     )
@@ -967,6 +990,7 @@ async def build_go_package(
 
     path_prefix = os.path.join("__pkgs__", path_safe(request.import_path))
     import_paths_to_pkg_a_files[request.import_path] = os.path.join(path_prefix, "__pkg__.a")
+    import_paths_to_pkg_a_digests[request.import_path] = compilation_digest
     output_digest = await add_prefix(AddPrefix(compilation_digest, path_prefix))
     merged_result_digest = await merge_digests(MergeDigests([*dep_digests, output_digest]))
 
@@ -993,6 +1017,7 @@ async def build_go_package(
         digest=merged_result_digest,
         import_paths_to_pkg_a_files=FrozenDict(import_paths_to_pkg_a_files),
         coverage_metadata=coverage_metadata,
+        import_paths_to_pkg_a_digests=FrozenDict(import_paths_to_pkg_a_digests),
     )
     return FallibleBuiltGoPackage(output, request.import_path)
 
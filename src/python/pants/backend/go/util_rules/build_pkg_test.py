@@ -64,10 +64,15 @@ def assert_built(
         for import_path in expected_import_paths
     }
     assert dict(built_package.import_paths_to_pkg_a_files) == expected
+    assert set(built_package.import_paths_to_pkg_a_digests) == set(expected)
     assert sorted(result_files) == sorted(expected.values())
 
 
-def test_build_pkg(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("shared_package_archives", [False, True])
+def test_build_pkg(rule_runner: RuleRunner, shared_package_archives: bool) -> None:
+    rule_runner.set_options(
+        [f"--golang-shared-package-archives={shared_package_archives}"], env_inherit={"PATH"}
+    )
     transitive_dep = BuildGoPackageRequest(
         import_path="example.com/foo/dep/transitive",
         pkg_name="transitive",
@@ -37,6 +37,8 @@ class GoSdkProcess:
     output_files: tuple[str, ...]
     output_directories: tuple[str, ...]
     replace_sandbox_root_in_args: bool
+    immutable_input_digests: FrozenDict[str, Digest]
+    use_shared_module_cache: bool
 
     def __init__(
         self,
@@ -50,6 +52,8 @@ class GoSdkProcess:
         output_directories: Iterable[str] = (),
         allow_downloads: bool = False,
         replace_sandbox_root_in_args: bool = False,
+        immutable_input_digests: Mapping[str, Digest] | None = None,
+        use_shared_module_cache: bool = False,
     ) -> None:
         object.__setattr__(self, "command", tuple(command))
         object.__setattr__(self, "description", description)
@@ -67,6 +71,14 @@ class GoSdkProcess:
         object.__setattr__(self, "output_files", tuple(output_files))
         object.__setattr__(self, "output_directories", tuple(output_directories))
         object.__setattr__(self, "replace_sandbox_root_in_args", replace_sandbox_root_in_args)
+        object.__setattr__(
+            self, "immutable_input_digests", FrozenDict(immutable_input_digests or {})
+        )
+        object.__setattr__(self, "use_shared_module_cache", use_shared_module_cache)
+
+
+_SHARED_MODULE_CACHE_NAME = "go_mod_cache"
+_SHARED_MODULE_CACHE_PATH = ".cache/go_mod_cache"
 
 
 @dataclass(frozen=True)
@@ -76,6 +88,7 @@ class GoSdkRunSetup:
 
     CHDIR_ENV = "__PANTS_CHDIR_TO"
     SANDBOX_ROOT_ENV = "__PANTS_REPLACE_SANDBOX_ROOT"
+    MODULE_CACHE_ENV = "__PANTS_GOMODCACHE"
 
 
 @rule
@@ -92,6 +105,9 @@ async def go_sdk_invoke_setup(goroot: GoRoot) -> GoSdkRunSetup:
             export GOPATH="${{sandbox_root}}/gopath"
             export GOCACHE="${{sandbox_root}}/cache"
             /bin/mkdir -p "$GOPATH" "$GOCACHE"
+            if [ -n "${GoSdkRunSetup.MODULE_CACHE_ENV}" ]; then
+              export GOMODCACHE="${{sandbox_root}}/${GoSdkRunSetup.MODULE_CACHE_ENV}"
+            fi
             if [ -n "${GoSdkRunSetup.CHDIR_ENV}" ]; then
               cd "${GoSdkRunSetup.CHDIR_ENV}"
             fi
@@ -136,7 +152,7 @@ async def setup_go_sdk_process(
         "__PANTS_GO_SDK_CACHE_KEY": f"{goroot.full_version}/{goroot.goos}/{goroot.goarch}",
     }
 
-    immutable_input_digests: dict[str, Digest] = {}
+    immutable_input_digests: dict[str, Digest] = dict(request.immutable_input_digests)
 
     # Add path to additional tools, such as git, that may be needed by the go tool
     if golang_env_aware.extra_tools:
@@ -158,6 +174,15 @@ async def setup_go_sdk_process(
     if request.replace_sandbox_root_in_args:
         env[GoSdkRunSetup.SANDBOX_ROOT_ENV] = "1"
 
+    # Module downloads which are not captured as outputs may share a module cache across runs.
+    # Go verifies every module in the cache against `go.sum`, so sharing it is safe. The cache is
+    # made writable so that it can be cleaned like any other named cache.
+    append_only_caches: dict[str, str] = {}
+    if request.use_shared_module_cache:
+        append_only_caches[_SHARED_MODULE_CACHE_NAME] = _SHARED_MODULE_CACHE_PATH
+        env[GoSdkRunSetup.MODULE_CACHE_ENV] = _SHARED_MODULE_CACHE_PATH
+        env["GOFLAGS"] = " ".join((*env.get("GOFLAGS", "").split(), "-modcacherw"))
+
     # Disable the "coverage redesign" experiment on Go v1.20+ for now since Pants does not yet support it.
     if goroot.is_compatible_version("1.20") and not goroot.is_compatible_version("1.25"):
         exp_str = env.get("GOEXPERIMENT", "")
@@ -171,6 +196,7 @@ async def setup_go_sdk_process(
         argv=[bash.path, go_sdk_run.script.path, *request.command],
         env=env,
         immutable_input_digests=immutable_input_digests,
+        append_only_caches=append_only_caches,
         input_digest=input_digest,
         description=request.description,
         output_files=request.output_files,
@@ -153,14 +153,14 @@ class ModuleDescriptor:
 @dataclass(frozen=True)
 class ModuleDescriptors:
     modules: FrozenOrderedSet[ModuleDescriptor]
-    go_mods_digest: Digest
 
 
 @dataclass(frozen=True)
 class AnalyzeThirdPartyModuleRequest:
     go_mod_address: Address
-    go_mod_digest: Digest
-    go_mod_path: str
+    # Only the `go.sum` lines for this module version, so that downloading and analyzing the
+    # module is cached by its version, rather than by the contents of the whole `go.sum`.
+    module_go_sum: bytes
     import_path: str
     name: str
     version: str
@@ -216,17 +216,18 @@ async def analyze_module_dependencies(request: ModuleDescriptorsRequest) -> Modu
             GoSdkProcess(
                 command=["list", "-mod=readonly", "-e", "-m", "-json", "all"],
                 input_digest=request.digest,
-                output_directories=("gopath",),
                 working_dir=request.path if request.path else None,
-                # Allow downloads of the module metadata (i.e., go.mod files).
+                # Allow downloads of the module metadata (i.e., go.mod files), which are kept
+                # across runs, so that a change to `go.mod` need not download them all again.
                 allow_downloads=True,
+                use_shared_module_cache=True,
                 description="Analyze Go module dependencies.",
             )
         )
     )
 
     if len(mod_list_result.stdout) == 0:
-        return ModuleDescriptors(FrozenOrderedSet(), EMPTY_DIGEST)
+        return ModuleDescriptors(FrozenOrderedSet())
 
     descriptors: dict[tuple[str, str], ModuleDescriptor] = {}
 
@@ -260,7 +261,7 @@ async def analyze_module_dependencies(request: ModuleDescriptorsRequest) -> Modu
     # Gazelle does this, mainly to store the sum on the go_repository rule. We could store it (or its
     # absence) to be able to download sums automatically.
 
-    return ModuleDescriptors(FrozenOrderedSet(descriptors.values()), mod_list_result.output_digest)
+    return ModuleDescriptors(FrozenOrderedSet(descriptors.values()))
 
 
 def strip_sandbox_prefix(path: str, marker: str) -> str:
@@ -471,22 +472,44 @@ async def analyze_go_third_party_package(
     )
 
 
+def _module_go_sum(go_sum: bytes, name: str, version: str) -> bytes:
+    """Return the lines of a `go.sum` file which verify the given module version."""
+    prefixes = (f"{name} {version} ".encode(), f"{name} {version}/go.mod ".encode())
+    return b"".join(line for line in go_sum.splitlines(keepends=True) if line.startswith(prefixes))
+
+
+# The module in which modules are downloaded. It exists only to hold the `go.sum` lines which
+# verify the download.
+_DOWNLOAD_MODULE_DIR = "__download"
+
+
 @rule
 async def analyze_go_third_party_module(
     request: AnalyzeThirdPartyModuleRequest,
     analyzer: PackageAnalyzerSetup,
 ) -> AnalyzedThirdPartyModule:
+    download_module_digest = await create_digest(
+        CreateDigest(
+            [
+                FileContent(
+                    os.path.join(_DOWNLOAD_MODULE_DIR, "go.mod"), b"module __pants_download__\n"
+                ),
+                FileContent(os.path.join(_DOWNLOAD_MODULE_DIR, "go.sum"), request.module_go_sum),
+            ]
+        )
+    )
+
     # Download the module.
     download_result = await fallible_to_exec_result_or_raise(
         **implicitly(
             GoSdkProcess(
                 ("mod", "download", "-json", f"{request.name}@{request.version}"),
-                input_digest=request.go_mod_digest,  # for go.sum
-                working_dir=os.path.dirname(request.go_mod_path),
+                input_digest=download_module_digest,  # for go.sum
+                working_dir=_DOWNLOAD_MODULE_DIR,
                 # Allow downloads of the module sources.
                 allow_downloads=True,
                 output_directories=("gopath",),
-                output_files=(os.path.join(os.path.dirname(request.go_mod_path), "go.sum"),),
+                output_files=(os.path.join(_DOWNLOAD_MODULE_DIR, "go.sum"),),
                 description=f"Download Go module {request.name}@{request.version}.",
             )
         )
@@ -499,9 +522,9 @@ async def analyze_go_third_party_module(
 
     # Make sure go.sum has not changed.
     await _check_go_sum_has_not_changed(
-        input_digest=request.go_mod_digest,
+        input_digest=download_module_digest,
         output_digest=download_result.output_digest,
-        dir_path=os.path.dirname(request.go_mod_path),
+        dir_path=_DOWNLOAD_MODULE_DIR,
         import_path=request.import_path,
         go_mod_address=request.go_mod_address,
     )
@@ -588,19 +611,23 @@ async def analyze_go_third_party_module(
 async def download_and_analyze_third_party_packages(
     request: AllThirdPartyPackagesRequest,
 ) -> AllThirdPartyPackages:
-    module_analysis = await analyze_module_dependencies(
-        ModuleDescriptorsRequest(
-            digest=request.go_mod_digest,
-            path=os.path.dirname(request.go_mod_path),
-        )
+    module_analysis, go_mod_contents = await concurrently(
+        analyze_module_dependencies(
+            ModuleDescriptorsRequest(
+                digest=request.go_mod_digest,
+                path=os.path.dirname(request.go_mod_path),
+            )
+        ),
+        get_digest_contents(request.go_mod_digest),
     )
+    go_sum_path = os.path.join(os.path.dirname(request.go_mod_path), "go.sum")
+    go_sum = next((entry.content for entry in go_mod_contents if entry.path == go_sum_path), b"")
 
     analyzed_modules = await concurrently(
         analyze_go_third_party_module(
             AnalyzeThirdPartyModuleRequest(
                 go_mod_address=request.go_mod_address,
-                go_mod_digest=request.go_mod_digest,
-                go_mod_path=request.go_mod_path,
+                module_go_sum=_module_go_sum(go_sum, mod.name, mod.version),
                 import_path=mod.name,
                 name=mod.name,
                 version=mod.version,
@@ -30,6 +30,7 @@ from pants.backend.go.util_rules.third_party_pkg import (
     ModuleDescriptorsRequest,
     ThirdPartyPkgAnalysis,
     ThirdPartyPkgAnalysisRequest,
+    _module_go_sum,
 )
 from pants.build_graph.address import Address
 from pants.engine.fs import Digest, Snapshot
@@ -260,6 +261,25 @@ def test_download_and_analyze_all_packages(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_module_go_sum() -> None:
+    go_sum = dedent(
+        """\
+        github.com/google/uuid v1.2.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        github.com/google/uuid v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=
+        github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        github.com/google/uuid/v2 v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=
+        """
+    ).encode()
+    expected = dedent(
+        """\
+        github.com/google/uuid v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=
+        github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        """
+    ).encode()
+    assert _module_go_sum(go_sum, "github.com/google/uuid", "v1.3.0") == expected
+    assert _module_go_sum(go_sum, "github.com/google/uuid", "v1.4.0") == b""
+
+
 def test_invalid_go_sum(rule_runner: RuleRunner) -> None:
     digest = set_up_go_mod(
         rule_runner,
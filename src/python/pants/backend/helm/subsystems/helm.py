@@ -174,6 +174,22 @@ class HelmSubsystem(TemplatedExternalTool):
         help="If true, add `helm_unittest_tests` targets with the `tailor` goal.",
         advanced=True,
     )
+    cache_post_rendered_output = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, cache the rendered output of `helm_deployment` targets which use a
+            post-renderer like any other process result, keyed by the digests of the chart, the
+            value files and the post-renderer inputs.
+
+            By default, that output is only cached in memory, because post-renderers may add
+            secrets or other sensitive values to the rendered manifests, which should not be
+            stored on disk or in a remote cache. Enable this when that is not the case, so that
+            repeated runs only render those deployments whose inputs changed.
+            """
+        ),
+        advanced=True,
+    )
 
     args = ArgsListOption(
         example="--force",
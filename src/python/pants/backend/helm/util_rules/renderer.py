@@ -15,6 +15,7 @@ from itertools import chain
 from typing import Any
 
 from pants.backend.helm.subsystems import post_renderer
+from pants.backend.helm.subsystems.helm import HelmSubsystem
 from pants.backend.helm.subsystems.post_renderer import HelmPostRenderer
 from pants.backend.helm.target_types import (
     HelmChartFieldSet,
@@ -38,15 +39,13 @@ from pants.engine.fs import (
     EMPTY_SNAPSHOT,
     CreateDigest,
     Digest,
-    DigestSubset,
     Directory,
     FileContent,
     MergeDigests,
-    PathGlobs,
     RemovePrefix,
     Snapshot,
 )
-from pants.engine.internals.native_engine import FileDigest
+from pants.engine.internals.native_engine import FileDigest, FilespecMatcher
 from pants.engine.intrinsics import create_digest, digest_to_snapshot, merge_digests
 from pants.engine.process import (
     InteractiveProcess,
@@ -206,7 +205,7 @@ class RenderedHelmFiles(EngineAwareReturnType):
         return not self.post_processed
 
 
-async def _sort_value_file_names_for_evaluation(
+def _sort_value_file_names_for_evaluation(
     address: Address,
     *,
     sources_field: HelmDeploymentSourcesField,
@@ -223,19 +222,20 @@ async def _sort_value_file_names_for_evaluation(
         result = list(value_files_snapshot.files)
         result.sort()
     else:
-        # Break the list of filenames in subsets that follow the order given in the `sources` field
-        subset_snapshots = await concurrently(
-            digest_to_snapshot(
-                **implicitly(
-                    DigestSubset(
-                        value_files_snapshot.digest,
-                        PathGlobs([os.path.join(base_path, glob_pattern)]),
-                    )
+        # Break the list of filenames in subsets that follow the order given in the `sources`
+        # field. The files are matched in memory, as there may be hundreds of deployments.
+        sources_subsets = [
+            (
+                set()
+                if glob_pattern.startswith("!")
+                else set(
+                    FilespecMatcher(
+                        includes=[os.path.join(base_path, glob_pattern)], excludes=[]
+                    ).matches(value_files_snapshot.files)
                 )
             )
             for glob_pattern in sources_field.globs
-        )
-        sources_subsets = [set(snapshot.files) for snapshot in subset_snapshots]
+        ]
 
         def minimise_and_sort_subset(input_subset: set[str]) -> list[str]:
             result: set[str] = input_subset
@@ -268,9 +268,11 @@ async def _sort_value_file_names_for_evaluation(
 
 @rule(desc="Prepare Helm deployment renderer")
 async def setup_render_helm_deployment_process(
-    request: HelmDeploymentRequest,
+    request: HelmDeploymentRequest, helm_subsystem: HelmSubsystem
 ) -> _HelmDeploymentProcessWrapper:
     value_files_prefix = "__values"
+    # The chart, including the digests of its subcharts, is memoized per `helm_chart` target, so
+    # it is shared by all the deployments of the same chart.
     chart, value_files = await concurrently(
         find_chart_for_deployment(FindHelmDeploymentChart(request.field_set)),
         determine_source_files(
@@ -293,7 +295,7 @@ async def setup_render_helm_deployment_process(
         output_directories = [output_dir]
 
     # Sort the list of file names following a consistent ordering
-    sorted_value_files = await _sort_value_file_names_for_evaluation(
+    sorted_value_files = _sort_value_file_names_for_evaluation(
         request.field_set.address,
         sources_field=request.field_set.sources,
         value_files_snapshot=value_files.snapshot,
@@ -332,10 +334,11 @@ async def setup_render_helm_deployment_process(
 
     # If using a post-renderer we are only going to keep the process result cached in
     # memory to prevent storing in disk, either locally or remotely, secrets or other
-    # sensitive values that may have been added in by the post-renderer.
+    # sensitive values that may have been added in by the post-renderer, unless the user
+    # has opted in to caching them.
     process_cache = (
         ProcessCacheScope.PER_RESTART_SUCCESSFUL
-        if request.post_renderer
+        if request.post_renderer and not helm_subsystem.cache_post_rendered_output
         else ProcessCacheScope.SUCCESSFUL
     )
 
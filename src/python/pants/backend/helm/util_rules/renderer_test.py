@@ -8,6 +8,7 @@ from textwrap import dedent
 import pytest
 import yaml
 
+from pants.backend.helm.subsystems.post_renderer import HelmPostRenderer
 from pants.backend.helm.target_types import (
     HelmChartFieldSet,
     HelmChartTarget,
@@ -21,11 +22,13 @@ from pants.backend.helm.util_rules.renderer import (
     HelmDeploymentRequest,
     RenderedHelmFiles,
     RenderHelmChartRequest,
+    _HelmDeploymentProcessWrapper,
 )
 from pants.backend.helm.util_rules.testutil import _read_file_from_digest
 from pants.core.util_rules import external_tool, source_files
 from pants.engine.addresses import Address
-from pants.engine.process import InteractiveProcess
+from pants.engine.fs import EMPTY_DIGEST
+from pants.engine.process import InteractiveProcess, ProcessCacheScope
 from pants.engine.rules import QueryRule
 from pants.engine.target import Target
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, RuleRunner
@@ -42,6 +45,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(InteractiveProcess, (HelmDeploymentRequest,)),
             QueryRule(RenderedHelmFiles, (HelmDeploymentRequest,)),
             QueryRule(RenderedHelmFiles, (RenderHelmChartRequest,)),
+            QueryRule(_HelmDeploymentProcessWrapper, (HelmDeploymentRequest,)),
         ],
     )
     source_root_patterns = ("src/*",)
@@ -197,6 +201,50 @@ def test_renders_files(rule_runner: RuleRunner) -> None:
     assert template_output == _DEFAULT_CONFIG_MAP
 
 
+@pytest.mark.parametrize(
+    "use_post_renderer, cache_post_rendered_output, expected_cache_scope",
+    [
+        (False, False, ProcessCacheScope.SUCCESSFUL),
+        (False, True, ProcessCacheScope.SUCCESSFUL),
+        (True, False, ProcessCacheScope.PER_RESTART_SUCCESSFUL),
+        (True, True, ProcessCacheScope.SUCCESSFUL),
+    ],
+)
+def test_post_rendered_output_cache_scope(
+    rule_runner: RuleRunner,
+    use_post_renderer: bool,
+    cache_post_rendered_output: bool,
+    expected_cache_scope: ProcessCacheScope,
+) -> None:
+    rule_runner.write_files(
+        {
+            **_COMMON_WORKSPACE_FILES,
+            "src/deployment/BUILD": "helm_deployment(name='foo', chart='//src/mychart')",
+        }
+    )
+    rule_runner.set_options(
+        [
+            "--source-root-patterns=['src/*']",
+            f"--helm-cache-post-rendered-output={cache_post_rendered_output}",
+        ],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+
+    tgt = rule_runner.get_target(Address("src/deployment", target_name="foo"))
+    post_renderer = HelmPostRenderer(
+        exe="post_renderer.sh", digest=EMPTY_DIGEST, description_of_origin="the test"
+    )
+    render_request = HelmDeploymentRequest(
+        cmd=HelmDeploymentCmd.RENDER,
+        field_set=HelmDeploymentFieldSet.create(tgt),
+        description="Test template rendering",
+        post_renderer=post_renderer if use_post_renderer else None,
+    )
+
+    process_wrapper = rule_runner.request(_HelmDeploymentProcessWrapper, [render_request])
+    assert process_wrapper.process.cache_scope == expected_cache_scope
+
+
 def test_renders_files_using_deployment_values(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -2,7 +2,8 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 from pants.jvm.resolve.jvm_tool import JvmToolBase
-from pants.option.option_types import ArgsListOption, SkipOption
+from pants.option.option_types import ArgsListOption, IntOption, SkipOption, StrOption
+from pants.util.strutil import softwrap
 
 
 class JUnit(JvmToolBase):
@@ -21,3 +22,40 @@ class JUnit(JvmToolBase):
     args = ArgsListOption(example="--disable-ansi-colors", passthrough=True)
 
     skip = SkipOption("test")
+
+    shards = IntOption(
+        default=1,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum number of parallel JVM processes to split the test classes of each
+            JUnit test target across.
+
+            Test classes are assigned to shards so that the total duration of each shard is
+            balanced, using the per-class durations recorded in the JUnit XML reports under
+            `[junit].shard_reports_dir`. Test classes which do not appear in those reports all
+            run in the same shard. The results of all shards are merged into a single result
+            for the target.
+
+            Has no effect unless `[junit].shard_reports_dir` is set.
+            """
+        ),
+    )
+    shard_reports_dir = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            A directory, relative to the build root, containing the JUnit XML reports of a
+            previous run, as written by `[test].report`. These are used to balance the test
+            classes of a target across `[junit].shards`.
+
+            Note that `[test].report_dir` is usually ignored by Pants, so the reports must
+            be copied elsewhere (for example, by a CI job which downloads the reports of its
+            last successful run).
+
+            Updating the reports can move test classes to other shards, and the shards whose
+            classes changed run again rather than being read from the cache.
+            """
+        ),
+    )
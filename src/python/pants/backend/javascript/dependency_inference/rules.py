@@ -46,10 +46,18 @@ from pants.engine.internals.graph import (
     hydrate_sources,
     resolve_targets,
 )
-from pants.engine.internals.native_dep_inference import ParsedJavascriptDependencyCandidate
+from pants.engine.internals.native_dep_inference import (
+    NativeParsedJavascriptDependenciesBatch,
+    ParsedJavascriptDependencyCandidate,
+)
 from pants.engine.internals.native_engine import InferenceMetadata, NativeDependenciesRequest
 from pants.engine.internals.selectors import concurrently
-from pants.engine.intrinsics import parse_javascript_deps, path_globs_to_paths
+from pants.engine.intrinsics import (
+    parse_javascript_deps,
+    parse_javascript_deps_batch,
+    path_globs_to_digest,
+    path_globs_to_paths,
+)
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.target import (
     FieldSet,
@@ -60,11 +68,16 @@ from pants.engine.target import (
 from pants.engine.unions import UnionRule
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
+from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import bullet_list, softwrap
 
 logger = logging.getLogger(__name__)
 
+_JS_RUNTIME_FILE_EXTENSIONS = (
+    JS_FILE_EXTENSIONS + JSX_FILE_EXTENSIONS + TS_FILE_EXTENSIONS + TSX_FILE_EXTENSIONS
+)
+
 
 @dataclass(frozen=True)
 class NodePackageInferenceFieldSet(FieldSet):
@@ -162,6 +175,28 @@ async def _prepare_inference_metadata(address: Address, file_path: str) -> Infer
     )
 
 
+@dataclass(frozen=True)
+class ParseJSImportsInDirectoryRequest:
+    directory: str
+    metadata: InferenceMetadata
+
+
+@rule(desc="Parse Javascript imports", level=LogLevel.DEBUG)
+async def parse_js_imports_in_directory(
+    request: ParseJSImportsInDirectoryRequest,
+) -> NativeParsedJavascriptDependenciesBatch:
+    """Parse the imports of all Javascript and Typescript files in a directory in one call.
+
+    Files in the same directory share their inference metadata, so this is memoized once per
+    directory rather than once per file, while the parse results themselves are still cached per
+    file content.
+    """
+    digest = await path_globs_to_digest(
+        PathGlobs(os.path.join(request.directory, f"*{ext}") for ext in _JS_RUNTIME_FILE_EXTENSIONS)
+    )
+    return await parse_javascript_deps_batch(NativeDependenciesRequest(digest, request.metadata))
+
+
 def _add_extensions(file_imports: frozenset[str], file_extensions: tuple[str, ...]) -> PathGlobs:
     extensions = file_extensions + tuple(f"/index{ext}" for ext in file_extensions)
     valid_file_extensions = set(file_extensions)
@@ -252,17 +287,27 @@ async def infer_js_source_dependencies(
     if not nodejs_infer.imports:
         return InferredDependencies(())
 
-    sources = await hydrate_sources(
-        HydrateSourcesRequest(source, for_sources_types=[JSRuntimeSourceField]), **implicitly()
-    )
     metadata = await _prepare_inference_metadata(request.field_set.address, source.file_path)
 
-    import_strings, candidate_pkgs = await concurrently(
-        parse_javascript_deps(NativeDependenciesRequest(sources.snapshot.digest, metadata)),
+    parsed_directory, candidate_pkgs = await concurrently(
+        parse_js_imports_in_directory(
+            ParseJSImportsInDirectoryRequest(os.path.dirname(source.file_path), metadata)
+        ),
         map_candidate_node_packages(
             RequestNodePackagesCandidateMap(request.field_set.address), **implicitly()
         ),
     )
+    import_strings = parsed_directory.files.get(source.file_path)
+    if import_strings is None:
+        # The source is not a plain file in the workspace (e.g. it was generated), so parse it on
+        # its own.
+        sources = await hydrate_sources(
+            HydrateSourcesRequest(source, for_sources_types=[JSRuntimeSourceField]),
+            **implicitly(),
+        )
+        import_strings = await parse_javascript_deps(
+            NativeDependenciesRequest(sources.snapshot.digest, metadata)
+        )
     imports = dict(
         zip(
             import_strings.imports,
@@ -270,12 +315,7 @@ async def infer_js_source_dependencies(
                 _determine_import_from_candidates(
                     candidates,
                     candidate_pkgs,
-                    file_extensions=(
-                        JS_FILE_EXTENSIONS
-                        + JSX_FILE_EXTENSIONS
-                        + TS_FILE_EXTENSIONS
-                        + TSX_FILE_EXTENSIONS
-                    ),
+                    file_extensions=_JS_RUNTIME_FILE_EXTENSIONS,
                 )
                 for string, candidates in import_strings.imports.items()
             ),
@@ -13,6 +13,7 @@ from pants.backend.javascript.dependency_inference.rules import (
     InferNodePackageDependenciesRequest,
     JSSourceInferenceFieldSet,
     NodePackageInferenceFieldSet,
+    ParseJSImportsInDirectoryRequest,
 )
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
 from pants.backend.javascript.package_json import AllPackageJson
@@ -26,6 +27,8 @@ from pants.backend.typescript.target_types import (
 from pants.build_graph.address import Address
 from pants.core.util_rules.unowned_dependency_behavior import UnownedDependencyError
 from pants.engine.internals.graph import Owners, OwnersRequest
+from pants.engine.internals.native_dep_inference import NativeParsedJavascriptDependenciesBatch
+from pants.engine.internals.native_engine import InferenceMetadata
 from pants.engine.rules import QueryRule
 from pants.engine.target import InferredDependencies, Target
 from pants.testutil.rule_runner import RuleRunner, engine_error
@@ -41,6 +44,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(Owners, (OwnersRequest,)),
             QueryRule(InferredDependencies, (InferNodePackageDependenciesRequest,)),
             QueryRule(InferredDependencies, (InferJSDependenciesRequest,)),
+            QueryRule(NativeParsedJavascriptDependenciesBatch, (ParseJSImportsInDirectoryRequest,)),
         ],
         target_types=[
             *package_json.target_types(),
@@ -125,6 +129,31 @@ def test_infers_esmodule_js_dependencies(rule_runner: RuleRunner) -> None:
     }
 
 
+def test_parses_all_js_files_in_directory(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/index.mjs": 'import { x } from "./moduleA.jsx";',
+            "src/js/moduleA.jsx": 'import React from "react";',
+            "src/js/moduleB.ts": 'import { y } from "../lib/moduleC.ts";',
+            "src/js/README.md": "",
+            "src/js/nested/moduleD.tsx": "",
+        }
+    )
+    batch = rule_runner.request(
+        NativeParsedJavascriptDependenciesBatch,
+        [
+            ParseJSImportsInDirectoryRequest(
+                "src/js", InferenceMetadata.javascript("src/js", {}, None, {})
+            )
+        ],
+    )
+
+    assert set(batch.files) == {"src/js/index.mjs", "src/js/moduleA.jsx", "src/js/moduleB.ts"}
+    assert batch.files["src/js/index.mjs"].file_imports == {"src/js/moduleA.jsx"}
+    assert batch.files["src/js/moduleA.jsx"].package_imports == {"react"}
+    assert batch.files["src/js/moduleB.ts"].file_imports == {"src/lib/moduleC.ts"}
+
+
 def test_infers_esmodule_js_dependencies_from_ancestor_files(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
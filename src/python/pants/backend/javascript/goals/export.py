@@ -50,7 +50,8 @@ async def export_node_modules_for_resolve(
         return MaybeExportResult(None)
 
     installation = await install_node_packages_for_address(
-        InstalledNodePackageRequest(requested_resolve.address), **implicitly()
+        InstalledNodePackageRequest(requested_resolve.address, allow_shared_node_modules=False),
+        **implicitly(),
     )
 
     return MaybeExportResult(
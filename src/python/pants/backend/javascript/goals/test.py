@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import dataclasses
+import logging
+import os
+import xml.etree.ElementTree as ET
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import PurePath
 
@@ -48,22 +51,31 @@ from pants.core.util_rules import source_files
 from pants.core.util_rules.distdir import DistDir
 from pants.core.util_rules.env_vars import environment_vars_subset
 from pants.core.util_rules.partitions import Partition, PartitionerType, Partitions
+from pants.core.util_rules.shard_balancing import balance_by_duration, junit_xml_durations
 from pants.core.util_rules.source_files import SourceFilesRequest, determine_source_files
 from pants.engine.env_vars import EnvironmentVarsRequest
-from pants.engine.fs import DigestSubset, GlobExpansionConjunction
+from pants.engine.fs import DigestSubset, FileContent, GlobExpansionConjunction, PathGlobs
 from pants.engine.internals import graph, platform_rules
 from pants.engine.internals.graph import transitive_targets
 from pants.engine.internals.native_engine import MergeDigests, Snapshot
 from pants.engine.internals.selectors import concurrently
-from pants.engine.intrinsics import digest_to_snapshot, execute_process_with_retry, merge_digests
-from pants.engine.process import ProcessCacheScope, ProcessWithRetries
+from pants.engine.intrinsics import (
+    digest_to_snapshot,
+    execute_process_with_retry,
+    get_digest_contents,
+    merge_digests,
+    path_globs_to_digest,
+)
+from pants.engine.process import ProcessCacheScope, ProcessConcurrency, ProcessWithRetries
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.target import Dependencies, SourcesField, Target, TransitiveTargetsRequest
 from pants.engine.unions import UnionRule
-from pants.util.dirutil import fast_relpath
+from pants.util.dirutil import fast_relpath, fast_relpath_optional
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
-from pants.util.strutil import pluralize
+from pants.util.strutil import pluralize, strip_v2_chroot_path
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -102,17 +114,72 @@ class TestMetadata:
     extra_env_vars: tuple[str, ...]
     owning_target: Target
     compatibility_tag: str | None = None
+    shard: str | None = None
 
     __test__ = False
 
     @property
     def description(self) -> str:
-        return f"{self.owning_target[NodePackageNameField].value} {self.compatibility_tag or ''}"
+        description = (
+            f"{self.owning_target[NodePackageNameField].value} {self.compatibility_tag or ''}"
+        )
+        if self.shard:
+            description = f"{description} ({self.shard})"
+        return description
+
+
+def _package_relative_path(file: str, package_dir: str) -> str | None:
+    """The path of a reported test file relative to its package directory, where the tests run.
+
+    Reporters either record paths relative to that directory, or absolute paths in the sandbox.
+    """
+    if not os.path.isabs(file):
+        return os.path.normpath(file)
+    # Removing the sandbox prefix leaves the path relative to the build root.
+    path = strip_v2_chroot_path(file)
+    if os.path.isabs(path):
+        return None
+    return fast_relpath_optional(os.path.normpath(path), package_dir)
+
+
+def _test_file_durations(reports: Iterable[FileContent], package_dir: str) -> dict[str, float]:
+    """Sum the durations of the test cases in the given JUnit XML reports by test file, relative to
+    the package directory."""
+
+    def test_file(testsuite: ET.Element, testcase: ET.Element) -> str | None:
+        file = testcase.get("file") or testsuite.get("file")
+        return _package_relative_path(file, package_dir) if file else None
+
+    return junit_xml_durations(reports, key=test_file)
+
+
+def _balance_test_files(
+    field_sets: Sequence[JSTestFieldSet],
+    durations: Mapping[str, float],
+    package_dir: str,
+    count: int,
+) -> list[list[JSTestFieldSet]]:
+    """Assign test files to at most `count` shards of similar total duration."""
+    reported = {
+        field_set: durations.get(fast_relpath(field_set.source.file_path, package_dir))
+        for field_set in field_sets
+    }
+    known = [duration for duration in reported.values() if duration is not None]
+    # Files which have not been reported on yet are assumed to be of average length.
+    default = sum(known) / len(known) if known else 1.0
+    return balance_by_duration(
+        {
+            field_set: default if duration is None else duration
+            for field_set, duration in reported.items()
+        },
+        count,
+        key=lambda field_set: field_set.address,
+    )
 
 
 @rule(desc="Partition NodeJS tests", level=LogLevel.DEBUG)
 async def partition_nodejs_tests(
-    request: JSTestRequest.PartitionRequest[JSTestFieldSet],
+    request: JSTestRequest.PartitionRequest[JSTestFieldSet], nodejs_test: NodeJSTest
 ) -> Partitions[JSTestFieldSet, TestMetadata]:
     partitions = []
     compatible_tests = defaultdict(list)
@@ -132,8 +199,31 @@ async def partition_nodejs_tests(
         else:
             compatible_tests[metadata].append(field_set)
 
+    reports: Sequence[FileContent] = ()
+    if nodejs_test.shards > 1 and nodejs_test.shard_reports_dir:
+        reports_digest = await path_globs_to_digest(
+            PathGlobs([os.path.join(nodejs_test.shard_reports_dir, "**", "*.xml")])
+        )
+        reports = await get_digest_contents(reports_digest)
+
+    durations_by_package_dir: dict[str, dict[str, float]] = {}
     for metadata, field_sets in compatible_tests.items():
-        partitions.append(Partition(tuple(field_sets), metadata))
+        if nodejs_test.shards <= 1 or len(field_sets) <= 1:
+            partitions.append(Partition(tuple(field_sets), metadata))
+            continue
+        package_dir = metadata.owning_target.address.spec_path
+        if package_dir not in durations_by_package_dir:
+            durations_by_package_dir[package_dir] = _test_file_durations(reports, package_dir)
+        shards = _balance_test_files(
+            field_sets, durations_by_package_dir[package_dir], package_dir, nodejs_test.shards
+        )
+        for index, shard in enumerate(shards):
+            partitions.append(
+                Partition(
+                    tuple(shard),
+                    dataclasses.replace(metadata, shard=f"shard {index + 1}/{len(shards)}"),
+                )
+            )
 
     return Partitions(partitions)
 
@@ -143,6 +233,7 @@ async def run_javascript_tests(
     batch: JSTestRequest.Batch[JSTestFieldSet, TestMetadata],
     test: TestSubsystem,
     test_extra_env: TestExtraEnv,
+    nodejs_test: NodeJSTest,
 ) -> TestResult:
     field_sets = batch.elements
     metadata = batch.partition_metadata
@@ -204,6 +295,11 @@ async def run_javascript_tests(
     file_description = field_sets[0].address.spec
     if len(field_sets) > 1:
         file_description += f"+ {pluralize(len(field_sets) - 1, 'other file')}"
+
+    # Runners such as Jest and Mocha can run the files of a batch in parallel workers, which are
+    # sized by the concurrency that the process is granted.
+    workers = min(nodejs_test.workers, len(field_sets))
+    worker_args = tuple(nodejs_test.worker_args) if workers > 1 else ()
     process = await setup_nodejs_project_environment_process(
         NodeJsProjectEnvironmentProcess(
             installation.project_env,
@@ -213,9 +309,11 @@ async def run_javascript_tests(
                 *installation.project_env.project.args_separator,
                 *sorted(relative_package_dir(file) for file in field_set_source_files.files),
                 *coverage_args,
+                *worker_args,
             ),
             description=f"Running npm tests for {file_description}.",
             input_digest=merged_digest,
+            immutable_input_digests=installation.immutable_input_digests,
             level=LogLevel.INFO,
             extra_env=FrozenDict(**test_extra_env.env, **target_env_vars),
             timeout_seconds=timeout_seconds,
@@ -231,6 +329,8 @@ async def run_javascript_tests(
     )
     if test.force:
         process = dataclasses.replace(process, cache_scope=ProcessCacheScope.PER_SESSION)
+    if workers > 1:
+        process = dataclasses.replace(process, concurrency=ProcessConcurrency.range(workers))
 
     results = await execute_process_with_retry(ProcessWithRetries(process, test.attempts_default))
     coverage_data: JSCoverageData | None = None
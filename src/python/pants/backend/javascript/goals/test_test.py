@@ -10,21 +10,31 @@ import pytest
 from pants.backend.javascript.goals.test import (
     JSTestFieldSet,
     JSTestRequest,
+    _balance_test_files,
+    _test_file_durations,
     partition_nodejs_tests,
 )
 from pants.backend.javascript.package_json import OwningNodePackage, OwningNodePackageRequest
+from pants.backend.javascript.subsystems.nodejstest import NodeJSTest
 from pants.backend.javascript.target_types import (
     JSTestBatchCompatibilityTagField,
     JSTestExtraEnvVarsField,
 )
 from pants.build_graph.address import Address
+from pants.engine.fs import FileContent
+from pants.testutil.option_util import create_subsystem
 from pants.testutil.rule_runner import run_rule_with_mocks
 
 
 def given_field_set(
-    address: Any, *, env_vars: tuple[str, ...] = tuple(), batch_compatibility_tag: str | None
+    address: Any,
+    *,
+    env_vars: tuple[str, ...] = tuple(),
+    batch_compatibility_tag: str | None,
+    file_path: str = "",
 ) -> Mock:
     field_set = Mock(JSTestFieldSet)
+    field_set.source = Mock(file_path=file_path)
     field_set.extra_env_vars = Mock(JSTestExtraEnvVarsField)
     field_set.extra_env_vars.sorted.return_value = env_vars
     field_set.batch_compatibility_tag = JSTestBatchCompatibilityTagField(
@@ -48,7 +58,7 @@ def test_batches_are_separated_on_owning_packages() -> None:
 
     partitions = run_rule_with_mocks(
         partition_nodejs_tests,
-        rule_args=(request,),
+        rule_args=(request, create_subsystem(NodeJSTest, shards=1, shard_reports_dir=None)),
         mock_calls={
             "pants.backend.javascript.package_json.find_owning_package": mocked_owning_node_package
         },
@@ -87,7 +97,7 @@ def test_batches_are_separated_on_metadata(field_set_1: Mock, field_set_2: Mock)
 
     parititions = run_rule_with_mocks(
         partition_nodejs_tests,
-        rule_args=(request,),
+        rule_args=(request, create_subsystem(NodeJSTest, shards=1, shard_reports_dir=None)),
         mock_calls={
             "pants.backend.javascript.package_json.find_owning_package": mocked_owning_node_package
         },
@@ -107,10 +117,89 @@ def test_batches_are_the_same_for_same_compat_and_package() -> None:
 
     parititions = run_rule_with_mocks(
         partition_nodejs_tests,
-        rule_args=(request,),
+        rule_args=(request, create_subsystem(NodeJSTest, shards=1, shard_reports_dir=None)),
         mock_calls={
             "pants.backend.javascript.package_json.find_owning_package": mocked_owning_node_package
         },
     )
 
     assert len(parititions) == 1
+
+
+def test_batches_are_split_into_shards() -> None:
+    field_sets = [
+        given_field_set(
+            Address("src", relative_file_path=f"{i}.test.js"),
+            batch_compatibility_tag="default",
+            file_path=f"src/{i}.test.js",
+        )
+        for i in range(5)
+    ]
+    request = JSTestRequest.PartitionRequest(field_sets=tuple(field_sets))
+
+    def mocked_owning_node_package(_: OwningNodePackageRequest) -> Any:
+        return OwningNodePackage(Mock(address=Address("src")))
+
+    partitions = run_rule_with_mocks(
+        partition_nodejs_tests,
+        rule_args=(request, create_subsystem(NodeJSTest, shards=2, shard_reports_dir=None)),
+        mock_calls={
+            "pants.backend.javascript.package_json.find_owning_package": mocked_owning_node_package
+        },
+    )
+
+    assert sorted(len(partition.elements) for partition in partitions) == [2, 3]
+    assert {partition.metadata.shard for partition in partitions} == {"shard 1/2", "shard 2/2"}
+
+
+def test_test_file_durations() -> None:
+    jest_report = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <testsuites>
+          <testsuite name="foo">
+            <testcase name="a" time="1.5" file="/tmp/pants-sandbox-a1B2c3/src/js/foo.test.js"/>
+            <testcase name="b" time="0.5" file="/tmp/pants-sandbox-a1B2c3/src/js/foo.test.js"/>
+            <testcase name="other" time="9" file="/tmp/pants-sandbox-a1B2c3/src/other.test.js"/>
+          </testsuite>
+        </testsuites>
+    """
+    mocha_report = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <testsuites>
+          <testsuite name="Root Suite" file="./tests/bar.test.js">
+            <testcase name="c" time="3"/>
+          </testsuite>
+          <testsuite name="no file">
+            <testcase name="d" time="7"/>
+          </testsuite>
+        </testsuites>
+    """
+    durations = _test_file_durations(
+        [
+            FileContent("jest.xml", jest_report),
+            FileContent("mocha.xml", mocha_report),
+            FileContent("broken.xml", b"<testsuites"),
+        ],
+        "src/js",
+    )
+    # Files outside of the package are not recorded.
+    assert durations == {"foo.test.js": 2.0, "tests/bar.test.js": 3.0}
+
+
+def test_balance_test_files() -> None:
+    def field_set(name: str) -> Mock:
+        return given_field_set(
+            Address("src/js", relative_file_path=name),
+            batch_compatibility_tag="default",
+            file_path=f"src/js/{name}",
+        )
+
+    slow, medium, fast, unknown, index = (
+        field_set(name)
+        for name in ("slow.js", "medium.js", "fast.js", "unknown.js", "tests/index.test.js")
+    )
+    durations = {"slow.js": 10.0, "medium.js": 4.0, "fast.js": 1.0, "index.test.js": 100.0}
+
+    shards = _balance_test_files([fast, unknown, medium, slow], durations, "src/js", 2)
+    # The unreported file is assumed to take the average duration of 5 seconds.
+    assert shards == [[slow], [unknown, medium, fast]]
+    # Files are only matched by their exact path in the package.
+    assert _balance_test_files([index, slow], durations, "src/js", 3) == [[slow], [index]]
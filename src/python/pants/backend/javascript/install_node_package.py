@@ -29,24 +29,33 @@ from pants.core.util_rules.source_files import (
     SourceFilesRequest,
     determine_source_files,
 )
+from pants.engine.fs import CreateDigest, SymlinkEntry
 from pants.engine.internals.graph import transitive_targets
 from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
-from pants.engine.intrinsics import add_prefix, merge_digests
+from pants.engine.intrinsics import add_prefix, create_digest, merge_digests
 from pants.engine.process import fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.target import SourcesField, Target, TransitiveTargetsRequest
 from pants.engine.unions import UnionMembership, UnionRule
+from pants.util.frozendict import FrozenDict
+
+_NODE_MODULES_STORE_DIR = "__node_modules_store"
 
 
 @dataclass(frozen=True)
 class InstalledNodePackageRequest:
     address: Address
+    # Whether `node_modules` may be provided via `immutable_input_digests` when
+    # `[nodejs].shared_node_modules` is enabled. Consumers that materialize the installation
+    # outside of a sandbox need real files instead.
+    allow_shared_node_modules: bool = True
 
 
 @dataclass(frozen=True)
 class InstalledNodePackage:
     project_env: NodeJsProjectEnvironment
     digest: Digest
+    immutable_input_digests: FrozenDict[str, Digest] = FrozenDict()
 
     @property
     def project_dir(self) -> str:
@@ -111,6 +120,34 @@ async def install_node_packages_for_address(
             )
         )
     )
+
+    use_shared_node_modules = (
+        req.allow_shared_node_modules
+        and nodejs.shared_node_modules
+        and project_env.project.single_workspace
+    )
+    if use_shared_node_modules:
+        # The installed `node_modules` is materialized once in the immutable inputs store, and the
+        # sandbox only receives a symlink to it. The symlink targets the `node_modules` directory
+        # inside the store entry, so that Node.js, which resolves modules from their real paths,
+        # still finds hoisted sibling packages.
+        store_dir = os.path.join(project_env.root_dir, _NODE_MODULES_STORE_DIR)
+        node_modules_link = await create_digest(
+            CreateDigest(
+                [
+                    SymlinkEntry(
+                        os.path.join(project_env.root_dir, "node_modules"),
+                        f"{_NODE_MODULES_STORE_DIR}/node_modules",
+                    )
+                ]
+            )
+        )
+        return InstalledNodePackage(
+            project_env,
+            digest=await merge_digests(MergeDigests([package_digest, node_modules_link])),
+            immutable_input_digests=FrozenDict({store_dir: install_result.output_digest}),
+        )
+
     node_modules = await add_prefix(AddPrefix(install_result.output_digest, project_env.root_dir))
 
     return InstalledNodePackage(
@@ -140,7 +177,11 @@ async def add_sources_to_installed_node_package(
         with_js=True,
     )
     digest = await merge_digests(MergeDigests((installation.digest, source_files.snapshot.digest)))
-    return InstalledNodePackageWithSource(installation.project_env, digest=digest)
+    return InstalledNodePackageWithSource(
+        installation.project_env,
+        digest=digest,
+        immutable_input_digests=installation.immutable_input_digests,
+    )
 
 
 def rules() -> Iterable[Rule | UnionRule]:
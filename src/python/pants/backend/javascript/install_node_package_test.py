@@ -16,7 +16,7 @@ from pants.backend.javascript.install_node_package import (
 from pants.backend.javascript.package_json import PackageJsonTarget
 from pants.backend.javascript.target_types import JSSourcesGeneratorTarget
 from pants.build_graph.address import Address
-from pants.engine.fs import DigestContents
+from pants.engine.fs import DigestContents, DigestEntries, SymlinkEntry
 from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner
 
@@ -88,3 +88,41 @@ def test_install_node_package_with_extra_env_vars(rule_runner: RuleRunner) -> No
 
     assert "GLOBAL_VAR" in actual_env_vars
     assert actual_env_vars["GLOBAL_VAR"] == "global_value"
+
+
+def test_install_node_package_with_shared_node_modules(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--nodejs-shared-node-modules", "--nodejs-tools=['env']"], env_inherit={"PATH"}
+    )
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": json.dumps(
+                {
+                    "name": "test-package",
+                    "version": "1.0.0",
+                    "packageManager": "yarn@1.22.22",
+                    "scripts": {"postinstall": "env > node_modules/env-vars.txt"},
+                }
+            ),
+        }
+    )
+
+    installed_package = rule_runner.request(
+        InstalledNodePackage, [InstalledNodePackageRequest(Address("src/js"))]
+    )
+    entries = rule_runner.request(DigestEntries, [installed_package.digest])
+    assert SymlinkEntry("src/js/node_modules", "__node_modules_store/node_modules") in entries
+    assert not any(entry.path.startswith("src/js/node_modules/") for entry in entries)
+
+    store = installed_package.immutable_input_digests["src/js/__node_modules_store"]
+    store_contents = rule_runner.request(DigestContents, [store])
+    assert "node_modules/env-vars.txt" in {f.path for f in store_contents}
+
+    exported_package = rule_runner.request(
+        InstalledNodePackage,
+        [InstalledNodePackageRequest(Address("src/js"), allow_shared_node_modules=False)],
+    )
+    assert not exported_package.immutable_input_digests
+    exported_contents = rule_runner.request(DigestContents, [exported_package.digest])
+    assert "src/js/node_modules/env-vars.txt" in {f.path for f in exported_contents}
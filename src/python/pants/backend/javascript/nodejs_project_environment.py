@@ -102,6 +102,7 @@ class NodeJsProjectEnvironmentProcess:
     project_caches: FrozenDict[str, str] = field(default_factory=FrozenDict)
     timeout_seconds: int | None = None
     extra_env: FrozenDict[str, str] = field(default_factory=FrozenDict)
+    immutable_input_digests: FrozenDict[str, Digest] = field(default_factory=FrozenDict)
 
     def targeted_args(self) -> tuple[str, ...]:
         if (
@@ -175,6 +176,7 @@ async def setup_nodejs_project_environment_process(
                 append_only_caches=append_only_caches,
                 timeout_seconds=req.timeout_seconds,
                 project_digest=project_digest,
+                immutable_input_digests=req.immutable_input_digests,
                 extra_env=FrozenDict(
                     {
                         **subsystem_env_vars,
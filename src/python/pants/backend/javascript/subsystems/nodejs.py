@@ -53,7 +53,13 @@ from pants.engine.platform import Platform
 from pants.engine.process import Process, fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
 from pants.engine.unions import UnionRule
-from pants.option.option_types import DictOption, ShellStrListOption, StrListOption, StrOption
+from pants.option.option_types import (
+    BoolOption,
+    DictOption,
+    ShellStrListOption,
+    StrListOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.frozendict import FrozenDict
@@ -170,6 +176,26 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         advanced=True,
     )
 
+    shared_node_modules = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            If true, the `node_modules` directory installed for a single-package Node.js project is
+            provided to sandboxes as an immutable input instead of being copied into each of them.
+
+            The installed packages are stored once, keyed by their content, in an append-only named
+            cache, and each sandbox only receives a symlink to that store. This makes sandbox setup
+            for tests, builds and tools independent of the size of `node_modules`.
+
+            Processes may not write to `node_modules` when this is enabled, so tools that keep a
+            cache under `node_modules` (such as `node_modules/.cache`) must be configured to use a
+            different location. Projects with multiple workspaces always receive a copy, since
+            their `node_modules` link to the workspace packages.
+            """
+        ),
+        advanced=True,
+    )
+
     @property
     def default_package_manager(self) -> str | None:
         if self.package_manager in self.package_managers:
@@ -286,6 +312,7 @@ class NodeJSToolProcess:
     timeout_seconds: int | None = None
     extra_env: Mapping[str, str] = field(default_factory=FrozenDict)
     project_digest: Digest | None = None
+    immutable_input_digests: FrozenDict[str, Digest] = field(default_factory=FrozenDict)
 
     @classmethod
     def npm(
@@ -688,7 +715,10 @@ async def setup_node_tool_process(
         argv=list(filter(None, (request.tool, *request.args))),
         input_digest=input_digest,
         output_files=request.output_files,
-        immutable_input_digests=environment.immutable_digest(),
+        immutable_input_digests={
+            **environment.immutable_digest(),
+            **request.immutable_input_digests,
+        },
         output_directories=request.output_directories,
         description=request.description,
         level=request.level,
@@ -198,6 +198,7 @@ async def _run_tool_with_resolve(request: NodeJSToolRequest, resolve: str) -> Pr
             args=(*project.package_manager.execute_args, request.binary_name, *request.args),
             description=request.description,
             input_digest=merged_input_digest,
+            immutable_input_digests=installed.immutable_input_digests,
             output_files=request.output_files,
             output_directories=request.output_directories,
             per_package_caches=request.append_only_caches,
@@ -11,7 +11,7 @@ from pants.build_graph.address import Address
 from pants.core.goals.test import Test
 from pants.core.target_types import FileTarget
 from pants.core.util_rules.distdir import DistDir
-from pants.option.option_types import SkipOption, StrOption
+from pants.option.option_types import IntOption, SkipOption, StrListOption, StrOption
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import bin_name
 from pants.util.strutil import help_text, softwrap
@@ -75,6 +75,71 @@ class NodeJSTest(Subsystem):
 
     skip = SkipOption("test")
 
+    shards = IntOption(
+        default=1,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum number of parallel processes to split each batch of `javascript_test`
+            files sharing a `batch_compatibility_tag` across.
+
+            Test files are assigned to shards so that the total duration of each shard is
+            balanced, using the per-file durations recorded in the JUnit XML reports under
+            `[nodejs-test].shard_reports_dir`. Test files which do not appear in those reports
+            are assumed to take the average duration of those that do. Without reports, test
+            files are split evenly by count.
+
+            Note that each shard is still subject to `[test].batch_size`.
+            """
+        ),
+    )
+    shard_reports_dir = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            A directory, relative to the build root, containing JUnit XML reports of a previous
+            run of the Node.js tests, such as those written by `jest-junit` or
+            `mocha-junit-reporter`. These are used to balance test files across
+            `[nodejs-test].shards`, and must record the test file of each test case, either as a
+            `file` attribute of the `testcase` or of its enclosing `testsuite`. The file is either
+            relative to the directory of its `package.json`, or an absolute path in the Pants
+            sandbox that the tests ran in.
+
+            Since the shards are derived from the reports, a new set of reports may regroup the
+            test files, and any regrouped shard misses the cache.
+            """
+        ),
+    )
+    workers = IntOption(
+        default=1,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum number of worker processes a test runner may use to run a batch of test
+            files in parallel.
+
+            When greater than 1, Pants reserves up to this many cores for each batch, bounded by
+            the number of files in the batch, and templates the number of cores it actually
+            reserved into `[nodejs-test].worker_args` as `{pants_concurrency}`.
+            """
+        ),
+    )
+    worker_args = StrListOption(
+        default=[],
+        advanced=True,
+        help=softwrap(
+            """
+            Arguments to pass to the `test` script to set its number of workers, when
+            `[nodejs-test].workers` is greater than 1.
+
+            Use `{pants_concurrency}` for the number of workers, e.g.
+            `--maxWorkers={pants_concurrency}` for Jest, or `--parallel` and
+            `--jobs={pants_concurrency}` for Mocha.
+            """
+        ),
+    )
+
     coverage_output_dir = StrOption(
         default=str(PurePath("{distdir}", "coverage", "js", "{target_spec}")),
         advanced=True,
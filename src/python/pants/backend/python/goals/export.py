@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
 import os
 import textwrap
@@ -149,6 +150,10 @@ class ExportPluginOptions:
     )
 
 
+def _fingerprint(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
 async def _get_full_python_version(python: PythonExecutable) -> str:
     # Get the full python version (including patch #).
     argv = [
@@ -333,12 +338,28 @@ async def do_export(
                 ),
             ]
 
+        # The venv is fully determined by the PEXes, the interpreter and the venv arguments (other
+        # than the random tmpdir), so this allows unchanged venvs to be skipped on re-export.
+        fingerprint = _fingerprint(
+            merged_digest.fingerprint,
+            requirements_pex.python.path,
+            requirements_pex.python.fingerprint or "",
+            req.py_version,
+            *pex_args[1:],
+            *(
+                [req.editable_local_dists_digest.fingerprint]
+                if req.editable_local_dists_digest is not None
+                else []
+            ),
+        )
+
         return ExportResult(
             description,
             dest,
             digest=merged_digest_under_tmpdir,
             post_processing_cmds=post_processing_cmds,
             resolve=req.resolve_name or None,
+            fingerprint=fingerprint,
         )
     else:
         raise ExportError("Unsupported value for [export].py_resolve_format")
@@ -487,6 +508,11 @@ async def add_codegen_to_export_result(
         export_result,
         digest=export_digest_with_codegen,
         post_processing_cmds=export_result.post_processing_cmds + codegen_post_processing_cmds,
+        fingerprint=(
+            _fingerprint(export_result.fingerprint, codegen_result.digest.fingerprint)
+            if export_result.fingerprint
+            else None
+        ),
     )
 
 
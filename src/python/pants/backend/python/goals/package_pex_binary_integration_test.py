@@ -184,6 +184,58 @@ def test_include_sources_avoids_files_targets_warning(
     assert result.artifacts[0].relpath == "src.py.project/project.pex"
 
 
+def test_editable_local_dists_are_not_packaged(rule_runner: PythonRuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "lib/__init__.py": "",
+            "lib/greeting.py": "GREETING = 'Hello from local dist!'",
+            "lib/BUILD": dedent(
+                """\
+                python_sources(name="sources")
+
+                python_distribution(
+                    name="dist",
+                    dependencies=[":sources"],
+                    provides=python_artifact(name="greeting-lib", version="0.0.1"),
+                )
+                """
+            ),
+            "app/main.py": dedent(
+                """\
+                from lib.greeting import GREETING
+
+                print(GREETING)
+                """
+            ),
+            "app/BUILD": dedent(
+                """\
+                python_sources(name="sources")
+
+                pex_binary(
+                    name="app",
+                    entry_point="main.py",
+                    dependencies=["lib:dist"],
+                    include_sources=False,
+                )
+                """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        ["--python-editable-local-dists"], env_inherit={"PATH", "PYENV_ROOT", "HOME"}
+    )
+    tgt = rule_runner.get_target(Address("app", target_name="app"))
+    result = rule_runner.request(BuiltPackage, [PexBinaryFieldSet.create(tgt)])
+    assert sorted_artifact_paths(result.artifacts) == ["app/app.pex"]
+
+    # The packaged PEX must contain the built wheel of the dist, and not a metadata-only editable
+    # wheel, since it is used outside of Pants, without the sources.
+    rule_runner.write_digest(result.digest)
+    executable = os.path.join(rule_runner.build_root, "app/app.pex")
+    output = subprocess.check_output([executable], text=True)
+    assert output == "Hello from local dist!\n"
+
+
 @pytest.mark.parametrize(
     "layout",
     [pytest.param(layout, id=layout.value) for layout in PexLayout],
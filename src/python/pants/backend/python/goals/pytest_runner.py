@@ -319,7 +319,9 @@ async def setup_pytest_for_target(
             addresses,
             interpreter_constraints=interpreter_constraints,
             sources=prepared_sources,
-        )
+            internal_only=True,
+        ),
+        **implicitly(),
     )
 
     pytest_runner_pex_get = create_venv_pex(
@@ -94,7 +94,9 @@ async def create_python_repl_request(
         LocalDistsPexRequest(
             request.addresses,
             interpreter_constraints=interpreter_constraints,
-        )
+            internal_only=True,
+        ),
+        **implicitly(),
     )
 
     sources_request = prepare_python_sources(
@@ -162,7 +164,9 @@ async def create_ipython_repl_request(
             request.addresses,
             interpreter_constraints=interpreter_constraints,
             sources=sources,
-        )
+            internal_only=True,
+        ),
+        **implicitly(),
     )
 
     merged_digest = await merge_digests(
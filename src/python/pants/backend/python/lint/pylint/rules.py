@@ -16,6 +16,7 @@ from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.util_rules import pex_from_targets
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.partition import (
+    _partition_by_dependency_closure,
     _partition_by_interpreter_constraints_and_resolve,
 )
 from pants.backend.python.util_rules.pex import (
@@ -42,6 +43,7 @@ from pants.engine.intrinsics import create_digest, execute_process, merge_digest
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import CoarsenedTargets, CoarsenedTargetsRequest
 from pants.util.logging import LogLevel
+from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import pluralize
 
 
@@ -97,22 +99,39 @@ async def partition_pylint(
     )
     coarsened_targets_by_address = coarsened_targets.by_address()
 
-    return Partitions(
-        Partition(
-            tuple(field_sets),
-            PartitionMetadata(
-                CoarsenedTargets(
-                    coarsened_targets_by_address[field_set.address] for field_set in field_sets
-                ),
-                resolve if len(python_setup.resolves) > 1 else None,
-                InterpreterConstraints.merge((interpreter_constraints, first_party_ics)),
-            ),
+    partitions = []
+    for (
+        resolve,
+        interpreter_constraints,
+    ), field_sets in resolve_and_interpreter_constraints_to_field_sets.items():
+        roots = FrozenOrderedSet(
+            coarsened_targets_by_address[field_set.address] for field_set in field_sets
         )
-        for (
-            resolve,
-            interpreter_constraints,
-        ), field_sets in resolve_and_interpreter_constraints_to_field_sets.items()
-    )
+        # The core `lint` goal batches each partition by `[lint].batch_size`, but every batch
+        # carries the metadata of its whole partition. Splitting along dependency closures instead
+        # lets each batch only load the sources and requirements that it needs.
+        batches = (
+            _partition_by_dependency_closure(roots, size_target=pylint.partition_size)
+            if pylint.partition_size
+            else [list(roots)]
+        )
+        for batch in batches:
+            batch_roots = set(batch)
+            partitions.append(
+                Partition(
+                    tuple(
+                        field_set
+                        for field_set in field_sets
+                        if coarsened_targets_by_address[field_set.address] in batch_roots
+                    ),
+                    PartitionMetadata(
+                        CoarsenedTargets(batch),
+                        resolve if len(python_setup.resolves) > 1 else None,
+                        InterpreterConstraints.merge((interpreter_constraints, first_party_ics)),
+                    ),
+                )
+            )
+    return Partitions(partitions)
 
 
 @rule(desc="Lint using Pylint", level=LogLevel.DEBUG)
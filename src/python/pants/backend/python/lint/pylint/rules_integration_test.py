@@ -568,3 +568,17 @@ def test_partition_targets(rule_runner: PythonRuleRunner) -> None:
         "3.9",
         "b",
     )
+
+    # With a partition size, partitions are split along dependency closures.
+    rule_runner.set_options(
+        [
+            "--python-resolves={'a': '', 'b': ''}",
+            "--python-enable-resolves",
+            "--pylint-partition-size=1",
+        ],
+        env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+    )
+    partitions = list(rule_runner.request(Partitions[PylintFieldSet, PartitionMetadata], [request]))
+    assert len(partitions) == 4
+    assert_partition(partitions[2], [resolve_b_root1], [resolve_b_dep1], "3.9", "b")
+    assert_partition(partitions[3], [resolve_b_root2], [resolve_b_dep2], "3.9", "b")
@@ -19,6 +19,7 @@ from pants.backend.python.target_types import (
     PythonResolveField,
     PythonSourceField,
 )
+from pants.backend.python.util_rules.partition import _validate_partition_size
 from pants.core.goals.resolves import ExportableTool
 from pants.core.util_rules.config_files import ConfigFilesRequest
 from pants.engine.addresses import UnparsedAddressInputs
@@ -29,6 +30,7 @@ from pants.option.option_types import (
     ArgsListOption,
     BoolOption,
     FileOption,
+    IntOption,
     SkipOption,
     TargetListOption,
 )
@@ -93,6 +95,20 @@ class Pylint(PythonToolBase):
             """
         ),
     )
+    _partition_size = IntOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            If set, split the targets that share a resolve and interpreter constraints into
+            groups of at most this many targets, along their transitive dependencies.
+
+            Each Pylint process then only needs the sources and requirements of its own group,
+            rather than those of every target with the same resolve and interpreter constraints.
+            Groups are still batched further according to `[lint].batch_size`.
+            """
+        ),
+    )
     _source_plugins = TargetListOption(
         advanced=True,
         help=softwrap(
@@ -128,6 +144,10 @@ class Pylint(PythonToolBase):
             check_content={"pyproject.toml": b"[tool.pylint.", "setup.cfg": b"[pylint."},
         )
 
+    @property
+    def partition_size(self) -> int | None:
+        return _validate_partition_size(self._partition_size, options_scope=self.options_scope)
+
     @property
     def source_plugins(self) -> UnparsedAddressInputs:
         return UnparsedAddressInputs(
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import importlib.resources
-import json
 import logging
 import os
 from collections.abc import Callable, Iterable, Sequence
@@ -22,11 +21,11 @@ from pants.backend.python.util_rules.pex_requirements import (
     LoadedLockfile,
     LoadedLockfileRequest,
     Lockfile,
+    PexLockfileIndex,
     PexRequirements,
     Resolve,
     get_lockfile_for_resolve,
     load_lockfile,
-    strip_comments_from_pex_json_lockfile,
 )
 from pants.core.goals.resolves import ExportableTool
 from pants.engine.fs import Digest
@@ -237,18 +236,13 @@ class PythonToolRequirementsBase(Subsystem, ExportableTool):
                 f"(origin: {lockfile.url_description_of_origin})"
             )
 
-        stripped_lock_bytes = strip_comments_from_pex_json_lockfile(lock_bytes)
-        lockfile_contents = json.loads(stripped_lock_bytes)
+        lockfile_index = PexLockfileIndex.parse(lock_bytes, lockfile.url)
         # The first requirement must contain the primary package for this tool, otherwise
         # this will pick up the wrong requirement.
         first_default_requirement = PipRequirement.parse(cls.default_requirements[0])
         return next(
-            _PackageNameAndVersion(
-                name=first_default_requirement.name, version=requirement["version"]
-            )
-            for resolve in lockfile_contents["locked_resolves"]
-            for requirement in resolve["locked_requirements"]
-            if requirement["project_name"] == first_default_requirement.name
+            _PackageNameAndVersion(name=first_default_requirement.name, version=version)
+            for version in lockfile_index.versions(first_default_requirement.name)
         )
 
     def pex_requirements(
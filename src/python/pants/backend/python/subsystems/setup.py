@@ -587,6 +587,28 @@ class PythonSetup(Subsystem):
         advanced=True,
     )
 
+    editable_local_dists = BoolOption(
+        default=False,
+        help=softwrap(
+            f"""
+            If enabled, when running tests, binaries, and repls, `python_distribution` targets in
+            the dependencies are provided as PEP 660 editable installs, instead of by building
+            their wheels. Packaged binaries (e.g. with `{bin_name()} package`) always include the
+            built wheels.
+
+            The editable install only contains the distribution's metadata (so that, for example,
+            `importlib.metadata` and entry points work), while its code is used directly from
+            sources. Editing the distribution's sources still re-runs the preparation of its
+            metadata, which needs all of its sources, but this is much cheaper than rebuilding its
+            wheel.
+
+            Native extensions are not built in this mode, so leave this disabled if tests rely on
+            the compiled extensions of a local distribution.
+            """
+        ),
+        advanced=True,
+    )
+
     __constraints_deprecation_msg = softwrap(
         f"""
         We encourage instead migrating to `[python].enable_resolves` and `[python].resolves`,
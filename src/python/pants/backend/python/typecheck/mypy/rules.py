@@ -21,6 +21,7 @@ from pants.backend.python.typecheck.mypy.subsystem import (
 from pants.backend.python.util_rules import pex_from_targets
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.partition import (
+    _partition_by_dependency_closure,
     _partition_by_interpreter_constraints_and_resolve,
 )
 from pants.backend.python.util_rules.pex import (
@@ -66,10 +67,16 @@ class MyPyPartition:
     root_targets: CoarsenedTargets
     resolve_description: str | None
     interpreter_constraints: InterpreterConstraints
+    # The 1-based index and count of the batches that a resolve and interpreter constraints
+    # partition was split into, if any. See `[mypy].partition_size`.
+    batch: tuple[int, int] | None = None
 
     def description(self) -> str:
         ics = str(sorted(str(c) for c in self.interpreter_constraints))
-        return f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        description = f"{self.resolve_description}, {ics}" if self.resolve_description else ics
+        if self.batch:
+            description += f", batch {self.batch[0]} of {self.batch[1]}"
+        return description
 
 
 class MyPyPartitions(Collection[MyPyPartition]):
@@ -294,6 +301,10 @@ async def mypy_typecheck_partition(
                             # to partition MyPy runs by python version (which the DB is independent
                             # for different versions) and uses a one-process-at-a-time daemon by default,
                             # multiple MyPy processes operating on a single db cache should be rare.
+                            # The exception is `[mypy].partition_size`, where batches of a partition
+                            # intentionally share a db: since batches are split along dependency
+                            # closures, the entries they race on are mostly for shared dependencies,
+                            # which are cheap to recompute.
 
                             NAMED_CACHE_DIR="{mypy_cache_dir}/{py_version}"
                             NAMED_CACHE_DB="$NAMED_CACHE_DIR/cache.db"
@@ -388,21 +399,34 @@ async def mypy_determine_partitions(
     )
     coarsened_targets_by_address = coarsened_targets.by_address()
 
-    return MyPyPartitions(
-        MyPyPartition(
-            FrozenOrderedSet(field_sets),
-            CoarsenedTargets(
-                OrderedSet(
-                    coarsened_targets_by_address[field_set.address] for field_set in field_sets
-                )
-            ),
-            resolve if len(python_setup.resolves) > 1 else None,
-            interpreter_constraints or mypy.interpreter_constraints,
+    partitions = []
+    for (resolve, interpreter_constraints), field_sets in sorted(
+        resolve_and_interpreter_constraints_to_field_sets.items()
+    ):
+        roots = FrozenOrderedSet(
+            coarsened_targets_by_address[field_set.address] for field_set in field_sets
         )
-        for (resolve, interpreter_constraints), field_sets in sorted(
-            resolve_and_interpreter_constraints_to_field_sets.items()
+        batches = (
+            _partition_by_dependency_closure(roots, size_target=mypy.partition_size)
+            if mypy.partition_size
+            else [list(roots)]
         )
-    )
+        for i, batch in enumerate(batches, start=1):
+            batch_roots = set(batch)
+            partitions.append(
+                MyPyPartition(
+                    FrozenOrderedSet(
+                        field_set
+                        for field_set in field_sets
+                        if coarsened_targets_by_address[field_set.address] in batch_roots
+                    ),
+                    CoarsenedTargets(batch),
+                    resolve if len(python_setup.resolves) > 1 else None,
+                    interpreter_constraints or mypy.interpreter_constraints,
+                    (i, len(batches)) if len(batches) > 1 else None,
+                )
+            )
+    return MyPyPartitions(partitions)
 
 
 # TODO(#10864): Improve performance, e.g. by leveraging the MyPy cache.
@@ -18,7 +18,10 @@ from pants.backend.python.target_types import (
 )
 from pants.backend.python.typecheck.mypy.skip_field import SkipMyPyField
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
-from pants.backend.python.util_rules.partition import _find_all_unique_interpreter_constraints
+from pants.backend.python.util_rules.partition import (
+    _find_all_unique_interpreter_constraints,
+    _validate_partition_size,
+)
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
 from pants.backend.python.util_rules.python_sources import (
     PythonSourceFilesRequest,
@@ -38,6 +41,7 @@ from pants.option.option_types import (
     ArgsListOption,
     BoolOption,
     FileOption,
+    IntOption,
     SkipOption,
     TargetListOption,
 )
@@ -107,6 +111,23 @@ class MyPy(PythonToolBase):
             """
         ),
     )
+    _partition_size = IntOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum number of targets to type check in a single MyPy process.
+
+            By default, Pants runs one MyPy process for all targets that share a resolve and
+            interpreter constraints. If set, larger partitions are split into clusters of
+            targets which share transitive dependencies, and the clusters are type checked
+            concurrently. All processes for a partition share the same MyPy cache.
+
+            Smaller values increase parallelism at the cost of type checking some shared
+            dependencies more than once.
+            """
+        ),
+    )
     _source_plugins = TargetListOption(
         advanced=True,
         help=softwrap(
@@ -134,6 +155,10 @@ class MyPy(PythonToolBase):
             check_content={"setup.cfg": b"[mypy", "pyproject.toml": b"[tool.mypy"},
         )
 
+    @property
+    def partition_size(self) -> int | None:
+        return _validate_partition_size(self._partition_size, options_scope=self.options_scope)
+
     @property
     def source_plugins(self) -> UnparsedAddressInputs:
         return UnparsedAddressInputs(
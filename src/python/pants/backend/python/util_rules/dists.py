@@ -6,7 +6,7 @@ from __future__ import annotations
 import io
 import os
 from collections import abc
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -37,10 +37,11 @@ from pants.engine.intrinsics import (
     remove_prefix,
 )
 from pants.engine.process import fallible_to_exec_result_or_raise
-from pants.engine.rules import collect_rules, implicitly, rule
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.osutil import is_macos_big_sur
+from pants.util.pip_requirement import PipRequirement
 from pants.util.strutil import ensure_text, softwrap
 
 
@@ -72,6 +73,23 @@ class BuildSystem:
         return cls(_setuptools.pex_requirements(), "setuptools.build_meta:__legacy__")
 
 
+def _canonicalize_build_requires(requires: Iterable[str]) -> set[str]:
+    """Normalize the spelling of build requirements.
+
+    `PexRequirements` already sorts and deduplicates requirement strings, so this only helps
+    distributions whose build requirements differ in whitespace or specifier order: they then share
+    a single build backend PEX, rather than each building and caching their own.
+    """
+    canonical = set()
+    for requirement in requires:
+        try:
+            canonical.add(str(PipRequirement.parse(requirement)))
+        except ValueError:
+            # Let Pex report the invalid requirement, as it would have without normalization.
+            canonical.add(requirement)
+    return canonical
+
+
 @rule
 async def find_build_system(request: BuildSystemRequest, _setuptools: Setuptools) -> BuildSystem:
     digest_contents = await get_digest_contents(
@@ -101,7 +119,9 @@ async def find_build_system(request: BuildSystemRequest, _setuptools: Setuptools
                 raise InvalidBuildConfigError(
                     f"No requires found in the [build-system] table in {file_content.path}"
                 )
-            ret = BuildSystem(PexRequirements(requires), build_backend)
+            ret = BuildSystem(
+                PexRequirements(_canonicalize_build_requires(requires)), build_backend
+            )
     # Per PEP 517: "If the pyproject.toml file is absent, or the build-backend key is missing,
     #   the source tree is not using this specification, and tools should revert to the legacy
     #   behaviour of running setup.py."
@@ -205,33 +225,39 @@ def interpolate_backend_shim(dist_dir: str, request: DistBuildRequest) -> bytes:
 
 @rule
 async def run_pep517_build(request: DistBuildRequest, python_setup: PythonSetup) -> DistBuildResult:
-    # Note that this pex has no entrypoint. We use it to run our generated shim, which
-    # in turn imports from and invokes the build backend.
-    build_backend_pex = await create_venv_pex(
-        **implicitly(
-            PexRequest(
-                output_filename="build_backend.pex",
-                internal_only=True,
-                requirements=request.build_system.requires,
-                pex_path=request.extra_build_time_requirements,
-                interpreter_constraints=request.interpreter_constraints,
-            )
-        )
-    )
-
     # This is the setuptools dist directory, not Pants's, so we hardcode to dist/.
     dist_dir = "dist"
     backend_shim_name = "backend_shim.py"
     backend_shim_path = os.path.join(request.working_directory, backend_shim_name)
-    backend_shim_digest = await create_digest(
-        CreateDigest(
-            [
-                FileContent(
-                    backend_shim_path,
-                    interpolate_backend_shim(os.path.join(dist_dir, request.output_path), request),
-                ),
-            ]
-        )
+
+    # Note that this pex has no entrypoint. We use it to run our generated shim, which
+    # in turn imports from and invokes the build backend. The pex only depends on the build
+    # requirements and interpreter constraints, so it is shared by all distributions that use the
+    # same build system.
+    build_backend_pex, backend_shim_digest = await concurrently(
+        create_venv_pex(
+            **implicitly(
+                PexRequest(
+                    output_filename="build_backend.pex",
+                    internal_only=True,
+                    requirements=request.build_system.requires,
+                    pex_path=request.extra_build_time_requirements,
+                    interpreter_constraints=request.interpreter_constraints,
+                )
+            )
+        ),
+        create_digest(
+            CreateDigest(
+                [
+                    FileContent(
+                        backend_shim_path,
+                        interpolate_backend_shim(
+                            os.path.join(dist_dir, request.output_path), request
+                        ),
+                    ),
+                ]
+            )
+        ),
     )
 
     merged_digest = await merge_digests(MergeDigests((request.input, backend_shim_digest)))
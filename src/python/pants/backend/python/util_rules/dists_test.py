@@ -8,6 +8,7 @@ import pytest
 from pants.backend.python.util_rules import dists, pex
 from pants.backend.python.util_rules.dists import (
     BuildSystem,
+    BuildSystemRequest,
     DistBuildRequest,
     DistBuildResult,
     distutils_repr,
@@ -107,3 +108,30 @@ def test_distutils_repr() -> None:
 
 def test_distutils_repr_none() -> None:
     assert "None" == distutils_repr(None)
+
+
+def test_find_build_system_canonicalizes_requires() -> None:
+    rule_runner = RuleRunner(
+        rules=[*dists.rules(), QueryRule(BuildSystem, [BuildSystemRequest])],
+    )
+
+    def find_build_system(requires: str) -> BuildSystem:
+        input_digest = rule_runner.request(
+            Digest,
+            [
+                CreateDigest(
+                    [
+                        FileContent(
+                            "pyproject.toml",
+                            f"[build-system]\nrequires = {requires}\n"
+                            'build-backend = "setuptools.build_meta"\n'.encode(),
+                        )
+                    ]
+                )
+            ],
+        )
+        return rule_runner.request(BuildSystem, [BuildSystemRequest(input_digest, "")])
+
+    build_system = find_build_system('["wheel", "setuptools >= 61,<70", "wheel"]')
+    assert build_system == find_build_system('["setuptools<70,>=61", "wheel"]')
+    assert build_system.requires == PexRequirements(["setuptools<70,>=61", "wheel"])
@@ -31,6 +31,7 @@ from pants.backend.python.target_types import (
 )
 from pants.backend.python.util_rules.pex import (
     CompletePlatforms,
+    Pex,
     create_pex,
     digest_complete_platform_addresses,
 )
@@ -63,6 +64,7 @@ from pants.engine.intrinsics import (
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import (
     AsyncFieldMixin,
+    BoolField,
     Dependencies,
     DependenciesRequest,
     FieldSet,
@@ -96,6 +98,22 @@ class PythonFaaSLayoutField(StringField):
     )
 
 
+class PythonFaaSSeparateDependenciesLayerField(BoolField):
+    alias = "separate_dependencies_layer"
+    default = False
+    help = help_text(
+        """
+        If true, package third-party requirements into a separate dependencies artifact alongside
+        an artifact holding only the first-party sources, instead of one artifact containing both.
+
+        The dependencies artifact only depends on the subset of the lockfile used by this target and
+        on the target platform, so it is reused unchanged (and byte-for-byte identical) across
+        source edits. It is written next to the code artifact, with a `-dependencies` suffix, using
+        the same `layout`.
+        """
+    )
+
+
 class PythonFaaSPex3VenvCreateExtraArgsField(StringSequenceField):
     alias = "pex3_venv_create_extra_args"
     default = ()
@@ -501,6 +519,18 @@ class BuildPythonFaaSRequest:
 
     prefix_in_artifact: None | str = None
 
+    # If set (and requirements are included), requirements are packaged into a separate artifact,
+    # under `dependencies_layer_prefix`, and the main artifact only contains sources.
+    separate_dependencies_layer: bool = False
+    dependencies_layer_prefix: None | str = None
+
+
+def _dependencies_layer_filename(output_filename: str, layout: PexVenvLayout) -> str:
+    if layout is PexVenvLayout.FLAT_ZIPPED:
+        stem, ext = os.path.splitext(output_filename)
+        return f"{stem}-dependencies{ext}"
+    return f"{output_filename}-dependencies"
+
 
 @rule
 async def build_python_faas(
@@ -556,22 +586,26 @@ async def build_python_faas(
         additional_sources = EMPTY_DIGEST
         reexported_handler_func = None
 
-    repository_filename = "faas_repository.pex"
-    pex_request = PexFromTargetsRequest(
-        addresses=[request.address],
-        internal_only=False,
-        include_requirements=request.include_requirements,
-        include_source_files=request.include_sources,
-        output_filename=repository_filename,
-        complete_platforms=platforms.complete_platforms,
-        layout=PexLayout.PACKED,
-        additional_args=additional_pex_args,
-        additional_lockfile_args=additional_pex_args,
-        additional_sources=additional_sources,
-        warn_for_transitive_files_targets=True,
+    separate_dependencies_layer = (
+        request.separate_dependencies_layer and request.include_requirements
     )
 
-    pex_result = await create_pex(**implicitly({pex_request: PexFromTargetsRequest}))
+    def repository_pex_request(
+        filename: str, *, include_requirements: bool, include_sources: bool
+    ) -> PexFromTargetsRequest:
+        return PexFromTargetsRequest(
+            addresses=[request.address],
+            internal_only=False,
+            include_requirements=include_requirements,
+            include_source_files=include_sources,
+            output_filename=filename,
+            complete_platforms=platforms.complete_platforms,
+            layout=PexLayout.PACKED,
+            additional_args=additional_pex_args,
+            additional_lockfile_args=additional_pex_args,
+            additional_sources=additional_sources if include_sources else EMPTY_DIGEST,
+            warn_for_transitive_files_targets=True,
+        )
 
     layout = PexVenvLayout(request.layout.value)
 
@@ -580,17 +614,78 @@ async def build_python_faas(
     )
     metadata_filename = f"{output_filename}.metadata.json"
 
-    result = await pex_venv_get(
-        PexVenvRequest(
-            pex=pex_result,
+    def venv_request(pex: Pex, output_path: str, prefix: None | str, what: str) -> PexVenvRequest:
+        return PexVenvRequest(
+            pex=pex,
             layout=layout,
             complete_platforms=platforms.complete_platforms,
             extra_args=request.pex3_venv_create_extra_args.value or (),
-            prefix=request.prefix_in_artifact,
-            output_path=Path(output_filename),
-            description=f"Build {request.target_name} artifact for {request.address}",
-        ),
-    )
+            prefix=prefix,
+            output_path=Path(output_path),
+            description=f"Build {request.target_name} {what} for {request.address}",
+        )
+
+    dependencies_artifacts: tuple[BuiltPackageArtifact, ...] = ()
+    if separate_dependencies_layer:
+        # The requirements-only PEX (and so the venv built from it) does not depend on any
+        # first-party source, so both are cache hits until the resolved requirements or platforms
+        # change, no matter how often the sources are edited.
+        dependencies_filename = _dependencies_layer_filename(output_filename, layout)
+        code_pex, dependencies_pex = await concurrently(
+            create_pex(
+                **implicitly(
+                    {
+                        repository_pex_request(
+                            "faas_repository.pex",
+                            include_requirements=False,
+                            include_sources=request.include_sources,
+                        ): PexFromTargetsRequest
+                    }
+                )
+            ),
+            create_pex(
+                **implicitly(
+                    {
+                        repository_pex_request(
+                            "faas_dependencies.pex",
+                            include_requirements=True,
+                            include_sources=False,
+                        ): PexFromTargetsRequest
+                    }
+                )
+            ),
+        )
+        result, dependencies_result = await concurrently(
+            pex_venv_get(
+                venv_request(code_pex, output_filename, request.prefix_in_artifact, "artifact")
+            ),
+            pex_venv_get(
+                venv_request(
+                    dependencies_pex,
+                    dependencies_filename,
+                    request.dependencies_layer_prefix,
+                    "dependencies artifact",
+                )
+            ),
+        )
+        result_digests = (result.digest, dependencies_result.digest)
+        dependencies_artifacts = (BuiltPackageArtifact(dependencies_filename),)
+    else:
+        pex_result = await create_pex(
+            **implicitly(
+                {
+                    repository_pex_request(
+                        "faas_repository.pex",
+                        include_requirements=request.include_requirements,
+                        include_sources=request.include_sources,
+                    ): PexFromTargetsRequest
+                }
+            )
+        )
+        result = await pex_venv_get(
+            venv_request(pex_result, output_filename, request.prefix_in_artifact, "artifact")
+        )
+        result_digests = (result.digest,)
 
     metadata = {}
 
@@ -617,7 +712,7 @@ async def build_python_faas(
             ]
         )
     )
-    digest = await merge_digests(MergeDigests([result.digest, metadata_digest]))
+    digest = await merge_digests(MergeDigests([*result_digests, metadata_digest]))
 
     extra_log_lines = [f"    {key.capitalize()}: {val}" for key, val in metadata.items()]
     artifact = BuiltPackageArtifact(
@@ -626,7 +721,9 @@ async def build_python_faas(
     )
     metadata_artifact = BuiltPackageArtifact(metadata_filename)
 
-    return BuiltPackage(digest=digest, artifacts=(artifact, metadata_artifact))
+    return BuiltPackage(
+        digest=digest, artifacts=(artifact, *dependencies_artifacts, metadata_artifact)
+    )
 
 
 def rules():
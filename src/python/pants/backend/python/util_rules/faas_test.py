@@ -35,6 +35,7 @@ from pants.backend.python.util_rules.faas import (
     build_python_faas,
 )
 from pants.backend.python.util_rules.pex import CompletePlatforms, Pex
+from pants.backend.python.util_rules.pex_from_targets import PexFromTargetsRequest
 from pants.backend.python.util_rules.pex_venv import PexVenv, PexVenvLayout, PexVenvRequest
 from pants.build_graph.address import Address
 from pants.core.goals.package import OutputPathField
@@ -588,3 +589,63 @@ def test_pex_build_extra_args_passed_through() -> None:
     )
 
     assert extra_args[0] in mock_build.mock_calls[0].args[0].additional_args
+
+
+def test_separate_dependencies_layer() -> None:
+    addr = Address("x")
+    request = BuildPythonFaaSRequest(
+        address=addr,
+        target_name="x",
+        complete_platforms=Mock(),
+        handler=None,
+        output_path=OutputPathField(None, addr),
+        runtime=Mock(),
+        architecture=FaaSArchitecture.X86_64,
+        pex3_venv_create_extra_args=PythonFaaSPex3VenvCreateExtraArgsField(None, addr),
+        pex_build_extra_args=PythonFaaSPexBuildExtraArgs(None, addr),
+        layout=PythonFaaSLayoutField(PexVenvLayout.FLAT_ZIPPED.value, addr),
+        include_requirements=True,
+        include_sources=True,
+        reexported_handler_module=None,
+        prefix_in_artifact="code",
+        separate_dependencies_layer=True,
+        dependencies_layer_prefix="deps",
+    )
+
+    pex_requests = []
+    venv_requests = []
+
+    def mock_create_pex(request: PexFromTargetsRequest) -> Pex:
+        pex_requests.append(request)
+        return Pex(digest=EMPTY_DIGEST, name=request.output_filename, python=None)
+
+    def mock_get_pex_venv(request: PexVenvRequest) -> PexVenv:
+        venv_requests.append(request)
+        return PexVenv(digest=EMPTY_DIGEST, path=request.output_path)
+
+    built = run_rule_with_mocks(
+        build_python_faas,
+        rule_args=[request],
+        mock_calls={
+            "pants.backend.python.util_rules.faas.infer_runtime_platforms": lambda _: RuntimePlatforms(
+                interpreter_version=None
+            ),
+            "pants.backend.python.util_rules.pex.create_pex": mock_create_pex,
+            "pants.backend.python.util_rules.pex_venv.pex_venv": mock_get_pex_venv,
+            "pants.engine.intrinsics.create_digest": lambda _: EMPTY_DIGEST,
+            "pants.engine.intrinsics.merge_digests": lambda _: EMPTY_DIGEST,
+        },
+    )
+
+    assert sorted(
+        (r.output_filename, r.include_requirements, r.include_source_files) for r in pex_requests
+    ) == [("faas_dependencies.pex", True, False), ("faas_repository.pex", False, True)]
+    assert sorted((str(r.output_path), r.prefix, r.pex.name) for r in venv_requests) == [
+        ("x-dependencies.zip", "deps", "faas_dependencies.pex"),
+        ("x.zip", "code", "faas_repository.pex"),
+    ]
+    assert [artifact.relpath for artifact in built.artifacts] == [
+        "x.zip",
+        "x-dependencies.zip",
+        "x.zip.metadata.json",
+    ]
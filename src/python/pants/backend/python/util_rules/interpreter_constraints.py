@@ -81,6 +81,32 @@ def parse_constraint(constraint: str) -> Requirement:
     return parsed_requirement
 
 
+@memoized
+def _interned_interpreter_constraints(
+    constraint_sets: frozenset[RawConstraints],
+) -> InterpreterConstraints:
+    """Merge the given raw constraint sets, returning a shared instance for equal inputs.
+
+    Interning means that repeatedly creating constraints for many targets (e.g. when partitioning)
+    neither re-parses nor re-merges them, and that the instances compare equal by identity, which
+    makes them cheap to use as dict keys and as arguments to the memoized methods below.
+    """
+    return InterpreterConstraints(
+        InterpreterConstraints.merge_constraint_sets(
+            sorted(constraint_sets)  # Sorted for a stable error message.
+        )
+    )
+
+
+@memoized
+def _merge_interpreter_constraints(
+    ics: frozenset[InterpreterConstraints],
+) -> InterpreterConstraints:
+    return _interned_interpreter_constraints(
+        frozenset(tuple(str(requirement) for requirement in ic) for ic in ics)
+    )
+
+
 # Normally we would subclass `DeduplicatedCollection`, but we want a custom constructor.
 class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter):
     @classmethod
@@ -110,9 +136,7 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
 
     @classmethod
     def merge(cls, ics: Iterable[InterpreterConstraints]) -> InterpreterConstraints:
-        return InterpreterConstraints(
-            cls.merge_constraint_sets(tuple(str(requirement) for requirement in ic) for ic in ics)
-        )
+        return _merge_interpreter_constraints(frozenset(ics))
 
     @classmethod
     def merge_constraint_sets(
@@ -222,12 +246,11 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
         dependencies, merging constraints like this is only necessary when you are _mixing_ code
         which might not have any inter-dependencies, such as when you're merging un-related roots.
         """
-        constraint_sets = {
+        constraint_sets = frozenset(
             ics.value_or_configured_default(python_setup, resolve) for ics, resolve in fields
-        }
+        )
         # This will OR within each field and AND across fields.
-        merged_constraints = cls.merge_constraint_sets(constraint_sets)
-        return InterpreterConstraints(merged_constraints)
+        return _interned_interpreter_constraints(constraint_sets)
 
     @classmethod
     def group_field_sets_by_constraints(
@@ -365,6 +388,15 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
         - Python 3 is the last major release of Python, which the core devs have committed to in
           public several times.
         """
+        return self._enumerate_python_versions(tuple(interpreter_universe))
+
+    # NB: The following methods are memoized by equality (rather than per instance), so that
+    # results are shared between equal constraints.
+
+    @memoized
+    def _enumerate_python_versions(
+        self, interpreter_universe: tuple[str, ...]
+    ) -> FrozenOrderedSet[tuple[int, int, int]]:
         if not self:
             return FrozenOrderedSet()
 
@@ -429,16 +461,28 @@ class InterpreterConstraints(FrozenOrderedSet[Requirement], EngineAwareParameter
         """
         if self == other:
             return True
-        this = self.enumerate_python_versions(interpreter_universe)
-        that = other.enumerate_python_versions(interpreter_universe)
+        return self._contains(other, tuple(interpreter_universe))
+
+    @memoized
+    def _contains(
+        self, other: InterpreterConstraints, interpreter_universe: tuple[str, ...]
+    ) -> bool:
+        this = self._enumerate_python_versions(interpreter_universe)
+        that = other._enumerate_python_versions(interpreter_universe)
         return this.issuperset(that)
 
     def partition_into_major_minor_versions(
         self, interpreter_universe: Iterable[str]
     ) -> tuple[str, ...]:
         """Return all the valid major.minor versions, e.g. `('2.7', '3.6')`."""
+        return self._partition_into_major_minor_versions(tuple(interpreter_universe))
+
+    @memoized
+    def _partition_into_major_minor_versions(
+        self, interpreter_universe: tuple[str, ...]
+    ) -> tuple[str, ...]:
         result: OrderedSet[str] = OrderedSet()
-        for major, minor, _ in self.enumerate_python_versions(interpreter_universe):
+        for major, minor, _ in self._enumerate_python_versions(interpreter_universe):
             result.add(f"{major}.{minor}")
         return tuple(result)
 
@@ -317,6 +317,28 @@ def test_group_field_sets_by_constraints() -> None:
     )
 
 
+def test_create_and_merge_are_interned() -> None:
+    python_setup = create_subsystem(
+        PythonSetup,
+        interpreter_constraints=["CPython>=3.8"],
+        warn_on_python2_usage=False,
+        enable_resolves=False,
+    )
+    fs1 = MockFieldSet.create_for_test(Address("", target_name="t1"), "==3.9.*")
+    fs2 = MockFieldSet.create_for_test(Address("", target_name="t2"), "==3.9.*")
+    fs3 = MockFieldSet.create_for_test(Address("", target_name="t3"), None)
+
+    ics1 = InterpreterConstraints.create_from_field_sets([fs1], python_setup)
+    ics2 = InterpreterConstraints.create_from_field_sets([fs2], python_setup)
+    assert ics1 == InterpreterConstraints(["CPython==3.9.*"])
+    assert ics1 is ics2
+
+    default_ics = InterpreterConstraints.create_from_field_sets([fs3], python_setup)
+    merged = InterpreterConstraints.merge([ics1, default_ics])
+    assert merged == InterpreterConstraints(["CPython>=3.8,==3.9.*"])
+    assert merged is InterpreterConstraints.merge([default_ics, ics2])
+
+
 def test_group_field_sets_by_constraints_with_unsorted_inputs() -> None:
     py3_fs = [
         MockFieldSet.create_for_test(
@@ -8,8 +8,15 @@ import shlex
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.subsystems.setuptools import PythonDistributionFieldSet
+from pants.backend.python.util_rules import local_dists_pep660
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.backend.python.util_rules.local_dists_pep660 import (
+    LocalDistPEP660Wheels,
+    SandboxedEditableLocalDistRequest,
+    build_sandboxed_editable_local_dist,
+)
 from pants.backend.python.util_rules.pex import Pex, PexRequest, create_pex
 from pants.backend.python.util_rules.pex import rules as pex_rules
 from pants.backend.python.util_rules.pex_requirements import PexRequirements
@@ -113,6 +120,9 @@ class LocalDistsPexRequest:
     # The result will return these with the sources provided by the dists subtracted out.
     # This will help the caller prevent sources from appearing twice on sys.path.
     sources: PythonSourceFiles
+    # Whether the dists are only consumed by Pants processes (tests, runs, repls), in which case
+    # they may be provided as editable installs, see `[python].editable_local_dists`.
+    internal_only: bool
 
     def __init__(
         self,
@@ -120,10 +130,12 @@ class LocalDistsPexRequest:
         *,
         interpreter_constraints: InterpreterConstraints,
         sources: PythonSourceFiles = PythonSourceFiles.empty(),
+        internal_only: bool = False,
     ) -> None:
         object.__setattr__(self, "addresses", Addresses(addresses))
         object.__setattr__(self, "interpreter_constraints", interpreter_constraints)
         object.__setattr__(self, "sources", sources)
+        object.__setattr__(self, "internal_only", internal_only)
 
 
 @dataclass(frozen=True)
@@ -151,6 +163,7 @@ class LocalDistsPex:
 @rule(desc="Building local distributions")
 async def build_local_dists(
     request: LocalDistsPexRequest,
+    python_setup: PythonSetup,
 ) -> LocalDistsPex:
     transitive_targets = await transitive_targets_get(
         TransitiveTargetsRequest(request.addresses), **implicitly()
@@ -159,10 +172,21 @@ async def build_local_dists(
         tgt for tgt in transitive_targets.closure if PythonDistributionFieldSet.is_applicable(tgt)
     ]
 
-    local_dists_wheels = await concurrently(
-        isolate_local_dist_wheels(PythonDistributionFieldSet.create(target), **implicitly())
-        for target in applicable_targets
-    )
+    local_dists_wheels: Iterable[LocalDistWheels | LocalDistPEP660Wheels]
+    # Editable installs only contain the metadata of the dists, so they must never end up in a PEX
+    # that is packaged for use outside of Pants.
+    if python_setup.editable_local_dists and request.internal_only:
+        local_dists_wheels = await concurrently(
+            build_sandboxed_editable_local_dist(
+                SandboxedEditableLocalDistRequest(target.address), **implicitly()
+            )
+            for target in applicable_targets
+        )
+    else:
+        local_dists_wheels = await concurrently(
+            isolate_local_dist_wheels(PythonDistributionFieldSet.create(target), **implicitly())
+            for target in applicable_targets
+        )
 
     # The primary use-case of the "local dists" feature is to support consuming native extensions
     # as wheels without having to publish them first.
@@ -174,8 +198,12 @@ async def build_local_dists(
     wheels: list[str] = []
     wheels_digests = []
     for local_dist_wheels in local_dists_wheels:
-        wheels.extend(local_dist_wheels.wheel_paths)
-        wheels_digests.append(local_dist_wheels.wheels_digest)
+        if isinstance(local_dist_wheels, LocalDistPEP660Wheels):
+            wheels.extend(local_dist_wheels.pep660_wheel_paths)
+            wheels_digests.append(local_dist_wheels.pep660_wheels_digest)
+        else:
+            wheels.extend(local_dist_wheels.wheel_paths)
+            wheels_digests.append(local_dist_wheels.wheels_digest)
         provided_files.update(local_dist_wheels.provided_files)
 
     wheels_digest = await merge_digests(MergeDigests(wheels_digests))
@@ -193,10 +221,11 @@ async def build_local_dists(
         )
     )
 
-    if not wheels:
+    if not provided_files:
         # The source calculations below are not (always) cheap, so we skip them if no wheels were
-        # produced. See https://github.com/pantsbuild/pants/issues/14561 for one possible approach
-        # to sharing the cost of these calculations.
+        # produced, or if they don't provide any sources (e.g. editable wheels). See
+        # https://github.com/pantsbuild/pants/issues/14561 for one possible approach to sharing
+        # the cost of these calculations.
         return LocalDistsPex(dists_pex, request.sources)
 
     # We check source roots in reverse lexicographic order,
@@ -228,6 +257,7 @@ async def build_local_dists(
 def rules():
     return (
         *collect_rules(),
+        *local_dists_pep660.rules(),
         *pex_rules(),
         *system_binaries.rules(),
     )
@@ -136,6 +136,19 @@ async def run_pep660_build(
             build_root.path if source_root == "." else str(build_root.pathlib_path / source_root)
         )
         pth_file_contents += f"{abs_path}\n"
+
+    return await _build_pep660_wheel(
+        request, python_setup, pth_file_contents=pth_file_contents, direct_url=direct_url
+    )
+
+
+async def _build_pep660_wheel(
+    request: DistBuildRequest,
+    python_setup: PythonSetup,
+    *,
+    pth_file_contents: str,
+    direct_url: str,
+) -> PEP660BuildResult:
     pth_file_name = "__pants__.pth"
     pth_file_path = os.path.join(request.working_directory, pth_file_name)
 
@@ -309,6 +322,49 @@ async def isolate_local_dist_pep660_wheels(
     return LocalDistPEP660Wheels(wheels, wheels_snapshot.digest, frozenset(sorted(provided_files)))
 
 
+@dataclass(frozen=True)
+class SandboxedEditableLocalDistRequest:
+    """Request to generate a PEP 660 wheel of a local dist for use in a sandboxed process.
+
+    Unlike the editable wheels used by `export`, the .pth file in this wheel is empty rather than
+    pointing into the build root: the process consuming it already has the dist's sources on its
+    sys.path, so the wheel only contributes the dist's metadata (version, entry points, etc.).
+    This keeps the wheel hermetic, and means it is never rebuilt for changes that don't affect
+    the dist's metadata.
+    """
+
+    address: Address
+
+
+@rule
+async def build_sandboxed_editable_local_dist(
+    request: SandboxedEditableLocalDistRequest,
+    python_setup: PythonSetup,
+    union_membership: UnionMembership,
+) -> LocalDistPEP660Wheels:
+    dist_build_request = await create_dist_build_request(
+        dist_target_address=request.address,
+        python_setup=python_setup,
+        union_membership=union_membership,
+        # editable wheel ignores build_wheel+build_sdist args
+        validate_wheel_sdist=False,
+    )
+    pep660_result = await _build_pep660_wheel(
+        dist_build_request,
+        python_setup,
+        pth_file_contents="",
+        direct_url=f"file:{dist_build_request.dist_source_root}",
+    )
+    wheels_snapshot = await digest_to_snapshot(
+        **implicitly(DigestSubset(pep660_result.output, PathGlobs(["**/*.whl"])))
+    )
+    # The wheel doesn't provide any of the dist's sources, so none of them need to be subtracted
+    # from the sandbox.
+    return LocalDistPEP660Wheels(
+        tuple(sorted(wheels_snapshot.files)), wheels_snapshot.digest, frozenset()
+    )
+
+
 @dataclass(frozen=True)
 class AllPythonDistributionTargets:
     targets: Targets
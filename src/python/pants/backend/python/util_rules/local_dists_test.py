@@ -44,7 +44,9 @@ def rule_runner() -> PythonRuleRunner:
     )
 
 
-def test_build_local_dists(rule_runner: PythonRuleRunner) -> None:
+def create_local_dists_request(
+    rule_runner: PythonRuleRunner, *options: str, internal_only: bool = False
+) -> LocalDistsPexRequest:
     foo = PurePath("foo")
     rule_runner.write_files(
         {
@@ -71,7 +73,7 @@ def test_build_local_dists(rule_runner: PythonRuleRunner) -> None:
             ),
         }
     )
-    rule_runner.set_options([], env_inherit={"PATH"})
+    rule_runner.set_options(options, env_inherit={"PATH"})
     sources_digest = rule_runner.request(
         Digest,
         [
@@ -86,11 +88,25 @@ def test_build_local_dists(rule_runner: PythonRuleRunner) -> None:
     interpreter_constraints = rule_runner.request(
         InterpreterConstraints, [InterpreterConstraintsRequest(addresses)]
     )
-    request = LocalDistsPexRequest(
+    return LocalDistsPexRequest(
         addresses,
         sources=sources,
         interpreter_constraints=interpreter_constraints,
+        internal_only=internal_only,
     )
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        pytest.param([], id="default"),
+        # Dists which are not internal only are always built, since they may be used without their
+        # sources.
+        pytest.param(["--python-editable-local-dists"], id="editable_not_internal_only"),
+    ],
+)
+def test_build_local_dists(rule_runner: PythonRuleRunner, options: list[str]) -> None:
+    request = create_local_dists_request(rule_runner, *options)
     result = rule_runner.request(LocalDistsPex, [request])
 
     assert result.pex is not None
@@ -106,3 +122,29 @@ def test_build_local_dists(rule_runner: PythonRuleRunner) -> None:
 
     # Check that srcroot/foo/bar.py was subtracted out, because the dist provides foo/bar.py.
     assert result.remaining_sources.source_files.files == ("srcroot/foo/qux.py",)
+
+
+def test_build_editable_local_dists(rule_runner: PythonRuleRunner) -> None:
+    request = create_local_dists_request(
+        rule_runner, "--python-editable-local-dists", internal_only=True
+    )
+    result = rule_runner.request(LocalDistsPex, [request])
+
+    contents = rule_runner.request(DigestContents, [result.pex.digest])
+    whl_contents = [
+        content
+        for content in contents
+        if content.path.startswith("local_dists.pex/.deps/") and content.path.endswith(".whl")
+    ]
+    assert [content.path for content in whl_contents] == [
+        "local_dists.pex/.deps/foo-9.8.7-0.editable-py3-none-any.whl"
+    ]
+    with io.BytesIO(whl_contents[0].content) as fp:
+        with zipfile.ZipFile(fp, "r") as whl:
+            names = whl.namelist()
+            assert "foo-9.8.7.dist-info/METADATA" in names
+            assert "foo/bar.py" not in names
+            assert whl.read("foo__pants__.pth") == b""
+
+    # The editable wheel doesn't provide any sources, so they are all used from the sandbox.
+    assert result.remaining_sources == request.sources
@@ -4,19 +4,26 @@
 from __future__ import annotations
 
 import itertools
+import math
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from typing import TypeVar
 
 from pants.backend.python.subsystems.setup import PythonSetup
-from pants.backend.python.target_types import InterpreterConstraintsField, PythonResolveField
+from pants.backend.python.target_types import (
+    InterpreterConstraintsField,
+    PythonRequirementsField,
+    PythonResolveField,
+)
 from pants.backend.python.util_rules.interpreter_constraints import (
     FieldSetWithInterpreterConstraints,
     InterpreterConstraints,
 )
+from pants.engine.internals import native_engine
 from pants.engine.internals.graph import find_all_targets
 from pants.engine.rules import implicitly
-from pants.engine.target import FieldSet
+from pants.engine.target import CoarsenedTarget, FieldSet
+from pants.option.errors import OptionsError
 from pants.util.ordered_set import OrderedSet
 
 ResolveName = str
@@ -44,6 +51,103 @@ def _partition_by_interpreter_constraints_and_resolve(
     return resolve_and_interpreter_constraints_to_field_sets
 
 
+def _is_third_party(ct: CoarsenedTarget) -> bool:
+    return any(tgt.has_field(PythonRequirementsField) for tgt in ct.members)
+
+
+def _validate_partition_size(partition_size: int | None, *, options_scope: str) -> int | None:
+    """Validate the `partition_size` option of a tool, which is passed to
+    `_partition_by_dependency_closure` as its `size_target`."""
+    if partition_size is not None and partition_size < 1:
+        raise OptionsError(
+            f"The `[{options_scope}].partition_size` option must be at least 1, but was set to "
+            f"{partition_size}."
+        )
+    return partition_size
+
+
+def _partition_by_dependency_closure(
+    roots: Iterable[CoarsenedTarget], *, size_target: int
+) -> list[list[CoarsenedTarget]]:
+    """Split the given roots into batches of at most `size_target` roots.
+
+    Roots whose transitive dependency closures overlap are clustered together, so that each batch
+    shares as little of its closure with the other batches as possible, which minimizes the work
+    duplicated by running a tool over each batch independently. Third-party requirements and
+    targets without dependencies are cheap to duplicate, and are often depended on by most roots,
+    so they do not join clusters. A cluster also stops growing at `size_target` roots, so that a
+    widely used first-party module does not join all of the roots into a single cluster.
+
+    Clusters are packed into batches at stable boundaries, in the same way as
+    `partition_sequentially`, so that adding or removing a root usually only changes its own batch.
+    The result does not depend on the order of `roots`.
+    """
+    if size_target < 1:
+        raise ValueError(f"The size target must be at least 1, but was {size_target}.")
+    roots = sorted(roots, key=lambda root: root.representative.address.spec)
+    if len(roots) <= size_target:
+        return [roots] if roots else []
+
+    # Union-find over the indexes of `roots`: two roots are in the same cluster if their closures
+    # share any CoarsenedTarget, unless that would grow the cluster past `size_target`. Each
+    # CoarsenedTarget is expanded at most once, because anything reachable from an already-owned
+    # node was already claimed by the root that owns it.
+    parents = list(range(len(roots)))
+    sizes = [1] * len(roots)
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        i, j = find(i), find(j)
+        if i != j and sizes[i] + sizes[j] <= size_target:
+            parents[j] = i
+            sizes[i] += sizes[j]
+
+    owners: dict[CoarsenedTarget, int] = {}
+    for i, root in enumerate(roots):
+        queue = [root]
+        while queue:
+            ct = queue.pop()
+            if ct is not root and (not ct.dependencies or _is_third_party(ct)):
+                continue
+            owner = owners.get(ct)
+            if owner is not None:
+                union(owner, i)
+                continue
+            owners[ct] = i
+            queue.extend(ct.dependencies)
+
+    clusters: dict[int, list[CoarsenedTarget]] = defaultdict(list)
+    for i, root in enumerate(roots):
+        clusters[find(i)].append(root)
+
+    # As in `partition_sequentially`, a batch ends after a root whose key hashes to a boundary,
+    # which happens every `size_target` roots on average. Here the batch ends after the cluster
+    # that contains such a root, or before a cluster which would not fit into it.
+    zero_prefix_threshold = math.log(size_target, 2)
+    batches: list[list[CoarsenedTarget]] = []
+    batch: list[CoarsenedTarget] = []
+    for cluster in clusters.values():
+        if batch and len(batch) + len(cluster) > size_target:
+            batches.append(batch)
+            batch = []
+        batch.extend(cluster)
+        if any(
+            native_engine.hash_prefix_zero_bits(root.representative.address.spec)
+            >= zero_prefix_threshold
+            for root in cluster
+        ):
+            batches.append(batch)
+            batch = []
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 async def _find_all_unique_interpreter_constraints(
     python_setup: PythonSetup,
     field_set_type: type[FieldSet],
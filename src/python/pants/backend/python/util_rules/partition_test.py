@@ -6,19 +6,27 @@ from __future__ import annotations
 from dataclasses import dataclass
 from textwrap import dedent
 
+import pytest
+
 from pants.backend.python import target_types_rules
 from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.target_types import (
     InterpreterConstraintsField,
+    PythonRequirementTarget,
     PythonSourceField,
     PythonSourcesGeneratorTarget,
 )
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
-from pants.backend.python.util_rules.partition import _find_all_unique_interpreter_constraints
+from pants.backend.python.util_rules.partition import (
+    _find_all_unique_interpreter_constraints,
+    _partition_by_dependency_closure,
+    _validate_partition_size,
+)
 from pants.build_graph.address import Address
 from pants.core.target_types import GenericTarget
 from pants.engine.rules import QueryRule, rule
-from pants.engine.target import FieldSet, Target
+from pants.engine.target import CoarsenedTarget, FieldSet, Target
+from pants.option.errors import OptionsError
 from pants.testutil.rule_runner import RuleRunner
 
 
@@ -143,3 +151,61 @@ def test_find_unique_interpreter_constraints() -> None:
         include_extra_fields=True,
         expected=[f"{extra_fields_ic},==2.7.*", f"{extra_fields_ic},==3.5.*"],
     )
+
+
+def test_partition_by_dependency_closure() -> None:
+    def ct(name: str, *deps: CoarsenedTarget) -> CoarsenedTarget:
+        return CoarsenedTarget([GenericTarget({}, Address("", target_name=name))], deps)
+
+    def req(name: str) -> CoarsenedTarget:
+        return CoarsenedTarget(
+            [PythonRequirementTarget({"requirements": [name]}, Address("", target_name=name))], ()
+        )
+
+    def partition(roots: list[CoarsenedTarget], size_target: int) -> list[list[str]]:
+        batches = _partition_by_dependency_closure(roots, size_target=size_target)
+        assert batches == _partition_by_dependency_closure(reversed(roots), size_target=size_target)
+        assert all(len(batch) <= size_target for batch in batches)
+        assert sorted(str(root) for batch in batches for root in batch) == sorted(map(str, roots))
+        return [[str(root) for root in batch] for batch in batches]
+
+    leaf = ct("leaf")
+    requests = req("requests")
+    lib = ct("lib", leaf, requests)
+    a = ct("a", lib)
+    b = ct("b", lib)
+    c = ct("c", leaf, requests)
+    d = ct("d", c)
+    e = ct("e", leaf, requests)
+
+    # Everything fits into a single batch.
+    assert partition([a, b, c], size_target=3) == [["//:a", "//:b", "//:c"]]
+    assert partition([], size_target=3) == []
+
+    # Roots which share a first-party dependency are kept together, as well as a root which is in
+    # the closure of another root. Requirements and leaves do not join clusters.
+    assert partition([e, c, b, d, a], size_target=2) == [
+        ["//:a", "//:b"],
+        ["//:c", "//:d"],
+        ["//:e"],
+    ]
+
+    # Clusters stop growing at the size target.
+    x = ct("x", lib)
+    assert partition([a, b, x, c, d], size_target=2) == [
+        ["//:a", "//:b"],
+        ["//:c", "//:d"],
+        ["//:x"],
+    ]
+
+    with pytest.raises(ValueError):
+        _partition_by_dependency_closure([a, b], size_target=0)
+
+
+def test_validate_partition_size() -> None:
+    assert _validate_partition_size(None, options_scope="mypy") is None
+    assert _validate_partition_size(1, options_scope="mypy") == 1
+    with pytest.raises(
+        OptionsError, match=r"`\[pylint\].partition_size` option must be at least 1"
+    ):
+        _validate_partition_size(0, options_scope="pylint")
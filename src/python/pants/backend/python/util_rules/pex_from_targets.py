@@ -729,7 +729,9 @@ async def create_pex_from_targets(
                 request.addresses,
                 interpreter_constraints=interpreter_constraints,
                 sources=sources,
-            )
+                internal_only=request.internal_only,
+            ),
+            **implicitly(),
         )
         remaining_sources = local_dists.remaining_sources
         additional_inputs_digests.append(local_dists.pex.digest)
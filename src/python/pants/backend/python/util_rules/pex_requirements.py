@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
+from packaging.utils import canonicalize_name
+
 from pants.backend.python.subsystems.repos import PythonRepos
 from pants.backend.python.subsystems.setup import InvalidLockfileBehavior, PythonSetup
 from pants.backend.python.target_types import PythonRequirementsField
@@ -38,6 +40,7 @@ from pants.engine.intrinsics import (
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.unions import UnionMembership
 from pants.util.docutil import bin_name, doc_url
+from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.pip_requirement import PipRequirement
 from pants.util.requirements import parse_requirements_file
@@ -291,6 +294,82 @@ async def load_lockfile(
     )
 
 
+@dataclass(frozen=True)
+class LockedRequirement:
+    """A single project pinned by one of the locked resolves of a PEX-native lockfile."""
+
+    project_name: str
+    version: str
+
+
+@dataclass(frozen=True)
+class PexLockfileIndex:
+    """An index of the locked requirements of a PEX-native lockfile, by project name.
+
+    PEX lockfiles can be many megabytes of JSON, of which Pants only needs a small part. Rather
+    than parsing (and freezing) the whole document wherever it is consumed, request this type via
+    `PexLockfileIndexRequest` so that it is computed once per lockfile digest, and only the
+    projects and their versions are retained.
+    """
+
+    # Keyed by canonicalized project name. A project has an entry per locked resolve that pins it.
+    locked_requirements: FrozenDict[str, tuple[LockedRequirement, ...]]
+
+    @classmethod
+    def parse(cls, lockfile_bytes: bytes, description_of_origin: str) -> PexLockfileIndex:
+        """Parse the given PEX-native lockfile content, which may have a Pants header.
+
+        Content which is not a valid PEX lockfile results in an empty index.
+        """
+        try:
+            lockfile_data = json.loads(strip_comments_from_pex_json_lockfile(lockfile_bytes))
+            locked_requirements: dict[str, list[LockedRequirement]] = {}
+            for resolve in lockfile_data["locked_resolves"]:
+                for requirement in resolve["locked_requirements"]:
+                    locked_requirements.setdefault(
+                        canonicalize_name(requirement["project_name"]), []
+                    ).append(
+                        LockedRequirement(
+                            project_name=requirement["project_name"],
+                            version=requirement["version"],
+                        )
+                    )
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            logger.debug(f"{description_of_origin}: Failed to parse lockfile: {e!r}")
+            return cls(FrozenDict())
+        return cls(
+            FrozenDict({name: tuple(reqs) for name, reqs in sorted(locked_requirements.items())})
+        )
+
+    def __len__(self) -> int:
+        return len(self.locked_requirements)
+
+    def versions(self, project_name: str) -> tuple[str, ...]:
+        """The locked versions of the given project, which is empty if it is not locked."""
+        return tuple(
+            FrozenOrderedSet(
+                req.version
+                for req in self.locked_requirements.get(canonicalize_name(project_name), ())
+            )
+        )
+
+
+@dataclass(frozen=True)
+class PexLockfileIndexRequest:
+    lockfile_digest: Digest
+    lockfile_path: str
+    description_of_origin: str = field(default="", compare=False)
+
+
+@rule
+async def index_pex_lockfile(request: PexLockfileIndexRequest) -> PexLockfileIndex:
+    digest_contents = await get_digest_contents(request.lockfile_digest)
+    lockfile_bytes = next(fc.content for fc in digest_contents if fc.path == request.lockfile_path)
+    return PexLockfileIndex.parse(
+        lockfile_bytes, request.description_of_origin or request.lockfile_path
+    )
+
+
 @dataclass(frozen=True)
 class EntireLockfile:
     """A request to resolve the entire contents of a lockfile.
@@ -14,6 +14,7 @@ from pants.backend.python.util_rules.interpreter_constraints import InterpreterC
 from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadataV3
 from pants.backend.python.util_rules.pex_requirements import (
     Lockfile,
+    PexLockfileIndex,
     ResolvePexConfig,
     ResolvePexConstraintsFile,
     _pex_lockfile_requirement_count,
@@ -425,3 +426,44 @@ class TestResolvePexConfigPexArgs:
 
         assert "--wheel" in self.simple_config_args(no_binary=["foo", ":none:"])
         assert "--only-build" not in " ".join(self.simple_config_args(no_binary=["foo", ":none:"]))
+
+
+def test_pex_lockfile_index() -> None:
+    def locked_requirement(project_name: str, version: str) -> dict:
+        url = f"https://a/{project_name}-{version}"
+        return {
+            "artifacts": [
+                {"algorithm": "sha256", "hash": "abc", "url": f"{url}.whl"},
+                {"algorithm": "sha256", "hash": "def", "url": f"{url}.tar.gz"},
+            ],
+            "project_name": project_name,
+            "requires_dists": [],
+            "requires_python": None,
+            "version": version,
+        }
+
+    lockfile = {
+        "locked_resolves": [
+            {
+                "locked_requirements": [
+                    locked_requirement("Ansi_Colors", "1.1.8"),
+                    locked_requirement("requests", "2.31.0"),
+                ],
+                "platform_tag": None,
+            },
+            {
+                "locked_requirements": [locked_requirement("ansi-colors", "1.1.7")],
+                "platform_tag": None,
+            },
+        ],
+    }
+    index = PexLockfileIndex.parse(
+        f"// a header\n{json.dumps(lockfile, indent=2)}".encode(), "test"
+    )
+    assert len(index) == 2
+    assert index.versions("ansi.colors") == ("1.1.8", "1.1.7")
+    assert index.versions("requests") == ("2.31.0",)
+    assert index.versions("missing") == ()
+
+    assert len(PexLockfileIndex.parse(b"cheesey==10.0", "test")) == 0
+    assert len(PexLockfileIndex.parse(b"{}", "test")) == 0
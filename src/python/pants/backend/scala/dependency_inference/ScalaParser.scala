@@ -567,14 +567,20 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
+  // Usage: ScalaParser <output path> <scala version> <source3> <source path>...
+  //
+  // Writes a JSON object mapping each source path to its analysis, so that a batch of sources
+  // can be analyzed by a single JVM.
   def main(args: Array[String]): Unit = {
     val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
-
-    val json = analysis.asJson.noSpaces
+    val scalaVersion = args(1)
+    val source3 = args(2).toBoolean
+    val analyses = args
+      .drop(3)
+      .map(pathStr => pathStr -> analyze(pathStr, scalaVersion, source3))
+      .toMap
+
+    val json = analyses.asJson.noSpaces
     java.nio.file.Files.write(
       outputPath,
       json.getBytes(),
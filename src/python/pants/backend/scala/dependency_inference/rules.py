@@ -9,6 +9,7 @@ from pants.backend.scala.dependency_inference import scala_parser, symbol_mapper
 from pants.backend.scala.dependency_inference.scala_parser import (
     resolve_fallible_result_to_analysis,
 )
+from pants.backend.scala.dependency_inference.symbol_mapper import AllScalaSourceAnalyses
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
 from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
 from pants.backend.scala.target_types import ScalaDependenciesField, ScalaSourceField
@@ -58,19 +59,28 @@ async def infer_scala_dependencies_via_source_analysis(
     scala_infer_subsystem: ScalaInferSubsystem,
     jvm: JvmSubsystem,
     symbol_mapping: SymbolMapping,
+    all_analyses: AllScalaSourceAnalyses,
 ) -> InferredDependencies:
     if not scala_infer_subsystem.imports:
         return InferredDependencies([])
 
     address = request.field_set.address
-    explicitly_provided_deps, analysis = await concurrently(
-        determine_explicitly_provided_dependencies(
+    # The symbol mapping already required analyzing every Scala source in batches, so reuse
+    # that analysis, and only analyze the source individually if it was not covered.
+    analysis = all_analyses.get(address)
+    if analysis is None:
+        explicitly_provided_deps, analysis = await concurrently(
+            determine_explicitly_provided_dependencies(
+                **implicitly(DependenciesRequest(request.field_set.dependencies))
+            ),
+            resolve_fallible_result_to_analysis(
+                **implicitly(SourceFilesRequest([request.field_set.source]))
+            ),
+        )
+    else:
+        explicitly_provided_deps = await determine_explicitly_provided_dependencies(
             **implicitly(DependenciesRequest(request.field_set.dependencies))
-        ),
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([request.field_set.source]))
-        ),
-    )
+        )
 
     symbols: OrderedSet[str] = OrderedSet()
     if scala_infer_subsystem.imports:
@@ -12,6 +12,7 @@ from pants.backend.scala.dependency_inference.rules import (
     ScalaSourceDependenciesInferenceFieldSet,
 )
 from pants.backend.scala.dependency_inference.rules import rules as dep_inference_rules
+from pants.backend.scala.dependency_inference.symbol_mapper import AllScalaSourceAnalyses
 from pants.backend.scala.target_types import ScalaSourcesGeneratorTarget
 from pants.backend.scala.target_types import rules as scala_target_rules
 from pants.core.util_rules import config_files, source_files
@@ -44,6 +45,7 @@ def rule_runner() -> RuleRunner:
             *util_rules(),
             *jdk_rules(),
             QueryRule(Addresses, [DependenciesRequest]),
+            QueryRule(AllScalaSourceAnalyses, []),
             QueryRule(ExplicitlyProvidedDependencies, [DependenciesRequest]),
             QueryRule(InferredDependencies, [InferScalaSourceDependencies]),
             QueryRule(Targets, [UnparsedAddressInputs]),
@@ -367,6 +369,46 @@ def test_multi_resolve_dependency_inference(rule_runner: RuleRunner) -> None:
     )
 
 
+@maybe_skip_jdk_test
+def test_batch_analysis_of_parametrized_resolves(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "lib/BUILD": dedent(
+                """\
+            scala_sources(resolve=parametrize("scala-2.13", "scala-2.12", "other-2.13"))
+            """
+            ),
+            "lib/Library.scala": dedent(
+                """\
+            package org.pantsbuild.lib
+
+            object Library
+            """
+            ),
+        }
+    )
+    rule_runner.set_options(
+        [
+            '--jvm-resolves={"scala-2.13":"2.13.lock", "scala-2.12":"2.12.lock", "other-2.13":"other.lock"}',
+            '--scala-version-for-resolve={"scala-2.13":"2.13.8", "scala-2.12":"2.12.15", "other-2.13":"2.13.8"}',
+        ],
+        env_inherit=PYTHON_BOOTSTRAP_ENV,
+    )
+
+    # Every target owning the file gets an analysis, including the two whose resolves share a
+    # dialect, and so share a single analysis of the file.
+    analyses = rule_runner.request(AllScalaSourceAnalyses, [])
+    addresses = [
+        Address("lib", relative_file_path="Library.scala", parameters={"resolve": resolve})
+        for resolve in ("scala-2.13", "scala-2.12", "other-2.13")
+    ]
+    assert sorted(analyses) == sorted(addresses)
+    for address in addresses:
+        assert [symbol.name for symbol in analyses[address].provided_symbols] == [
+            "org.pantsbuild.lib.Library"
+        ]
+
+
 @maybe_skip_jdk_test
 def test_recursive_objects(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
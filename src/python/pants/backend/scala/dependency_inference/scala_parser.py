@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -26,6 +26,7 @@ from pants.core.util_rules.source_files import (
 from pants.engine.fs import (
     AddPrefix,
     CreateDigest,
+    Digest,
     Directory,
     FileContent,
     MergeDigests,
@@ -58,10 +59,12 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspathRequest, materialize_c
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.option.option_types import IntOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.resources import read_resource
+from pants.util.strutil import pluralize, softwrap
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +89,21 @@ class ScalaParser(JvmToolBase):
         "scala_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=128,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum number of Scala source files to analyze in a single parser process when
+            computing the first-party symbol mapping.
+
+            Larger batches amortize the startup cost of the parser over more files, but a change
+            to any file in a batch causes the whole batch to be re-analyzed. Set to 1 to analyze
+            each file in its own process.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class ScalaImport:
@@ -296,33 +314,28 @@ async def create_analyze_scala_source_request(
     return AnalyzeScalaSourceRequest(source_files, scala_version, source3)
 
 
-@rule(level=LogLevel.DEBUG)
-async def analyze_scala_source_dependencies(
+_SOURCE_PREFIX = "__source_to_analyze"
+_ANALYSIS_OUTPUT_PATH = "__source_analysis.json"
+
+
+async def _scala_parser_process(
     jdk: InternalJdk,
     processor_classfiles: ScalaParserCompiledClassfiles,
     tool: ScalaParser,
-    request: AnalyzeScalaSourceRequest,
-) -> FallibleScalaSourceDependencyAnalysisResult:
-    source_files = request.source_files
-
-    if len(source_files.files) > 1:
-        raise ValueError(
-            f"analyze_scala_source_dependencies expects sources with exactly 1 source file, but found {len(source_files.snapshot.files)}."
-        )
-    elif len(source_files.files) == 0:
-        raise ValueError(
-            "analyze_scala_source_dependencies expects sources with exactly 1 source file, but found none."
-        )
-    source_prefix = "__source_to_analyze"
-    source_path = os.path.join(source_prefix, source_files.files[0])
+    sources_digest: Digest,
+    files: Iterable[str],
+    scala_version: ScalaVersion,
+    source3: bool,
+    description: str,
+) -> JvmProcess:
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
-    tool_classpath, prefixed_source_files_digest = await concurrently(
+    tool_classpath, prefixed_sources_digest = await concurrently(
         materialize_classpath_for_tool(
             ToolClasspathRequest(lockfile=GenerateJvmLockfileFromTool.create(tool))
         ),
-        add_prefix(AddPrefix(source_files.snapshot.digest, source_prefix)),
+        add_prefix(AddPrefix(sources_digest, _SOURCE_PREFIX)),
     )
 
     extra_immutable_input_digests = {
@@ -330,32 +343,57 @@ async def analyze_scala_source_dependencies(
         processorcp_relpath: processor_classfiles.digest,
     }
 
-    analysis_output_path = "__source_analysis.json"
+    return JvmProcess(
+        jdk=jdk,
+        classpath_entries=[
+            *tool_classpath.classpath_entries(toolcp_relpath),
+            processorcp_relpath,
+        ],
+        argv=[
+            "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
+            _ANALYSIS_OUTPUT_PATH,
+            str(scala_version),
+            str(source3),
+            *(os.path.join(_SOURCE_PREFIX, file) for file in files),
+        ],
+        input_digest=prefixed_sources_digest,
+        extra_immutable_input_digests=extra_immutable_input_digests,
+        output_files=(_ANALYSIS_OUTPUT_PATH,),
+        extra_nailgun_keys=extra_immutable_input_digests,
+        description=description,
+        level=LogLevel.DEBUG,
+    )
 
-    process_result = await execute_process(
-        **implicitly(
-            JvmProcess(
-                jdk=jdk,
-                classpath_entries=[
-                    *tool_classpath.classpath_entries(toolcp_relpath),
-                    processorcp_relpath,
-                ],
-                argv=[
-                    "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
-                    analysis_output_path,
-                    source_path,
-                    str(request.scala_version),
-                    str(request.source3),
-                ],
-                input_digest=prefixed_source_files_digest,
-                extra_immutable_input_digests=extra_immutable_input_digests,
-                output_files=(analysis_output_path,),
-                extra_nailgun_keys=extra_immutable_input_digests,
-                description=f"Analyzing {source_files.files[0]}",
-                level=LogLevel.DEBUG,
-            )
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    request: AnalyzeScalaSourceRequest,
+) -> FallibleScalaSourceDependencyAnalysisResult:
+    source_files = request.source_files
+
+    if len(source_files.files) > 1:
+        raise ValueError(
+            f"analyze_scala_source_dependencies expects sources with exactly 1 source file, but found {len(source_files.snapshot.files)}."
+        )
+    elif len(source_files.files) == 0:
+        raise ValueError(
+            "analyze_scala_source_dependencies expects sources with exactly 1 source file, but found none."
         )
+
+    process = await _scala_parser_process(
+        jdk,
+        processor_classfiles,
+        tool,
+        source_files.snapshot.digest,
+        source_files.files,
+        request.scala_version,
+        request.source3,
+        description=f"Analyzing {source_files.files[0]}",
     )
+    process_result = await execute_process(**implicitly(process))
 
     return FallibleScalaSourceDependencyAnalysisResult(process_result=process_result)
 
@@ -374,10 +412,53 @@ async def resolve_fallible_result_to_analysis(
         )
     )
     analysis_contents = await get_digest_contents(result.output_digest)
-    analysis = json.loads(analysis_contents[0].content)
+    (analysis,) = json.loads(analysis_contents[0].content).values()
     return ScalaSourceDependencyAnalysis.from_json_dict(analysis)
 
 
+@dataclass(frozen=True)
+class AnalyzeScalaSourcesRequest:
+    """Analyze a batch of Scala source files, which share a dialect, in one parser process."""
+
+    sources_digest: Digest
+    files: tuple[str, ...]
+    scala_version: ScalaVersion
+    source3: bool
+
+
+class ScalaSourceDependencyAnalyses(FrozenDict[str, ScalaSourceDependencyAnalysis]):
+    """The analysis of a batch of Scala source files, by file path."""
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_sources_dependencies(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    request: AnalyzeScalaSourcesRequest,
+) -> ScalaSourceDependencyAnalyses:
+    process = await _scala_parser_process(
+        jdk,
+        processor_classfiles,
+        tool,
+        request.sources_digest,
+        request.files,
+        request.scala_version,
+        request.source3,
+        description=f"Analyzing {pluralize(len(request.files), 'Scala source')}",
+    )
+    result = await execute_process_or_raise(**implicitly(process))
+    analysis_contents = await get_digest_contents(result.output_digest)
+    analyses = json.loads(analysis_contents[0].content)
+    return ScalaSourceDependencyAnalyses(
+        (
+            os.path.relpath(path, _SOURCE_PREFIX),
+            ScalaSourceDependencyAnalysis.from_json_dict(analysis),
+        )
+        for path, analysis in analyses.items()
+    )
+
+
 # TODO(13879): Consolidate compilation of wrapper binaries to common rules.
 @rule
 async def setup_scala_parser_classfiles(
@@ -8,16 +8,20 @@ from pants.backend.scala import target_types
 from pants.backend.scala.dependency_inference import scala_parser
 from pants.backend.scala.dependency_inference.scala_parser import (
     AnalyzeScalaSourceRequest,
+    AnalyzeScalaSourcesRequest,
     ScalaImport,
     ScalaProvidedSymbol,
+    ScalaSourceDependencyAnalyses,
     ScalaSourceDependencyAnalysis,
 )
 from pants.backend.scala.target_types import ScalaSourceField, ScalaSourceTarget
 from pants.backend.scala.util_rules import versions
+from pants.backend.scala.util_rules.versions import ScalaVersion
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.engine import process
+from pants.engine.fs import PathGlobs, Snapshot
 from pants.engine.target import SourcesField
 from pants.jvm import jdk_rules
 from pants.jvm import util_rules as jvm_util_rules
@@ -41,6 +45,7 @@ def rule_runner() -> RuleRunner:
             *versions.rules(),
             QueryRule(AnalyzeScalaSourceRequest, (SourceFilesRequest,)),
             QueryRule(ScalaSourceDependencyAnalysis, (AnalyzeScalaSourceRequest,)),
+            QueryRule(ScalaSourceDependencyAnalyses, (AnalyzeScalaSourcesRequest,)),
         ],
         target_types=[ScalaSourceTarget],
     )
@@ -383,6 +388,48 @@ def test_parser_simple(rule_runner: RuleRunner) -> None:
     }
 
 
+def test_analyze_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/A.scala": textwrap.dedent(
+                """\
+                package org.pantsbuild.a
+
+                import org.pantsbuild.b.B
+
+                class A extends B
+                """
+            ),
+            "src/B.scala": textwrap.dedent(
+                """\
+                package org.pantsbuild.b
+
+                class B
+                """
+            ),
+        }
+    )
+    snapshot = rule_runner.request(Snapshot, [PathGlobs(["src/*.scala"])])
+
+    analyses = rule_runner.request(
+        ScalaSourceDependencyAnalyses,
+        [
+            AnalyzeScalaSourcesRequest(
+                sources_digest=snapshot.digest,
+                files=snapshot.files,
+                scala_version=ScalaVersion.parse("2.13.8"),
+                source3=False,
+            )
+        ],
+    )
+
+    assert sorted(analyses) == ["src/A.scala", "src/B.scala"]
+    assert list(analyses["src/A.scala"].all_imports()) == ["org.pantsbuild.b.B"]
+    assert [symbol.name for symbol in analyses["src/B.scala"].provided_symbols] == [
+        "org.pantsbuild.b.B"
+    ]
+
+
 def test_extract_package_scopes(rule_runner: RuleRunner) -> None:
     analysis = _analyze(
         rule_runner,
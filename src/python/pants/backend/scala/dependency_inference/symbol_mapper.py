@@ -4,14 +4,23 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Mapping
+from operator import itemgetter
 
 from pants.backend.scala.dependency_inference.scala_parser import (
-    resolve_fallible_result_to_analysis,
+    AnalyzeScalaSourcesRequest,
+    ScalaParser,
+    ScalaSourceDependencyAnalysis,
+    analyze_scala_sources_dependencies,
 )
+from pants.backend.scala.subsystems.scala import ScalaSubsystem
+from pants.backend.scala.subsystems.scalac import Scalac
 from pants.backend.scala.target_types import ScalaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.backend.scala.util_rules.versions import ScalaVersion
+from pants.core.util_rules.source_files import SourceFilesRequest, determine_source_files
 from pants.engine.addresses import Address
+from pants.engine.fs import Digest, MergeDigests
 from pants.engine.internals.selectors import concurrently
+from pants.engine.intrinsics import merge_digests
 from pants.engine.rules import collect_rules, implicitly, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -24,6 +33,8 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.collections import partition_sequentially
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -42,6 +53,78 @@ async def find_all_scala_targets(targets: AllTargets) -> AllScalaTargets:
     return AllScalaTargets(tgt for tgt in targets if tgt.has_field(ScalaSourceField))
 
 
+# The Scala version and whether `-Xsource:3` is set.
+_ScalaDialect = tuple[ScalaVersion, bool]
+
+
+class AllScalaSourceAnalyses(FrozenDict[Address, ScalaSourceDependencyAnalysis]):
+    """The source analysis of every Scala target in the project, by address."""
+
+
+@rule(desc="Analyze all Scala sources in project", level=LogLevel.DEBUG)
+async def analyze_all_scala_sources(
+    scala_targets: AllScalaTargets,
+    jvm: JvmSubsystem,
+    scala_subsystem: ScalaSubsystem,
+    scalac: Scalac,
+    scala_parser: ScalaParser,
+) -> AllScalaSourceAnalyses:
+    all_source_files = await concurrently(
+        determine_source_files(SourceFilesRequest([tgt[ScalaSourceField]])) for tgt in scala_targets
+    )
+
+    # Sources may only be parsed together if they share a Scala dialect, which is determined by
+    # the Scala version and `-Xsource:3` flag of their resolve. A file may be owned by several
+    # targets (e.g. with a parametrized resolve), so it is analyzed once per dialect, and the
+    # analysis is provided to each of the targets owning it in that dialect.
+    files_by_dialect: dict[_ScalaDialect, dict[str, Digest]] = defaultdict(dict)
+    addresses_by_file: dict[tuple[_ScalaDialect, str], list[Address]] = defaultdict(list)
+    for tgt, source_files in zip(scala_targets, all_source_files):
+        if len(source_files.files) != 1:
+            continue
+        file = source_files.files[0]
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
+        dialect = (
+            scala_subsystem.version_for_resolve(resolve),
+            "-Xsource:3" in scalac.parsed_args_for_resolve(resolve),
+        )
+        files_by_dialect[dialect][file] = source_files.snapshot.digest
+        addresses_by_file[(dialect, file)].append(tgt.address)
+
+    batches = [
+        (dialect, batch)
+        for dialect, files in files_by_dialect.items()
+        for batch in partition_sequentially(
+            files.items(),
+            key=itemgetter(0),
+            size_target=scala_parser.batch_size,
+            size_max=4 * scala_parser.batch_size,
+        )
+    ]
+    batch_digests = await concurrently(
+        merge_digests(MergeDigests(digest for _, digest in batch)) for _, batch in batches
+    )
+    batch_analyses = await concurrently(
+        analyze_scala_sources_dependencies(
+            AnalyzeScalaSourcesRequest(
+                sources_digest=digest,
+                files=tuple(file for file, _ in batch),
+                scala_version=scala_version,
+                source3=source3,
+            ),
+            **implicitly(),
+        )
+        for ((scala_version, source3), batch), digest in zip(batches, batch_digests)
+    )
+
+    return AllScalaSourceAnalyses(
+        (address, analysis)
+        for (dialect, _), analyses in zip(batches, batch_analyses)
+        for file, analysis in analyses.items()
+        for address in addresses_by_file[(dialect, file)]
+    )
+
+
 SCALA_PACKAGE_OBJECT_NAMESPACE: SymbolNamespace = "package object"
 
 
@@ -60,21 +143,16 @@ def _symbol_namespace(address: Address) -> SymbolNamespace:
 async def map_first_party_scala_targets_to_symbols(
     _: FirstPartyScalaTargetsMappingRequest,
     scala_targets: AllScalaTargets,
+    source_analyses: AllScalaSourceAnalyses,
     jvm: JvmSubsystem,
 ) -> SymbolMap:
-    source_analysis = await concurrently(
-        resolve_fallible_result_to_analysis(
-            **implicitly(SourceFilesRequest([target[ScalaSourceField]]))
-        )
-        for target in scala_targets
-    )
-    address_and_analysis = zip(
-        [(tgt.address, tgt[JvmResolveField].normalized_value(jvm)) for tgt in scala_targets],
-        source_analysis,
-    )
-
     mapping: Mapping[str, MutableTrieNode] = defaultdict(MutableTrieNode)
-    for (address, resolve), analysis in address_and_analysis:
+    for tgt in scala_targets:
+        address = tgt.address
+        analysis = source_analyses.get(address)
+        if analysis is None:
+            continue
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
         namespace = _symbol_namespace(address)
         for symbol in analysis.provided_symbols:
             mapping[resolve].insert(
@@ -20,7 +20,6 @@ def test_find_putative_targets() -> None:
             *core_tailor_rules(),
             *terraform_tailor_rules(),
             QueryRule(PutativeTargets, [PutativeTerraformTargetsRequest, AllOwnedSources]),
-            QueryRule(AllOwnedSources, ()),
         ],
         target_types=[
             TerraformModuleTarget,
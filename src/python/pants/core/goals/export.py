@@ -29,6 +29,7 @@ from pants.engine.fs import (
     AddPrefix,
     CreateDigest,
     Digest,
+    FileContent,
     MergeDigests,
     SymlinkEntry,
     Workspace,
@@ -45,11 +46,13 @@ from pants.engine.process import InteractiveProcess
 from pants.engine.rules import collect_rules, goal_rule, implicitly, rule
 from pants.engine.target import FilteredTargets, Target
 from pants.engine.unions import UnionMembership, union
-from pants.option.option_types import StrListOption
+from pants.option.option_types import BoolOption, StrListOption
 from pants.util.dirutil import safe_mkdir, safe_rmtree
 from pants.util.frozendict import FrozenDict
 from pants.util.strutil import softwrap
 
+EXPORT_FINGERPRINT_FILE = ".pants-export-fingerprint"
+
 
 class ExportError(Exception):
     pass
@@ -118,6 +121,9 @@ class ExportResult:
     # Set to None for other export results.
     resolve: str | None
     exported_binaries: tuple[ExportedBinary, ...]
+    # If set, a stable identifier for everything that determines the content of this export. See
+    # `[export].skip_unchanged`. Leave unset if the export is not fully determined by its inputs.
+    fingerprint: str | None
 
     def __init__(
         self,
@@ -128,6 +134,7 @@ class ExportResult:
         post_processing_cmds: Iterable[PostProcessingCommand] = tuple(),
         resolve: str | None = None,
         exported_binaries: Iterable[ExportedBinary] = tuple(),
+        fingerprint: str | None = None,
     ):
         object.__setattr__(self, "description", description)
         object.__setattr__(self, "reldir", reldir)
@@ -135,6 +142,7 @@ class ExportResult:
         object.__setattr__(self, "post_processing_cmds", tuple(post_processing_cmds))
         object.__setattr__(self, "resolve", resolve)
         object.__setattr__(self, "exported_binaries", tuple(exported_binaries))
+        object.__setattr__(self, "fingerprint", fingerprint)
 
 
 class ExportResults(Collection[ExportResult]):
@@ -181,6 +189,21 @@ class ExportSubsystem(GoalSubsystem):
         help="Export the specified binaries. To select a binary, provide its subsystem scope name, as used for setting its options.",
     )
 
+    skip_unchanged = BoolOption(
+        default=False,
+        help=softwrap(
+            f"""
+            If true, leave previously exported content in place when its inputs have not changed
+            since it was exported, rather than re-exporting it.
+
+            Only applies to exports which record a fingerprint of their inputs (in a
+            `{EXPORT_FINGERPRINT_FILE}` file), such as Python `mutable_virtualenv` exports. Note
+            that any manual modifications to such an export are preserved when it is skipped.
+            """
+        ),
+        advanced=True,
+    )
+
 
 class Export(Goal):
     subsystem_cls = ExportSubsystem
@@ -212,11 +235,26 @@ async def export_goal(
         (res for results in all_results for res in results), key=lambda res: res.resolve or ""
     )  # sorting provides predictable resolution in conflicts
 
+    output_dir = os.path.join(str(dist_dir.relpath), "export")
+
+    def is_unchanged(result: ExportResult) -> bool:
+        if not (export_subsys.skip_unchanged and result.fingerprint):
+            return False
+        fingerprint_path = os.path.join(
+            build_root.path, output_dir, result.reldir, EXPORT_FINGERPRINT_FILE
+        )
+        try:
+            return Path(fingerprint_path).read_text() == result.fingerprint
+        except OSError:
+            return False
+
+    unchanged_results = [result for result in flattened_results if is_unchanged(result)]
+    changed_results = [result for result in flattened_results if result not in unchanged_results]
+
     prefixed_digests = await concurrently(
-        add_prefix(AddPrefix(result.digest, result.reldir)) for result in flattened_results
+        add_prefix(AddPrefix(result.digest, result.reldir)) for result in changed_results
     )
-    output_dir = os.path.join(str(dist_dir.relpath), "export")
-    for result in flattened_results:
+    for result in changed_results:
         digest_root = os.path.join(build_root.path, output_dir, result.reldir)
         safe_rmtree(digest_root)
     merged_digest = await merge_digests(MergeDigests(prefixed_digests))
@@ -224,8 +262,14 @@ async def export_goal(
     workspace.write_digest(dist_digest)
     environment = await environment_vars_subset(EnvironmentVarsRequest(["PATH"]), **implicitly())
     resolves_exported = set()
+    fingerprint_files = []
     for result in flattened_results:
         result_dir = os.path.join(output_dir, result.reldir)
+        if result in unchanged_results:
+            if result.resolve:
+                resolves_exported.add(result.resolve)
+            console.print_stdout(f"Skipped {result.description}: {result_dir} is up to date")
+            continue
         digest_root = os.path.join(build_root.path, result_dir)
         for cmd in result.post_processing_cmds:
             argv = tuple(arg.format(digest_root=digest_root) for arg in cmd.argv)
@@ -239,8 +283,18 @@ async def export_goal(
                 raise ExportError(f"Failed to write {result.description} to {result_dir}")
         if result.resolve:
             resolves_exported.add(result.resolve)
+        if result.fingerprint:
+            fingerprint_files.append(
+                FileContent(
+                    os.path.join(result_dir, EXPORT_FINGERPRINT_FILE), result.fingerprint.encode()
+                )
+            )
         console.print_stdout(f"Wrote {result.description} to {result_dir}")
 
+    if fingerprint_files:
+        # NB: Fingerprints are only recorded once all post-processing has succeeded.
+        workspace.write_digest(await create_digest(CreateDigest(fingerprint_files)))
+
     exported_bins_by_exporting_resolve, link_requests = await link_exported_executables(
         build_root, output_dir, flattened_results
     )
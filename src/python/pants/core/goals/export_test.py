@@ -12,6 +12,7 @@ from _pytest.monkeypatch import MonkeyPatch
 from pants.base.build_root import BuildRoot
 from pants.core.environments.target_types import EnvironmentField
 from pants.core.goals.export import (
+    EXPORT_FINGERPRINT_FILE,
     Export,
     ExportRequest,
     ExportResult,
@@ -52,6 +53,7 @@ def mock_export(
     digest: Digest,
     post_processing_cmds: tuple[PostProcessingCommand, ...],
     resolve: str,
+    fingerprint: str | None = None,
 ) -> ExportResult:
     return ExportResult(
         description=f"mock export for {resolve}",
@@ -59,6 +61,7 @@ def mock_export(
         digest=digest,
         post_processing_cmds=post_processing_cmds,
         resolve=resolve,
+        fingerprint=fingerprint,
     )
 
 
@@ -89,6 +92,8 @@ def run_export_rule(
     monkeypatch: MonkeyPatch,
     resolves: list[str] | None = None,
     binaries: list[str] | None = None,
+    fingerprint: str | None = None,
+    skip_unchanged: bool = False,
 ) -> tuple[int, str]:
     resolves = resolves or []
     binaries = binaries or []
@@ -124,6 +129,7 @@ def run_export_rule(
                                 ),
                             ),
                             resolves[0],
+                            fingerprint,
                         ),
                     )
                 )
@@ -148,7 +154,9 @@ def run_export_rule(
                 union_membership,
                 BuildRoot(),
                 DistDir(relpath=Path("dist")),
-                create_subsystem(ExportSubsystem, resolve=resolves, bin=binaries),
+                create_subsystem(
+                    ExportSubsystem, resolve=resolves, bin=binaries, skip_unchanged=skip_unchanged
+                ),
             ],
             # TODO: Create a rule_runner.call() method that invokes by-name, and use that to
             #  replace these rule_runner.request() by-type calls.
@@ -201,6 +209,48 @@ def test_run_export_rule_resolve(monkeypatch) -> None:
             assert fp.read() == b"BAR"
 
 
+def test_run_export_rule_skip_unchanged(monkeypatch) -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            UnionRule(ExportRequest, MockExportRequest),
+            QueryRule(Digest, [CreateDigest]),
+            QueryRule(EnvironmentVars, [EnvironmentVarsRequest]),
+            QueryRule(InteractiveProcessResult, [InteractiveProcess]),
+        ],
+        target_types=[MockTarget],
+    )
+    export_dir = os.path.join(rule_runner.build_root, "dist", "export", "mock")
+    bar1_path = os.path.join(export_dir, "foo", "bar1")
+
+    def run(fingerprint: str, skip_unchanged: bool = True) -> str:
+        exit_code, stdout = run_export_rule(
+            rule_runner,
+            monkeypatch,
+            resolves=["resolve"],
+            fingerprint=fingerprint,
+            skip_unchanged=skip_unchanged,
+        )
+        assert exit_code == 0
+        return stdout
+
+    assert "Wrote mock export for resolve" in run("fp1")
+    with open(os.path.join(export_dir, EXPORT_FINGERPRINT_FILE)) as fp:
+        assert fp.read() == "fp1"
+
+    # An unchanged export is left in place, including any modifications to it.
+    with open(bar1_path, "wb") as fp:
+        fp.write(b"MODIFIED")
+    assert "Skipped mock export for resolve: dist/export/mock is up to date" in run("fp1")
+    with open(bar1_path, "rb") as fp:
+        assert fp.read() == b"MODIFIED"
+
+    # But it is re-exported if its fingerprint changes, or if skipping is disabled.
+    assert "Wrote mock export for resolve" in run("fp2")
+    with open(bar1_path, "rb") as fp:
+        assert fp.read() == b"BAR"
+    assert "Wrote mock export for resolve" in run("fp2", skip_unchanged=False)
+
+
 def test_run_export_rule_binary(monkeypatch) -> None:
     rule_runner = RuleRunner(
         rules=[
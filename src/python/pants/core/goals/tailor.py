@@ -47,7 +47,14 @@ from pants.util.strutil import help_text, softwrap
 logger = logging.getLogger(__name__)
 
 
-@union(in_scope_types=[EnvironmentName])
+class AllOwnedSources(DeduplicatedCollection[str]):
+    """The files already owned by targets in the directories searched by a `PutativeTargetsRequest`.
+
+    This is provided by the `tailor` goal to the rules generating putative targets.
+    """
+
+
+@union(in_scope_types=[EnvironmentName, AllOwnedSources])
 @dataclass(frozen=True)
 class PutativeTargetsRequest(metaclass=ABCMeta):
     dirs: tuple[str, ...]
@@ -418,18 +425,36 @@ def group_by_build_file(
     return ret
 
 
-class AllOwnedSources(DeduplicatedCollection[str]):
-    """All files in the project already owned by targets."""
+@dataclass(frozen=True)
+class OwnedSourcesRequest:
+    """Request for the files in the given directories that are already owned by targets."""
+
+    dirs: tuple[str, ...]
 
 
-@rule(desc="Determine all files already owned by targets", level=LogLevel.DEBUG)
-async def determine_all_owned_sources(all_tgts: AllUnexpandedTargets) -> AllOwnedSources:
-    all_sources_paths = await concurrently(
+@rule(desc="Determine files already owned by targets", level=LogLevel.DEBUG)
+async def determine_owned_sources(request: OwnedSourcesRequest) -> AllOwnedSources:
+    # A target can only own files in its own directory and below it, so only targets in the
+    # searched directories and their ancestors need to be considered. This keeps `tailor` on a
+    # few directories (e.g., with `--changed-since`) from having to expand every target in the
+    # repo.
+    possible_owners = await resolve_unexpanded_targets(
+        **implicitly(
+            RawSpecs(
+                ancestor_globs=tuple(AncestorGlobSpec(d) for d in request.dirs),
+                description_of_origin="the `tailor` goal",
+            )
+        )
+    )
+    sources_paths = await concurrently(
         resolve_source_paths(SourcesPathsRequest(tgt.get(SourcesField)), **implicitly())
-        for tgt in all_tgts
+        for tgt in possible_owners
     )
+    dirs = set(request.dirs)
     return AllOwnedSources(
-        itertools.chain.from_iterable(sources_paths.files for sources_paths in all_sources_paths)
+        path
+        for path in itertools.chain.from_iterable(paths.files for paths in sources_paths)
+        if os.path.dirname(path) in dirs
     )
 
 
@@ -653,11 +678,16 @@ async def tailor(
 
     specs_paths = await resolve_specs_paths(specs)
     dir_search_paths = tuple(sorted({os.path.dirname(f) for f in specs_paths.files}))
+    owned_sources = await determine_owned_sources(OwnedSourcesRequest(dir_search_paths))
 
     putative_targets_results = await concurrently(
         generate_putative_targets(
             **implicitly(
-                {req_type(dir_search_paths): PutativeTargetsRequest, env_name: EnvironmentName}
+                {
+                    req_type(dir_search_paths): PutativeTargetsRequest,
+                    env_name: EnvironmentName,
+                    owned_sources: AllOwnedSources,
+                }
             )
         )
         for req_type in union_membership[PutativeTargetsRequest]
@@ -17,6 +17,7 @@ from pants.core.goals.tailor import (
     DisjointSourcePutativeTarget,
     EditBuildFilesRequest,
     EditedBuildFiles,
+    OwnedSourcesRequest,
     PutativeTarget,
     PutativeTargets,
     PutativeTargetsRequest,
@@ -144,7 +145,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(UniquelyNamedPutativeTargets, (PutativeTargets,)),
             QueryRule(DisjointSourcePutativeTarget, (PutativeTarget,)),
             QueryRule(EditedBuildFiles, (EditBuildFilesRequest,)),
-            QueryRule(AllOwnedSources, ()),
+            QueryRule(AllOwnedSources, (OwnedSourcesRequest,)),
         ],
         target_types=[FortranLibraryTarget, FortranTestsTarget],
     )
@@ -509,11 +510,13 @@ def test_all_owned_sources(rule_runner: RuleRunner) -> None:
             "dir/BUILD": "fortran_library()\nfortran_tests(name='tests')",
             "unowned.txt": "",
             "unowned.f90": "",
+            "other/c.f90": "",
+            "other/BUILD": "fortran_library()",
         }
     )
-    assert rule_runner.request(AllOwnedSources, []) == AllOwnedSources(
-        ["dir/a.f90", "dir/b.f90", "dir/a_test.f90"]
-    )
+    assert rule_runner.request(
+        AllOwnedSources, [OwnedSourcesRequest(("", "dir"))]
+    ) == AllOwnedSources(["dir/a.f90", "dir/b.f90", "dir/a_test.f90"])
 
 
 def test_target_type_with_no_sources_field(rule_runner: RuleRunner) -> None:
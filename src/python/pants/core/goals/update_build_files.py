@@ -8,6 +8,7 @@ import logging
 import os.path
 import tokenize
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
@@ -31,6 +32,8 @@ from pants.backend.python.lint.yapf.subsystem import Yapf
 from pants.backend.python.subsystems.python_tool_base import get_lockfile_interpreter_constraints
 from pants.backend.python.util_rules import pex
 from pants.base.specs import Specs
+from pants.core.goals.fmt import FmtResult
+from pants.core.goals.multi_tool_goal_helper import BatchSizeOption
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.environment import EnvironmentName
@@ -49,6 +52,7 @@ from pants.engine.platform import Platform
 from pants.engine.rules import collect_rules, concurrently, goal_rule, implicitly, rule
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.option.option_types import BoolOption, EnumOption
+from pants.util.collections import partition_sequentially
 from pants.util.docutil import bin_name, doc_url
 from pants.util.logging import LogLevel
 from pants.util.memo import memoized
@@ -61,6 +65,10 @@ logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------
 
 
+def _lines_to_bytes(lines: Iterable[str]) -> bytes:
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
 @dataclass(frozen=True)
 class RewrittenBuildFile:
     path: str
@@ -86,8 +94,7 @@ class RewrittenBuildFileRequest(EngineAwareParameter):
         return self.path
 
     def to_file_content(self) -> FileContent:
-        lines = "\n".join(self.lines) + "\n"
-        return FileContent(self.path, lines.encode("utf-8"))
+        return FileContent(self.path, _lines_to_bytes(self.lines))
 
     @memoized
     def tokenize(self) -> list[tokenize.TokenInfo]:
@@ -162,6 +169,7 @@ class UpdateBuildFilesSubsystem(GoalSubsystem):
         default=Formatter.BLACK,
         help="Which formatter Pants should use to format BUILD files.",
     )
+    batch_size = BatchSizeOption(uppercase="Formatter", lowercase="formatter")
     fix_safe_deprecations = BoolOption(
         default=True,
         help=softwrap(
@@ -258,7 +266,49 @@ async def update_build_files(
         for build_file in specified_build_files
     }
     build_file_to_change_descriptions: DefaultDict[str, list[str]] = defaultdict(list)
+    batch_request_classes: dict[type[RewrittenBuildFileRequest], type[FormatBuildFilesRequest]] = {
+        FormatWithBlackRequest: FormatBuildFilesWithBlackRequest,
+        FormatWithYapfRequest: FormatBuildFilesWithYapfRequest,
+        FormatWithRuffRequest: FormatBuildFilesWithRuffRequest,
+        FormatWithBuildifierRequest: FormatBuildFilesWithBuildifierRequest,
+    }
+    registered_batch_request_classes = union_membership.get(FormatBuildFilesRequest)
     for rewrite_request_cls in rewrite_request_classes:
+        batch_request_cls = batch_request_classes.get(rewrite_request_cls)
+        if batch_request_cls in registered_batch_request_classes:
+            # Run the formatter over stable batches of files, rather than once per file.
+            batches = partition_sequentially(
+                build_file_to_lines.items(),
+                key=lambda item: item[0],
+                size_target=update_build_files_subsystem.batch_size,
+                size_max=4 * update_build_files_subsystem.batch_size,
+            )
+            all_formatted_batches = await concurrently(  # noqa: PNT30: this is inherently sequential
+                format_build_files(
+                    **implicitly(
+                        {
+                            batch_request_cls(
+                                tuple(
+                                    FileContent(build_file, _lines_to_bytes(lines))
+                                    for build_file, lines in batch
+                                )
+                            ): FormatBuildFilesRequest,
+                            env_name: EnvironmentName,
+                        }
+                    ),
+                )
+                for batch in batches
+            )
+            for formatted_batch in all_formatted_batches:
+                for formatted_file in formatted_batch.changed_files:
+                    build_file_to_lines[formatted_file.path] = tuple(
+                        formatted_file.content.decode("utf-8").splitlines()
+                    )
+                    build_file_to_change_descriptions[formatted_file.path].append(
+                        formatted_batch.change_description
+                    )
+            continue
+
         all_rewritten_files = await concurrently(  # noqa: PNT30: this is inherently sequential
             rewrite_build_file(
                 **implicitly(
@@ -304,9 +354,7 @@ async def update_build_files(
     if not update_build_files_subsystem.check:
         result = await create_digest(
             CreateDigest(
-                FileContent(
-                    build_file, ("\n".join(build_file_to_lines[build_file]) + "\n").encode("utf-8")
-                )
+                FileContent(build_file, _lines_to_bytes(build_file_to_lines[build_file]))
                 for build_file in changed_build_files
             )
         )
@@ -327,6 +375,65 @@ async def update_build_files(
     return UpdateBuildFilesGoal(exit_code=1 if update_build_files_subsystem.check else 0)
 
 
+# ------------------------------------------------------------------------------------------
+# Batched formatting
+# ------------------------------------------------------------------------------------------
+
+
+@union(in_scope_types=[EnvironmentName])
+@dataclass(frozen=True)
+class FormatBuildFilesRequest(EngineAwareParameter):
+    """Format a batch of BUILD files in a single formatter process.
+
+    The goal uses this in place of the corresponding per-file `RewrittenBuildFileRequest`, to
+    avoid running one formatter process per BUILD file.
+    """
+
+    build_files: tuple[FileContent, ...]
+
+    def debug_hint(self) -> str:
+        return f"{len(self.build_files)} BUILD files"
+
+
+@dataclass(frozen=True)
+class FormattedBuildFiles:
+    # Only the files whose content was changed by the formatter.
+    changed_files: tuple[FileContent, ...]
+    change_description: str
+
+
+@rule(polymorphic=True)
+async def format_build_files(
+    req: FormatBuildFilesRequest, env_name: EnvironmentName
+) -> FormattedBuildFiles:
+    raise NotImplementedError()
+
+
+async def _formatted_build_files(
+    request: FormatBuildFilesRequest, result: FmtResult, change_description: str
+) -> FormattedBuildFiles:
+    if not result.did_change:
+        return FormattedBuildFiles((), change_description)
+    original_content = {fc.path: fc.content for fc in request.build_files}
+    output_content = await get_digest_contents(result.output.digest)
+    return FormattedBuildFiles(
+        tuple(fc for fc in output_content if original_content.get(fc.path) != fc.content),
+        change_description,
+    )
+
+
+def _rewritten_build_file(
+    request: RewrittenBuildFileRequest, formatted: FormattedBuildFiles
+) -> RewrittenBuildFile:
+    for fc in formatted.changed_files:
+        if fc.path == request.path:
+            build_lines = tuple(fc.content.decode("utf-8").splitlines())
+            return RewrittenBuildFile(
+                request.path, build_lines, change_descriptions=(formatted.change_description,)
+            )
+    return RewrittenBuildFile(request.path, request.lines, change_descriptions=())
+
+
 # ------------------------------------------------------------------------------------------
 # Yapf formatter fixer
 # ------------------------------------------------------------------------------------------
@@ -336,13 +443,15 @@ class FormatWithYapfRequest(RewrittenBuildFileRequest):
     pass
 
 
+class FormatBuildFilesWithYapfRequest(FormatBuildFilesRequest):
+    pass
+
+
 @rule
-async def format_build_file_with_yapf(
-    request: FormatWithYapfRequest, yapf: Yapf
-) -> RewrittenBuildFile:
-    input_snapshot = await digest_to_snapshot(
-        **implicitly(CreateDigest([request.to_file_content()]))
-    )
+async def format_build_files_with_yapf(
+    request: FormatBuildFilesWithYapfRequest, yapf: Yapf
+) -> FormattedBuildFiles:
+    input_snapshot = await digest_to_snapshot(**implicitly(CreateDigest(request.build_files)))
     yapf_ics = await get_lockfile_interpreter_constraints(yapf)
     result = await _run_yapf(
         YapfRequest.Batch(
@@ -354,13 +463,15 @@ async def format_build_file_with_yapf(
         yapf,
         yapf_ics,
     )
-    output_content = await get_digest_contents(result.output.digest)
+    return await _formatted_build_files(request, result, "Format with Yapf")
 
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Yapf",) if result.did_change else ()
 
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+@rule
+async def format_build_file_with_yapf(request: FormatWithYapfRequest) -> RewrittenBuildFile:
+    formatted = await format_build_files_with_yapf(
+        FormatBuildFilesWithYapfRequest((request.to_file_content(),)), **implicitly()
+    )
+    return _rewritten_build_file(request, formatted)
 
 
 # ------------------------------------------------------------------------------------------
@@ -372,13 +483,15 @@ class FormatWithBlackRequest(RewrittenBuildFileRequest):
     pass
 
 
+class FormatBuildFilesWithBlackRequest(FormatBuildFilesRequest):
+    pass
+
+
 @rule
-async def format_build_file_with_black(
-    request: FormatWithBlackRequest, black: Black
-) -> RewrittenBuildFile:
-    input_snapshot = await digest_to_snapshot(
-        **implicitly(CreateDigest([request.to_file_content()]))
-    )
+async def format_build_files_with_black(
+    request: FormatBuildFilesWithBlackRequest, black: Black
+) -> FormattedBuildFiles:
+    input_snapshot = await digest_to_snapshot(**implicitly(CreateDigest(request.build_files)))
     black_ics = await get_lockfile_interpreter_constraints(black)
     result = await _run_black(
         BlackRequest.Batch(
@@ -390,13 +503,15 @@ async def format_build_file_with_black(
         black,
         black_ics,
     )
-    output_content = await get_digest_contents(result.output.digest)
+    return await _formatted_build_files(request, result, "Format with Black")
 
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Black",) if result.did_change else ()
 
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+@rule
+async def format_build_file_with_black(request: FormatWithBlackRequest) -> RewrittenBuildFile:
+    formatted = await format_build_files_with_black(
+        FormatBuildFilesWithBlackRequest((request.to_file_content(),)), **implicitly()
+    )
+    return _rewritten_build_file(request, formatted)
 
 
 # ------------------------------------------------------------------------------------------
@@ -408,13 +523,15 @@ class FormatWithRuffRequest(RewrittenBuildFileRequest):
     pass
 
 
+class FormatBuildFilesWithRuffRequest(FormatBuildFilesRequest):
+    pass
+
+
 @rule
-async def format_build_file_with_ruff(
-    request: FormatWithRuffRequest, ruff: Ruff, platform: Platform
-) -> RewrittenBuildFile:
-    input_snapshot = await digest_to_snapshot(
-        **implicitly(CreateDigest([request.to_file_content()]))
-    )
+async def format_build_files_with_ruff(
+    request: FormatBuildFilesWithRuffRequest, ruff: Ruff, platform: Platform
+) -> FormattedBuildFiles:
+    input_snapshot = await digest_to_snapshot(**implicitly(CreateDigest(request.build_files)))
     result = await _run_ruff_fmt(
         RuffRequest.Batch(
             Ruff.options_scope,
@@ -425,13 +542,15 @@ async def format_build_file_with_ruff(
         ruff,
         platform,
     )
-    output_content = await get_digest_contents(result.output.digest)
+    return await _formatted_build_files(request, result, "Format with Ruff")
 
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = ("Format with Ruff",) if result.did_change else ()
 
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+@rule
+async def format_build_file_with_ruff(request: FormatWithRuffRequest) -> RewrittenBuildFile:
+    formatted = await format_build_files_with_ruff(
+        FormatBuildFilesWithRuffRequest((request.to_file_content(),)), **implicitly()
+    )
+    return _rewritten_build_file(request, formatted)
 
 
 # ------------------------------------------------------------------------------------------
@@ -443,13 +562,15 @@ class FormatWithBuildifierRequest(RewrittenBuildFileRequest):
     pass
 
 
+class FormatBuildFilesWithBuildifierRequest(FormatBuildFilesRequest):
+    pass
+
+
 @rule
-async def format_build_file_with_buildifier(
-    request: FormatWithBuildifierRequest, buildifier: Buildifier, platform: Platform
-) -> RewrittenBuildFile:
-    input_snapshot = await digest_to_snapshot(
-        **implicitly(CreateDigest([request.to_file_content()]))
-    )
+async def format_build_files_with_buildifier(
+    request: FormatBuildFilesWithBuildifierRequest, buildifier: Buildifier, platform: Platform
+) -> FormattedBuildFiles:
+    input_snapshot = await digest_to_snapshot(**implicitly(CreateDigest(request.build_files)))
     result = await _run_buildifier_fmt(
         request=BuildifierRequest.Batch(
             tool_name=Buildifier.options_scope,
@@ -460,11 +581,17 @@ async def format_build_file_with_buildifier(
         buildifier=buildifier,
         platform=platform,
     )
-    output_content = await get_digest_contents(result.output.digest)
-    formatted_build_file_content = next(fc for fc in output_content if fc.path == request.path)
-    build_lines = tuple(formatted_build_file_content.content.decode("utf-8").splitlines())
-    change_descriptions = (f"Format with {Buildifier.name}",) if result.did_change else ()
-    return RewrittenBuildFile(request.path, build_lines, change_descriptions=change_descriptions)
+    return await _formatted_build_files(request, result, f"Format with {Buildifier.name}")
+
+
+@rule
+async def format_build_file_with_buildifier(
+    request: FormatWithBuildifierRequest,
+) -> RewrittenBuildFile:
+    formatted = await format_build_files_with_buildifier(
+        FormatBuildFilesWithBuildifierRequest((request.to_file_content(),)), **implicitly()
+    )
+    return _rewritten_build_file(request, formatted)
 
 
 # ------------------------------------------------------------------------------------------
@@ -538,4 +665,8 @@ def rules():
         UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
         UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
         UnionRule(RewrittenBuildFileRequest, FormatWithBuildifierRequest),
+        UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithBlackRequest),
+        UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithYapfRequest),
+        UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithRuffRequest),
+        UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithBuildifierRequest),
     )
@@ -19,6 +19,11 @@ from pants.backend.python.util_rules.interpreter_constraints import InterpreterC
 from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadata
 from pants.backend.python.util_rules.pex_requirements import LoadedLockfile, Lockfile
 from pants.core.goals.update_build_files import (
+    FormatBuildFilesRequest,
+    FormatBuildFilesWithBlackRequest,
+    FormatBuildFilesWithBuildifierRequest,
+    FormatBuildFilesWithRuffRequest,
+    FormatBuildFilesWithYapfRequest,
     FormatWithBlackRequest,
     FormatWithBuildifierRequest,
     FormatWithRuffRequest,
@@ -31,6 +36,11 @@ from pants.core.goals.update_build_files import (
     format_build_file_with_buildifier,
     format_build_file_with_ruff,
     format_build_file_with_yapf,
+    format_build_files,
+    format_build_files_with_black,
+    format_build_files_with_buildifier,
+    format_build_files_with_ruff,
+    format_build_files_with_yapf,
     rewrite_build_file,
     update_build_files,
 )
@@ -77,8 +87,11 @@ def generic_goal_rule_runner() -> RuleRunner:
             add_line,
             reverse_lines,
             rewrite_build_file,
+            format_build_files,
             format_build_file_with_ruff,
+            format_build_files_with_ruff,
             format_build_file_with_yapf,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
@@ -92,7 +105,9 @@ def generic_goal_rule_runner() -> RuleRunner:
             UnionRule(RewrittenBuildFileRequest, MockRewriteAddLine),
             UnionRule(RewrittenBuildFileRequest, MockRewriteReverseLines),
             UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithRuffRequest),
             UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithYapfRequest),
         )
     )
 
@@ -218,9 +233,13 @@ def black_rule_runner() -> RuleRunner:
     return RuleRunner(
         rules=(
             rewrite_build_file,
+            format_build_files,
             format_build_file_with_black,
+            format_build_files_with_black,
             format_build_file_with_ruff,
+            format_build_files_with_ruff,
             format_build_file_with_yapf,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
@@ -231,8 +250,11 @@ def black_rule_runner() -> RuleRunner:
             *Yapf.rules(),
             *UpdateBuildFilesSubsystem.rules(),
             UnionRule(RewrittenBuildFileRequest, FormatWithBlackRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithBlackRequest),
             UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithRuffRequest),
             UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithYapfRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -262,6 +284,33 @@ def test_black_fixer_noops(black_rule_runner: RuleRunner) -> None:
     assert Path(black_rule_runner.build_root, "BUILD").read_text() == 'target(name="t")\n'
 
 
+@pytest.mark.parametrize("batch_size", [1, 128])
+def test_black_fixer_batches(black_rule_runner: RuleRunner, batch_size: int) -> None:
+    black_rule_runner.write_files(
+        {
+            "BUILD": "target( name =  't' )",
+            "a/BUILD": 'target(name="t")\n',
+            "b/BUILD": "target( name =  't' )",
+        }
+    )
+    result = black_rule_runner.run_goal_rule(
+        UpdateBuildFilesGoal,
+        args=[f"--update-build-files-batch-size={batch_size}", "::"],
+        env_inherit=BLACK_ENV_INHERIT,
+    )
+    assert result.exit_code == 0
+    assert result.stdout == dedent(
+        """\
+        Updated BUILD:
+          - Format with Black
+        Updated b/BUILD:
+          - Format with Black
+        """
+    )
+    for path in ("BUILD", "a/BUILD", "b/BUILD"):
+        assert Path(black_rule_runner.build_root, path).read_text() == 'target(name="t")\n'
+
+
 def test_black_fixer_args(black_rule_runner: RuleRunner) -> None:
     black_rule_runner.write_files({"BUILD": "target(name='t')\n"})
     result = black_rule_runner.run_goal_rule(
@@ -300,13 +349,16 @@ def run_ruff(
     rule_runner = RuleRunner(
         rules=(
             rewrite_build_file,
+            format_build_files,
             format_build_file_with_ruff,
+            format_build_files_with_ruff,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Ruff.rules(),
             *UpdateBuildFilesSubsystem.rules(),
             UnionRule(RewrittenBuildFileRequest, FormatWithRuffRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithRuffRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -352,13 +404,16 @@ def run_buildifier(
     rule_runner = RuleRunner(
         rules=(
             rewrite_build_file,
+            format_build_files,
             format_build_file_with_buildifier,
+            format_build_files_with_buildifier,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Buildifier.rules(),
             *UpdateBuildFilesSubsystem.rules(),
             UnionRule(RewrittenBuildFileRequest, FormatWithBuildifierRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithBuildifierRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -404,13 +459,16 @@ def run_yapf(
     rule_runner = RuleRunner(
         rules=(
             rewrite_build_file,
+            format_build_files,
             format_build_file_with_yapf,
+            format_build_files_with_yapf,
             update_build_files,
             *config_files.rules(),
             *pex.rules(),
             *Yapf.rules(),
             *UpdateBuildFilesSubsystem.rules(),
             UnionRule(RewrittenBuildFileRequest, FormatWithYapfRequest),
+            UnionRule(FormatBuildFilesRequest, FormatBuildFilesWithYapfRequest),
         ),
         target_types=[GenericTarget],
     )
@@ -0,0 +1,66 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Helpers to split tests into shards of similar duration, based on the JUnit XML reports of a
+previous run."""
+
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TypeVar
+
+from pants.engine.fs import FileContent
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def junit_xml_durations(
+    reports: Iterable[FileContent], key: Callable[[ET.Element, ET.Element], str | None]
+) -> dict[str, float]:
+    """Sum the durations of the test cases in the given JUnit XML reports.
+
+    The duration of each test case is added to `key(testsuite, testcase)`, unless that is None.
+    Reports which cannot be parsed, e.g. because their test run was interrupted, are ignored.
+    """
+    durations: dict[str, float] = defaultdict(float)
+    for report in reports:
+        try:
+            root = ET.fromstring(report.content)
+        except ET.ParseError as e:
+            logger.debug(f"Ignoring unparseable JUnit XML report {report.path}: {e}")
+            continue
+        for testsuite in root.iter("testsuite"):
+            for testcase in testsuite.findall("testcase"):
+                item = key(testsuite, testcase)
+                if item is None:
+                    continue
+                try:
+                    duration = float(testcase.get("time", "0").replace(",", ""))
+                except ValueError:
+                    duration = 0.0
+                durations[item] += duration
+    return dict(durations)
+
+
+def balance_by_duration(
+    durations: Mapping[_T, float], count: int, *, key: Callable[[_T], Any] | None = None
+) -> list[list[_T]]:
+    """Assign the items to at most `count` shards, longest first, each to the least loaded shard.
+
+    Items of equal duration are ordered by `key` (or by themselves), so that the shards are
+    deterministic.
+    """
+    shards: list[list[_T]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for item, duration in sorted(
+        durations.items(), key=lambda entry: (-entry[1], key(entry[0]) if key else entry[0])
+    ):
+        index = min(range(count), key=lambda i: (loads[i], i))
+        shards[index].append(item)
+        loads[index] += duration
+    return [shard for shard in shards if shard]
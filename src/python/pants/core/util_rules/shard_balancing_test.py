@@ -0,0 +1,42 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from pants.core.util_rules.shard_balancing import balance_by_duration, junit_xml_durations
+from pants.engine.fs import FileContent
+
+
+def test_junit_xml_durations() -> None:
+    report = b"""<?xml version="1.0" encoding="UTF-8"?>
+        <testsuites>
+          <testsuite name="a">
+            <testcase name="a1" time="1.5"/>
+            <testcase name="a2" time="1,000.25"/>
+            <testcase name="skipped" time="7"/>
+          </testsuite>
+          <testsuite name="b">
+            <testcase name="b1" time="oops"/>
+            <testcase name="b2"/>
+          </testsuite>
+        </testsuites>
+    """
+    durations = junit_xml_durations(
+        [FileContent("report.xml", report), FileContent("truncated.xml", b"<testsuites")],
+        key=lambda testsuite, testcase: (
+            None if testcase.get("name") == "skipped" else testsuite.get("name")
+        ),
+    )
+    assert durations == {"a": 1001.75, "b": 0.0}
+
+
+def test_balance_by_duration() -> None:
+    durations = {"A": 10.0, "B": 6.0, "C": 5.0, "D": 1.0}
+    assert balance_by_duration(durations, 2) == [["A", "D"], ["B", "C"]]
+    assert balance_by_duration(durations, 8) == [["A"], ["B"], ["C"], ["D"]]
+    assert balance_by_duration({}, 2) == []
+
+    # Ties are broken by the key.
+    assert balance_by_duration({"A": 1.0, "B": 1.0}, 1, key=lambda item: item != "B") == [
+        ["B", "A"]
+    ]
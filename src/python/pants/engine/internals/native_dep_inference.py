@@ -44,6 +44,16 @@ class NativeParsedJavascriptDependencies:
         )
 
 
+@dataclass(frozen=True)
+class NativeParsedJavascriptDependenciesBatch:
+    """The parsed dependencies of each file in a batch, keyed by file path."""
+
+    files: dict[str, NativeParsedJavascriptDependencies]
+
+    def __init__(self, files: dict[str, NativeParsedJavascriptDependencies]):
+        object.__setattr__(self, "files", files)
+
+
 @dataclass(frozen=True)
 class NativeParsedDockerfileInfo:
     source: str
@@ -599,6 +599,9 @@ async def parse_python_deps(
 async def parse_javascript_deps(
     deps_request: NativeDependenciesRequest,
 ) -> NativeParsedJavascriptDependencies: ...
+async def parse_javascript_deps_batch(
+    deps_request: NativeDependenciesRequest,
+) -> dict[str, NativeParsedJavascriptDependencies]: ...
 async def path_metadata_request(request: PathMetadataRequest) -> PathMetadataResult: ...
 
 # ------------------------------------------------------------------------------
@@ -769,7 +772,8 @@ class InferenceMetadata:
 class NativeDependenciesRequest:
     """A request to parse the dependencies of a file.
 
-    * The `digest` is expected to contain exactly one source file.
+    * The `digest` is expected to contain exactly one source file, except for batched
+      parsers, which parse every file in the digest.
     * Depending on the implementation, a `metadata` structure
       can be passed. It will be supplied to the native parser, and
       it will be incorporated into the cache key.
@@ -28,6 +28,7 @@ from pants.engine.internals.docker import DockerResolveImageRequest, DockerResol
 from pants.engine.internals.native_dep_inference import (
     NativeParsedDockerfileInfo,
     NativeParsedJavascriptDependencies,
+    NativeParsedJavascriptDependenciesBatch,
     NativeParsedPythonDependencies,
 )
 from pants.engine.internals.native_engine import NativeDependenciesRequest, task_side_effected
@@ -216,6 +217,15 @@ async def parse_javascript_deps(
     return await native_engine.parse_javascript_deps(deps_request)
 
 
+@rule
+async def parse_javascript_deps_batch(
+    deps_request: NativeDependenciesRequest,
+) -> NativeParsedJavascriptDependenciesBatch:
+    return NativeParsedJavascriptDependenciesBatch(
+        await native_engine.parse_javascript_deps_batch(deps_request)
+    )
+
+
 @rule
 async def path_metadata_request(request: PathMetadataRequest) -> PathMetadataResult:
     return await native_engine.path_metadata_request(request)
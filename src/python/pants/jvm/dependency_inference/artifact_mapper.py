@@ -149,36 +149,38 @@ class FrozenTrieNode:
     def first_party(self) -> bool:
         return self._first_party
 
+    @classmethod
+    def _create(
+        cls,
+        children: FrozenDict[str, FrozenTrieNode],
+        recursive: bool,
+        addresses: FrozenDict[SymbolNamespace, FrozenOrderedSet[Address]],
+        first_party: bool,
+    ) -> FrozenTrieNode:
+        node = cls.__new__(cls)
+        object.__setattr__(node, "_children", children)
+        object.__setattr__(node, "_recursive", recursive)
+        object.__setattr__(node, "_addresses", addresses)
+        object.__setattr__(node, "_first_party", first_party)
+        return node
+
     def addresses_for_symbol(
         self, symbol: str
     ) -> FrozenDict[SymbolNamespace, FrozenOrderedSet[Address]]:
         current_node = self
-        imp_parts = symbol.split(".")
-
-        found_nodes = []
-        for imp_part in imp_parts:
-            child_node_opt = current_node.find_child(imp_part)
-            if not child_node_opt:
-                break
-            found_nodes.append(child_node_opt)
-            current_node = child_node_opt
-
-        if not found_nodes:
-            return FrozenDict()
-
-        # If the length of the found nodes equals the number of parts of the package path, then
-        # there is an exact match.
-        if len(found_nodes) == len(imp_parts):
-            return found_nodes[-1].addresses
-
-        # Otherwise, check for the first found node (in reverse order) to match recursively, and
-        # use its coordinate.
-        for found_node in reversed(found_nodes):
-            if found_node.recursive:
-                return found_node.addresses
+        # The deepest recursive node on the path to the symbol, which provides the symbol if there
+        # is no exact match.
+        recursive_node: FrozenTrieNode | None = None
+        for imp_part in symbol.split("."):
+            child_node = current_node._children.get(imp_part)
+            if child_node is None:
+                return recursive_node._addresses if recursive_node else FrozenDict()
+            current_node = child_node
+            if child_node._recursive:
+                recursive_node = child_node
 
-        # Nothing matched so return no match.
-        return FrozenDict()
+        # All of the parts of the package path were found, so there is an exact match.
+        return current_node._addresses
 
     @property
     def addresses(self) -> FrozenDict[SymbolNamespace, FrozenOrderedSet[Address]]:
@@ -188,20 +190,35 @@ class FrozenTrieNode:
     def merge(cls, nodes: Iterable[FrozenTrieNode]) -> FrozenTrieNode:
         """Merges the given `FrozenTrieNode` instances.
 
-        TODO: This is currently implemented as merging-from-scratch, but could be trie-aware.
+        The merge is trie-aware: a subtrie which is only present in one of the given nodes is
+        reused as-is rather than being copied, so merging mostly-disjoint tries (such as the first
+        and third party symbols for a resolve) only creates nodes for their shared prefixes.
         """
-        result = MutableTrieNode()
+        nodes = list(nodes)
+        if len(nodes) == 1:
+            return nodes[0]
+
+        children: dict[str, list[FrozenTrieNode]] = defaultdict(list)
+        addresses: dict[SymbolNamespace, OrderedSet[Address]] = defaultdict(OrderedSet)
+        recursive = False
+        first_party = False
         for node in nodes:
-            for symbol, recursive, address_namespaces, first_party in node:
-                for namespace, addresses in address_namespaces.items():
-                    result.insert(
-                        symbol,
-                        addresses,
-                        recursive=recursive,
-                        first_party=first_party,
-                        namespace=namespace,
-                    )
-        return FrozenTrieNode(result)
+            for name, child in node._children.items():
+                children[name].append(child)
+            # As when inserting into a `MutableTrieNode`, the flags of the last node to provide
+            # addresses for this symbol win.
+            if node._addresses:
+                for namespace, namespace_addresses in node._addresses.items():
+                    addresses[namespace].update(namespace_addresses)
+                recursive = node._recursive
+                first_party = node._first_party
+
+        return cls._create(
+            FrozenDict((name, cls.merge(child_nodes)) for name, child_nodes in children.items()),
+            recursive,
+            FrozenDict({ns: FrozenOrderedSet(addrs) for ns, addrs in addresses.items()}),
+            first_party,
+        )
 
     def to_json_dict(self) -> dict[str, Any]:
         return {
@@ -222,11 +239,7 @@ class FrozenTrieNode:
             symbol.pop()
 
     def __iter__(self) -> Iterator[FrozenTrieNodeItem]:
-        """Iterates through all nodes in the trie.
-
-        TODO: This is primarily used in `FrozenTrieNode.merge`: if that method switches to
-        trie-aware merging, this should likely be removed.
-        """
+        """Iterates through all nodes in the trie which have addresses."""
         yield from self._iter_helper([])
 
     def __hash__(self) -> int:
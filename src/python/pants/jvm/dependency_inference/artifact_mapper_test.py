@@ -90,6 +90,33 @@ def test_trie_node_merge_basic() -> None:
     ]
 
 
+def test_trie_node_merge_reuses_disjoint_subtries() -> None:
+    one = MutableTrieNode()
+    one.insert("org.one.A", [Address("1")], first_party=True)
+    two = MutableTrieNode()
+    two.insert("org.two", [Address("2")], recursive=True, first_party=False)
+    frozen_one = one.frozen()
+    frozen_two = two.frozen()
+
+    def child(node: FrozenTrieNode | None, name: str) -> FrozenTrieNode | None:
+        assert node is not None
+        return node.find_child(name)
+
+    merged = FrozenTrieNode.merge([frozen_one, frozen_two])
+    assert child(child(merged, "org"), "one") is child(child(frozen_one, "org"), "one")
+    assert child(child(merged, "org"), "two") is child(child(frozen_two, "org"), "two")
+    assert merged == FrozenTrieNode.merge([frozen_one, frozen_two, MutableTrieNode().frozen()])
+
+    assert merged.addresses_for_symbol("org.one.A") == FrozenDict(
+        {DEFAULT_SYMBOL_NAMESPACE: FrozenOrderedSet([Address("1")])}
+    )
+    assert merged.addresses_for_symbol("org.two.sub.B") == FrozenDict(
+        {DEFAULT_SYMBOL_NAMESPACE: FrozenOrderedSet([Address("2")])}
+    )
+    assert merged.addresses_for_symbol("org.one.B") == FrozenDict()
+    assert merged.addresses_for_symbol("com.example.C") == FrozenDict()
+
+
 @maybe_skip_jdk_test
 def test_third_party_mapping_parsing(rule_runner: RuleRunner) -> None:
     rule_runner.set_options(
@@ -392,6 +392,9 @@ class JvmProcess:
 
 _JVM_HEAP_SIZE_UNITS = ["", "k", "m", "g"]
 
+# The newest JRE major version with which nailgun can be used.
+NAILGUN_MAX_JRE_VERSION = 17
+
 
 @rule
 async def jvm_process(
@@ -434,14 +437,18 @@ async def jvm_process(
         *[valid_jvm_opt(opt) for opt in jvm_user_options],
     ]
 
+    # Nailgun servers are keyed by the JDK and any extra keys (usually the tool classpath), so
+    # that compilers and other tools stay warm across processes. Nailgun relies on the
+    # SecurityManager, which cannot be installed by newer JDKs, so those start a fresh JVM.
+    nailgun_supported = request.use_nailgun and jdk.jre_major_version <= NAILGUN_MAX_JRE_VERSION
     use_nailgun = []
-    if request.use_nailgun:
+    if nailgun_supported:
         use_nailgun = [*jdk.immutable_input_digests, *request.extra_nailgun_keys]
 
     remote_cache_speculation_delay_millis = 0
     if request.remote_cache_speculation_delay is not None:
         remote_cache_speculation_delay_millis = request.remote_cache_speculation_delay
-    elif request.use_nailgun:
+    elif nailgun_supported:
         remote_cache_speculation_delay_millis = jvm.nailgun_remote_cache_speculation_delay
 
     return Process(
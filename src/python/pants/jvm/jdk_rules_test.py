@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import textwrap
 
 import pytest
@@ -14,7 +15,12 @@ from pants.engine.fs import CreateDigest, Digest, FileContent
 from pants.engine.internals.native_engine import EMPTY_DIGEST
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.process import Process, ProcessResult
-from pants.jvm.jdk_rules import InternalJdk, JvmProcess, parse_jre_major_version
+from pants.jvm.jdk_rules import (
+    NAILGUN_MAX_JRE_VERSION,
+    InternalJdk,
+    JvmProcess,
+    parse_jre_major_version,
+)
 from pants.jvm.jdk_rules import rules as jdk_rules
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.coursier_setup import rules as coursier_setup_rules
@@ -142,6 +148,35 @@ def test_include_child_mem_constraint_in_jvm_options(rule_runner: RuleRunner) ->
     assert "-Xmx1g" in proc.argv
 
 
+@maybe_skip_jdk_test
+@pytest.mark.parametrize(
+    "jre_major_version, expect_nailgun",
+    [(NAILGUN_MAX_JRE_VERSION, True), (NAILGUN_MAX_JRE_VERSION + 1, False)],
+)
+def test_nailgun_only_used_for_supported_jdks(
+    rule_runner: RuleRunner, jre_major_version: int, expect_nailgun: bool
+) -> None:
+    jdk = dataclasses.replace(
+        rule_runner.request(InternalJdk, []), jre_major_version=jre_major_version
+    )
+    proc = rule_runner.request(
+        Process,
+        [
+            JvmProcess(
+                jdk=jdk,
+                classpath_entries=(),
+                argv=["-version"],
+                input_digest=EMPTY_DIGEST,
+                description="",
+                extra_nailgun_keys=["__toolcp"],
+            )
+        ],
+    )
+    assert bool(proc.use_nailgun) == expect_nailgun
+    if expect_nailgun:
+        assert "__toolcp" in proc.use_nailgun
+
+
 @maybe_skip_jdk_test
 def test_error_if_users_specify_max_heap_as_jvm_option(rule_runner: RuleRunner) -> None:
     global_jvm_options = ["-Xmx1g"]
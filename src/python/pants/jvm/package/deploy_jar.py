@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import PurePath
 
@@ -13,12 +14,13 @@ from pants.core.goals.package import (
 )
 from pants.core.goals.run import RunFieldSet, RunInSandboxBehavior
 from pants.engine.addresses import Addresses
-from pants.engine.fs import EMPTY_DIGEST, AddPrefix, MergeDigests
+from pants.engine.fs import EMPTY_DIGEST, AddPrefix, Digest, MergeDigests
 from pants.engine.intrinsics import add_prefix, merge_digests
-from pants.engine.rules import collect_rules, implicitly, rule
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import Dependencies
 from pants.engine.unions import UnionRule
 from pants.jvm import classpath
+from pants.jvm.classpath import Classpath
 from pants.jvm.classpath import classpath as classpath_get
 from pants.jvm.compile import (
     ClasspathDependenciesRequest,
@@ -42,6 +44,7 @@ from pants.jvm.target_types import (
     JvmJdkField,
     JvmMainClassNameField,
 )
+from pants.util.collections import partition_sequentially
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +105,64 @@ async def deploy_jar_classpath(
     )
 
 
+async def _deploy_jar_inputs(
+    jvm: JvmSubsystem,
+    classpath: Classpath,
+    policies: list[tuple[str, str]],
+    skip: list[str],
+) -> tuple[Digest, tuple[str, ...]]:
+    """Returns the jars (and their Digest) that should be merged into a deploy jar.
+
+    When `[jvm].deploy_jar_batch_size` is set, the classpath is first merged into intermediate
+    jars: each covers a contiguous run of the classpath, so applying the same duplicate policies
+    to the intermediate jars in order gives the same result as applying them to the whole
+    classpath.
+    """
+    batches: list[list[ClasspathEntry]] = []
+    if jvm.deploy_jar_batch_size > 0:
+        batches = list(
+            partition_sequentially(
+                ClasspathEntry.closure(classpath.entries),
+                key=lambda cpe: ",".join(cpe.filenames),
+                size_target=jvm.deploy_jar_batch_size,
+                size_max=4 * jvm.deploy_jar_batch_size,
+                preserve_order=True,
+            )
+        )
+    if len(batches) <= 1:
+        classpath_digest = await merge_digests(MergeDigests(classpath.digests()))
+        return classpath_digest, tuple(classpath.args())
+
+    batch_digests = await concurrently(
+        merge_digests(MergeDigests(cpe.digest for cpe in batch)) for batch in batches
+    )
+    # NB: Every intermediate jar has the same name, so that its cache key only depends on the
+    # classpath entries in its batch. They are moved into distinct directories afterward.
+    intermediate_jar_name = "deploy_jar_batch.jar"
+    intermediate_jar_digests = await concurrently(
+        run_jar_tool(
+            JarToolRequest(
+                jar_name=intermediate_jar_name,
+                digest=batch_digest,
+                jars=ClasspathEntry.args(batch),
+                policies=policies,
+                skip=skip,
+                compress=True,
+            ),
+            **implicitly(),
+        )
+        for batch_digest, batch in zip(batch_digests, batches)
+    )
+    prefixed_jar_digests = await concurrently(
+        add_prefix(AddPrefix(digest, f"__batch{i}"))
+        for i, digest in enumerate(intermediate_jar_digests)
+    )
+    jars_digest = await merge_digests(MergeDigests(prefixed_jar_digests))
+    return jars_digest, tuple(
+        os.path.join(f"__batch{i}", intermediate_jar_name) for i in range(len(batches))
+    )
+
+
 @rule
 async def package_deploy_jar(
     jvm: JvmSubsystem,
@@ -123,24 +184,26 @@ async def package_deploy_jar(
     #
 
     classpath = await classpath_get(**implicitly(Addresses([field_set.address])))
-    classpath_digest = await merge_digests(MergeDigests(classpath.digests()))
 
     #
     # 2. Use Pants' JAR tool to build a runnable fat JAR
     #
 
+    policies = [
+        (rule.pattern, rule.action) for rule in field_set.duplicate_policy.value_or_default()
+    ]
+    skip = [*(jvm.deploy_jar_exclude_files or []), *(field_set.exclude_files.value or [])]
+    jars_digest, jars = await _deploy_jar_inputs(jvm, classpath, policies, skip)
+
     output_filename = PurePath(field_set.output_path.value_or_default(file_ending="jar"))
     jar_digest = await run_jar_tool(
         JarToolRequest(
             jar_name=output_filename.name,
-            digest=classpath_digest,
+            digest=jars_digest,
             main_class=field_set.main_class.value,
-            jars=classpath.args(),
-            policies=[
-                (rule.pattern, rule.action)
-                for rule in field_set.duplicate_policy.value_or_default()
-            ],
-            skip=[*(jvm.deploy_jar_exclude_files or []), *(field_set.exclude_files.value or [])],
+            jars=jars,
+            policies=policies,
+            skip=skip,
             compress=True,
         ),
         **implicitly(),
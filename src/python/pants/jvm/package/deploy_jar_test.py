@@ -332,6 +332,46 @@ def test_deploy_jar_coursier_deps(rule_runner: RuleRunner) -> None:
     _deploy_jar_test(rule_runner, "example_app_deploy_jar")
 
 
+@maybe_skip_jdk_test
+def test_deploy_jar_batched(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": dedent(
+                """\
+                    deploy_jar(
+                        name="example_app_deploy_jar",
+                        main="org.pantsbuild.example.Example",
+                        output_path="dave.jar",
+                        dependencies=[
+                            ":example",
+                        ],
+                    )
+
+                    java_sources(
+                        name="example",
+                        sources=["**/*.java", ],
+                        dependencies=[
+                            ":com.fasterxml.jackson.core_jackson-databind",
+                        ],
+                    )
+
+                    jvm_artifact(
+                        name = "com.fasterxml.jackson.core_jackson-databind",
+                        group = "com.fasterxml.jackson.core",
+                        artifact = "jackson-databind",
+                        version = "2.12.5",
+                    )
+                """
+            ),
+            "3rdparty/jvm/default.lock": COURSIER_LOCKFILE_SOURCE,
+            "Example.java": JAVA_MAIN_SOURCE,
+            "lib/ExampleLib.java": JAVA_JSON_MANGLING_LIB_SOURCE,
+        }
+    )
+
+    _deploy_jar_test(rule_runner, "example_app_deploy_jar", args=["--jvm-deploy-jar-batch-size=1"])
+
+
 @maybe_skip_jdk_test
 def test_deploy_jar_coursier_deps_duplicate_policy(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
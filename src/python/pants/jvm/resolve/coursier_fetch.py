@@ -29,6 +29,7 @@ from pants.engine.fs import (
     DigestSubset,
     FileContent,
     FileDigest,
+    FileEntry,
     MergeDigests,
     PathGlobs,
     RemovePrefix,
@@ -41,6 +42,7 @@ from pants.engine.intrinsics import (
     digest_subset_to_digest,
     digest_to_snapshot,
     get_digest_contents,
+    get_digest_entries,
     merge_digests,
     path_globs_to_digest,
     remove_prefix,
@@ -548,6 +550,22 @@ class ResolvedClasspathEntries(Collection[ClasspathEntry]):
     """A collection of resolved classpath entries."""
 
 
+async def _artifact_requirement_for_entry(entry: CoursierLockfileEntry) -> ArtifactRequirement:
+    """Prepare any URL- or JAR-specifying entries for use with Coursier."""
+    if entry.pants_address:
+        targets = await resolve_targets(
+            **implicitly(
+                UnparsedAddressInputs(
+                    [entry.pants_address],
+                    owning_address=None,
+                    description_of_origin="<infallible - coursier fetch>",
+                )
+            )
+        )
+        return ArtifactRequirement(entry.coord, jar=targets[0][JvmArtifactJarSourceField])
+    return ArtifactRequirement(entry.coord, url=entry.remote_url)
+
+
 @rule
 async def coursier_fetch_one_coord(
     request: CoursierLockfileEntry,
@@ -569,22 +587,7 @@ async def coursier_fetch_one_coord(
     was specified in the lockfile (what Coursier originally downloaded).
     """
 
-    # Prepare any URL- or JAR-specifying entries for use with Coursier
-    req: ArtifactRequirement
-    if request.pants_address:
-        targets = await resolve_targets(
-            **implicitly(
-                UnparsedAddressInputs(
-                    [request.pants_address],
-                    owning_address=None,
-                    description_of_origin="<infallible - coursier fetch>",
-                )
-            )
-        )
-        req = ArtifactRequirement(request.coord, jar=targets[0][JvmArtifactJarSourceField])
-    else:
-        req = ArtifactRequirement(request.coord, url=request.remote_url)
-
+    req = await _artifact_requirement_for_entry(request)
     coursier_resolve_info = await prepare_coursier_resolve_info(ArtifactRequirements([req]))
 
     coursier_report_file_name = "coursier_report.json"
@@ -682,11 +685,89 @@ async def fetch_with_coursier(request: CoursierFetchRequest) -> FallibleClasspat
 
 @rule(level=LogLevel.DEBUG)
 async def coursier_fetch_lockfile(lockfile: CoursierResolvedLockfile) -> ResolvedClasspathEntries:
-    """Fetch every artifact in a lockfile."""
-    classpath_entries = await concurrently(
-        coursier_fetch_one_coord(entry) for entry in lockfile.entries
+    """Fetch every artifact in a lockfile.
+
+    Because the whole lockfile is always needed here, there is no subset to keep cacheable, so
+    rather than running one process per entry via `coursier_fetch_one_coord`, all entries are
+    fetched by a single `coursier fetch` process and then split into one `ClasspathEntry` per
+    entry. Every fetched artifact is checked against the digest recorded in the lockfile.
+    """
+    if not lockfile.entries:
+        return ResolvedClasspathEntries()
+
+    reqs = await concurrently(_artifact_requirement_for_entry(entry) for entry in lockfile.entries)
+    coursier_resolve_info = await prepare_coursier_resolve_info(ArtifactRequirements(reqs))
+
+    coursier_report_file_name = "coursier_report.json"
+
+    process_result = await fallible_to_exec_result_or_raise(
+        **implicitly(
+            CoursierFetchProcess(
+                args=(
+                    coursier_report_file_name,
+                    "--intransitive",
+                    *coursier_resolve_info.argv,
+                ),
+                input_digest=coursier_resolve_info.digest,
+                output_directories=("classpath",),
+                output_files=(coursier_report_file_name,),
+                description=(
+                    f"Fetching with coursier: {pluralize(len(lockfile.entries), 'artifact')}"
+                ),
+            )
+        )
+    )
+    report_digest, classpath_digest = await concurrently(
+        digest_subset_to_digest(
+            DigestSubset(process_result.output_digest, PathGlobs([coursier_report_file_name]))
+        ),
+        digest_subset_to_digest(
+            DigestSubset(process_result.output_digest, PathGlobs(["classpath/**"]))
+        ),
+    )
+    report_contents, stripped_digest = await concurrently(
+        get_digest_contents(report_digest),
+        remove_prefix(RemovePrefix(classpath_digest, "classpath")),
+    )
+    report = json.loads(report_contents[0].content)
+    fetched_file_names = {
+        Coordinate.from_coord_str(dep["coord"]): classpath_dest_filename(dep["coord"], dep["file"])
+        for dep in report["dependencies"]
+    }
+    fetched_file_digests = {
+        entry.path: entry.file_digest
+        for entry in await get_digest_entries(stripped_digest)
+        if isinstance(entry, FileEntry)
+    }
+
+    file_names = []
+    errors = []
+    for entry in lockfile.entries:
+        file_name = fetched_file_names.get(entry.coord)
+        if file_name is None:
+            errors.append(f"Coursier did not fetch '{entry.coord.to_coord_str()}'.")
+            continue
+        file_digest = fetched_file_digests.get(file_name)
+        if file_digest != entry.file_digest:
+            errors.append(
+                f"Fetched artifact {file_digest} for '{entry.coord.to_coord_str()}' did not match "
+                f"the expected artifact: {entry.file_digest}."
+            )
+        file_names.append(file_name)
+    if errors:
+        raise CoursierError(
+            f"Coursier fetch of {pluralize(len(lockfile.entries), 'artifact')} succeeded, but "
+            f"some artifacts did not match the lockfile:\n\n{bullet_list(errors)}"
+        )
+
+    digests = await concurrently(
+        digest_subset_to_digest(DigestSubset(stripped_digest, PathGlobs([file_name])))
+        for file_name in file_names
+    )
+    return ResolvedClasspathEntries(
+        ClasspathEntry(digest=digest, filenames=(file_name,))
+        for digest, file_name in zip(digests, file_names)
     )
-    return ResolvedClasspathEntries(classpath_entries)
 
 
 @rule
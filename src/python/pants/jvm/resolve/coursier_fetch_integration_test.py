@@ -16,7 +16,11 @@ from pants.engine.target import Targets
 from pants.jvm.compile import ClasspathEntry
 from pants.jvm.resolve.common import ArtifactRequirement, ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate, Coordinates
-from pants.jvm.resolve.coursier_fetch import CoursierLockfileEntry, CoursierResolvedLockfile
+from pants.jvm.resolve.coursier_fetch import (
+    CoursierLockfileEntry,
+    CoursierResolvedLockfile,
+    ResolvedClasspathEntries,
+)
 from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.key import CoursierResolveKey
 from pants.jvm.target_types import (
@@ -47,6 +51,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(Targets, [RawSpecs]),
             QueryRule(CoursierResolvedLockfile, (ArtifactRequirements,)),
             QueryRule(ClasspathEntry, (CoursierLockfileEntry,)),
+            QueryRule(ResolvedClasspathEntries, (CoursierResolvedLockfile,)),
             QueryRule(FileDigest, (ExtractFileDigest,)),
         ],
         target_types=[JvmArtifactTarget],
@@ -545,6 +550,51 @@ def test_fetch_one_coord_with_bad_length(rule_runner: RuleRunner) -> None:
         rule_runner.request(ClasspathEntry, [lockfile_entry])
 
 
+@maybe_skip_jdk_test
+def test_fetch_lockfile(rule_runner: RuleRunner) -> None:
+    junit_coord = Coordinate(group="junit", artifact="junit", version="4.13.2")
+    resolved_lockfile = rule_runner.request(
+        CoursierResolvedLockfile,
+        [ArtifactRequirements.from_coordinates([junit_coord])],
+    )
+    classpath_entries = rule_runner.request(ResolvedClasspathEntries, [resolved_lockfile])
+    assert sorted(cpe.filenames for cpe in classpath_entries) == [
+        ("junit_junit_4.13.2.jar",),
+        ("org.hamcrest_hamcrest-core_1.3.jar",),
+    ]
+    for cpe, entry in zip(classpath_entries, resolved_lockfile.entries):
+        file_digest = rule_runner.request(
+            FileDigest, [ExtractFileDigest(cpe.digest, cpe.filenames[0])]
+        )
+        assert file_digest == entry.file_digest
+
+
+@maybe_skip_jdk_test
+def test_fetch_lockfile_with_bad_fingerprint(rule_runner: RuleRunner) -> None:
+    expected_exception_msg = (
+        r"Fetched artifact .*?"
+        r"66fdef91e9739348df7a096aa384a5685f4e875584cce89386a7a47251c4d8e9.*?"
+        r"for 'org.hamcrest:hamcrest-core:1.3' did not match the expected artifact: .*?"
+        r"ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff"
+    )
+    lockfile = CoursierResolvedLockfile(
+        entries=(
+            CoursierLockfileEntry(
+                coord=HAMCREST_COORD,
+                file_name="org.hamcrest_hamcrest-core_1.3.jar",
+                direct_dependencies=Coordinates([]),
+                dependencies=Coordinates([]),
+                file_digest=FileDigest(
+                    fingerprint="ffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff",
+                    serialized_bytes_length=45024,
+                ),
+            ),
+        )
+    )
+    with pytest.raises(ExecutionError, match=expected_exception_msg):
+        rule_runner.request(ResolvedClasspathEntries, [lockfile])
+
+
 @maybe_skip_jdk_test
 def test_fetch_one_coord_with_mismatched_coord(rule_runner: RuleRunner) -> None:
     """This test demonstrates that fetch_one_coord is picky about inexact coordinates.
@@ -117,6 +117,23 @@ class JvmSubsystem(Subsystem):
             """
         ),
     )
+    deploy_jar_batch_size = IntOption(
+        default=0,
+        help=softwrap(
+            """
+            If greater than zero, assemble deploy jars in two steps: first, the classpath is
+            split into stable batches of around this many entries, which are each merged into an
+            intermediate jar in parallel; then the intermediate jars are merged into the deploy
+            jar, without recompressing their entries.
+
+            Intermediate jars are cached, so a change to a single classpath entry only causes
+            its own batch to be rebuilt. This can greatly reduce the time to repackage a deploy
+            jar with a large classpath. Duplicate entry errors will refer to the intermediate
+            jars rather than the original classpath entries.
+            """
+        ),
+        advanced=True,
+    )
 
     # See https://github.com/pantsbuild/pants/issues/14937 for discussion of one way to improve
     # our behavior around cancellation with nailgun.
@@ -4,6 +4,10 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,18 +24,38 @@ from pants.core.goals.test import (
 )
 from pants.core.target_types import FileSourceField
 from pants.core.util_rules.env_vars import environment_vars_subset
+from pants.core.util_rules.shard_balancing import balance_by_duration, junit_xml_durations
 from pants.core.util_rules.source_files import SourceFilesRequest, determine_source_files
-from pants.engine.addresses import Addresses
+from pants.engine.addresses import Address, Addresses
+from pants.engine.collection import Collection
 from pants.engine.env_vars import EnvironmentVarsRequest
-from pants.engine.fs import DigestSubset, MergeDigests, PathGlobs, RemovePrefix
+from pants.engine.fs import (
+    CreateDigest,
+    DigestSubset,
+    FileContent,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    RemovePrefix,
+    Snapshot,
+)
 from pants.engine.internals.graph import transitive_targets
 from pants.engine.intrinsics import (
+    create_digest,
     digest_subset_to_digest,
     digest_to_snapshot,
     execute_process_with_retry,
+    get_digest_contents,
+    get_digest_entries,
     merge_digests,
+    path_globs_to_digest,
+)
+from pants.engine.process import (
+    InteractiveProcess,
+    ProcessCacheScope,
+    ProcessResultWithRetries,
+    ProcessWithRetries,
 )
-from pants.engine.process import InteractiveProcess, ProcessCacheScope, ProcessWithRetries
 from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import SourcesField, TransitiveTargetsRequest
 from pants.engine.unions import UnionRule
@@ -72,10 +96,96 @@ class JunitTestRequest(TestRequest):
     supports_debug = True
 
 
+@dataclass(frozen=True)
+class JunitTestShard:
+    """A subset of the test classes of a target, which runs in its own JVM.
+
+    A shard either includes exactly the given test classes, or, if it includes none, scans for
+    all test classes except for those which run in the other shards of its target.
+    """
+
+    index: int
+    count: int
+    include_classes: tuple[str, ...]
+    exclude_classes: tuple[str, ...]
+
+    @property
+    def description(self) -> str:
+        return f"shard {self.index + 1}/{self.count}"
+
+
+class JunitTestShards(Collection[JunitTestShard]):
+    pass
+
+
+@dataclass(frozen=True)
+class JunitTestShardsRequest:
+    address: Address
+
+
+def _test_class_durations(reports: Iterable[FileContent]) -> dict[str, float]:
+    """Sum the durations of the test cases in the given JUnit XML reports by top-level class."""
+
+    def top_level_class(_: ET.Element, testcase: ET.Element) -> str | None:
+        classname = testcase.get("classname")
+        # Nested test classes run as part of their enclosing class.
+        return classname.split("$", 1)[0] if classname else None
+
+    return junit_xml_durations(reports, key=top_level_class)
+
+
+def _class_name_pattern(classnames: Iterable[str]) -> str:
+    return f"^(?:{'|'.join(re.escape(classname) for classname in classnames)})(?:\\$.*)?$"
+
+
+@rule(level=LogLevel.DEBUG)
+async def compute_junit_test_shards(
+    request: JunitTestShardsRequest, junit: JUnit
+) -> JunitTestShards:
+    if junit.shards <= 1 or not junit.shard_reports_dir:
+        return JunitTestShards()
+
+    reports_digest = await path_globs_to_digest(
+        PathGlobs(
+            [os.path.join(junit.shard_reports_dir, request.address.path_safe_spec, "**", "*.xml")]
+        )
+    )
+    reports = await get_digest_contents(reports_digest)
+    durations = _test_class_durations(reports)
+    classes_by_shard = balance_by_duration(durations, junit.shards)
+    if len(classes_by_shard) <= 1:
+        return JunitTestShards()
+
+    # The least loaded shard also runs any test classes which are not in the reports, by scanning
+    # for all test classes except those which run in the other shards.
+    scanning_index = min(
+        range(len(classes_by_shard)),
+        key=lambda index: sum(durations[classname] for classname in classes_by_shard[index]),
+    )
+    explicit_classes = tuple(
+        sorted(
+            classname
+            for index, classes in enumerate(classes_by_shard)
+            if index != scanning_index
+            for classname in classes
+        )
+    )
+    return JunitTestShards(
+        JunitTestShard(
+            index=index,
+            count=len(classes_by_shard),
+            include_classes=() if index == scanning_index else tuple(sorted(classes)),
+            exclude_classes=explicit_classes if index == scanning_index else (),
+        )
+        for index, classes in enumerate(classes_by_shard)
+    )
+
+
 @dataclass(frozen=True)
 class TestSetupRequest:
     field_set: JunitTestFieldSet
     is_debug: bool
+    shard: JunitTestShard | None = None
 
 
 @dataclass(frozen=True)
@@ -120,6 +230,21 @@ async def setup_junit_for_target(
     reports_dir_prefix = "__reports_dir"
     reports_dir = f"{reports_dir_prefix}/{request.field_set.address.path_safe_spec}"
 
+    shard_args: list[str] = []
+    description = f"Run JUnit 5 ConsoleLauncher against {request.field_set.address}"
+    if request.shard:
+        # Each shard writes its own reports, which would otherwise collide when merged.
+        reports_dir = f"{reports_dir}/shard-{request.shard.index}"
+        if request.shard.include_classes:
+            shard_args.extend(
+                ("--include-classname", _class_name_pattern(request.shard.include_classes))
+            )
+        if request.shard.exclude_classes:
+            shard_args.extend(
+                ("--exclude-classname", _class_name_pattern(request.shard.exclude_classes))
+            )
+        description = f"{description} ({request.shard.description})"
+
     # Classfiles produced by the root `junit_test` targets are the only ones which should run.
     user_classpath_arg = ":".join(classpath.root_args())
 
@@ -149,6 +274,7 @@ async def setup_junit_for_target(
             *(("--scan-class-path", user_classpath_arg) if user_classpath_arg else ()),
             "--reports-dir",
             reports_dir,
+            *shard_args,
             *junit.args,
         ],
         input_digest=input_digest,
@@ -156,7 +282,7 @@ async def setup_junit_for_target(
         extra_jvm_options=junit.jvm_options,
         extra_immutable_input_digests=extra_immutable_input_digests,
         output_directories=(reports_dir,),
-        description=f"Run JUnit 5 ConsoleLauncher against {request.field_set.address}",
+        description=description,
         timeout_seconds=request.field_set.timeout.calculate_from_global_options(test_subsystem),
         level=LogLevel.DEBUG,
         cache_scope=cache_scope,
@@ -165,6 +291,42 @@ async def setup_junit_for_target(
     return TestSetup(process=process, reports_dir_prefix=reports_dir_prefix)
 
 
+async def _merge_shard_results(
+    address: Address,
+    test_subsystem: TestSubsystem,
+    shard_results: Sequence[ProcessResultWithRetries],
+    xml_results: Snapshot,
+) -> TestResult:
+    # The first failing shard (or else the last shard) determines the overall result.
+    deciding_shard = next(
+        (result for result in shard_results if result.last.exit_code != 0), shard_results[-1]
+    )
+    stdout = b"".join(result.last.stdout for result in shard_results)
+    stderr = b"".join(result.last.stderr for result in shard_results)
+    output_entries = await get_digest_entries(
+        await create_digest(
+            CreateDigest([FileContent("stdout", stdout), FileContent("stderr", stderr)])
+        )
+    )
+    output_digests = {
+        entry.path: entry.file_digest for entry in output_entries if isinstance(entry, FileEntry)
+    }
+    return TestResult(
+        exit_code=deciding_shard.last.exit_code,
+        stdout_bytes=stdout,
+        stdout_digest=output_digests["stdout"],
+        stderr_bytes=stderr,
+        stderr_digest=output_digests["stderr"],
+        addresses=(address,),
+        output_setting=test_subsystem.output,
+        result_metadata=deciding_shard.last.metadata,
+        xml_results=xml_results,
+        # Only the attempts of the deciding shard are reported, since the attempts of several
+        # shards would otherwise be summarized as retries.
+        process_results=deciding_shard.results,
+    )
+
+
 @rule(desc="Run JUnit", level=LogLevel.DEBUG)
 async def run_junit_test(
     test_subsystem: TestSubsystem,
@@ -172,24 +334,43 @@ async def run_junit_test(
 ) -> TestResult:
     field_set = batch.single_element
 
-    test_setup = await setup_junit_for_target(
-        TestSetupRequest(field_set, is_debug=False), **implicitly()
+    shards = await compute_junit_test_shards(
+        JunitTestShardsRequest(field_set.address), **implicitly()
+    )
+    test_setups = await concurrently(
+        setup_junit_for_target(
+            TestSetupRequest(field_set, is_debug=False, shard=shard), **implicitly()
+        )
+        for shard in (shards or (None,))
     )
-    process = await jvm_process(**implicitly(test_setup.process))
-    process_results = await execute_process_with_retry(
-        ProcessWithRetries(process, test_subsystem.attempts_default)
+    processes = await concurrently(
+        jvm_process(**implicitly(test_setup.process)) for test_setup in test_setups
     )
-    reports_dir_prefix = test_setup.reports_dir_prefix
+    shard_results = await concurrently(
+        execute_process_with_retry(ProcessWithRetries(process, test_subsystem.attempts_default))
+        for process in processes
+    )
+    reports_dir_prefix = test_setups[0].reports_dir_prefix
 
-    xml_result_subset = await digest_subset_to_digest(
-        DigestSubset(process_results.last.output_digest, PathGlobs([f"{reports_dir_prefix}/**"]))
+    xml_result_subsets = await concurrently(
+        digest_subset_to_digest(
+            DigestSubset(
+                process_results.last.output_digest, PathGlobs([f"{reports_dir_prefix}/**"])
+            )
+        )
+        for process_results in shard_results
     )
+    xml_result_subset = await merge_digests(MergeDigests(xml_result_subsets))
     xml_results = await digest_to_snapshot(
         **implicitly(RemovePrefix(xml_result_subset, reports_dir_prefix))
     )
 
+    if len(shard_results) > 1:
+        return await _merge_shard_results(
+            field_set.address, test_subsystem, shard_results, xml_results
+        )
     return TestResult.from_fallible_process_result(
-        process_results=process_results.results,
+        process_results=shard_results[0].results,
         address=field_set.address,
         output_setting=test_subsystem.output,
         xml_results=xml_results,
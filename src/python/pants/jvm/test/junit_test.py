@@ -23,7 +23,8 @@ from pants.core.goals.test import TestResult, get_filtered_environment
 from pants.core.target_types import FilesGeneratorTarget, FileTarget, RelocatedFiles
 from pants.core.util_rules import config_files, source_files, stripped_source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
-from pants.engine.addresses import Addresses
+from pants.engine.addresses import Address, Addresses
+from pants.engine.fs import FileContent
 from pants.engine.target import CoarsenedTargets
 from pants.jvm import classpath
 from pants.jvm.jdk_rules import rules as java_util_rules
@@ -32,7 +33,7 @@ from pants.jvm.resolve.coursier_fetch import rules as coursier_fetch_rules
 from pants.jvm.resolve.coursier_setup import rules as coursier_setup_rules
 from pants.jvm.strip_jar import strip_jar
 from pants.jvm.target_types import JvmArtifactTarget
-from pants.jvm.test.junit import JunitTestRequest
+from pants.jvm.test.junit import JunitTestRequest, _class_name_pattern, _test_class_durations
 from pants.jvm.test.junit import rules as junit_rules
 from pants.jvm.test.testutil import ATTEMPTS_DEFAULT_OPTION, run_junit_test
 from pants.jvm.testutil import maybe_skip_jdk_test
@@ -414,6 +415,112 @@ def test_jupiter_simple_failure(
     assert len(test_result.process_results) == ATTEMPTS_DEFAULT_OPTION
 
 
+def test_test_class_durations() -> None:
+    report = dedent(
+        """\
+        <?xml version="1.0" encoding="UTF-8"?>
+        <testsuite name="JUnit Jupiter" tests="3">
+          <testcase name="a()" classname="org.pantsbuild.ATest" time="1.5"/>
+          <testcase name="b()" classname="org.pantsbuild.ATest$Nested" time="0.5"/>
+          <testcase name="c()" classname="org.pantsbuild.BTest" time="1,000.25"/>
+        </testsuite>
+        """
+    )
+    assert _test_class_durations(
+        [
+            FileContent("TEST-junit-jupiter.xml", report.encode()),
+            FileContent("TEST-junit-vintage.xml", b"<truncated"),
+        ]
+    ) == {"org.pantsbuild.ATest": 2.0, "org.pantsbuild.BTest": 1000.25}
+
+
+def test_class_name_pattern() -> None:
+    pattern = re.compile(_class_name_pattern(["org.pantsbuild.ATest", "BTest"]))
+    assert pattern.match("org.pantsbuild.ATest")
+    assert pattern.match("org.pantsbuild.ATest$Nested")
+    assert pattern.match("BTest")
+    assert not pattern.match("org.pantsbuild.ATestTwo")
+    assert not pattern.match("orgXpantsbuild.ATest")
+
+
+@maybe_skip_jdk_test
+def test_jupiter_sharded(rule_runner: RuleRunner, junit5_lockfile: JVMLockfileFixture) -> None:
+    address = Address("", target_name="example-test", relative_file_path="SimpleTest.java")
+    rule_runner.write_files(
+        {
+            "3rdparty/jvm/default.lock": junit5_lockfile.serialized_lockfile,
+            "3rdparty/jvm/BUILD": junit5_lockfile.requirements_as_jvm_artifact_targets(),
+            "BUILD": dedent(
+                """\
+                junit_tests(
+                    name='example-test',
+                    dependencies=['3rdparty/jvm:org.junit.jupiter_junit-jupiter-api'],
+                )
+                """
+            ),
+            "SimpleTest.java": dedent(
+                """
+                package org.pantsbuild.example;
+
+                import static org.junit.jupiter.api.Assertions.assertEquals;
+                import org.junit.jupiter.api.Test;
+
+                class SlowTest {
+                    @Test
+                    void testSlow(){
+                      assertEquals("Hello!", "Hello!");
+                   }
+                }
+
+                class FastTest {
+                    @Test
+                    void testFast(){
+                      assertEquals("Hello!", "Hello!");
+                   }
+                }
+
+                class NewTest {
+                    @Test
+                    void testNew(){
+                      assertEquals("Goodbye!", "Hello!");
+                   }
+                }
+                """
+            ),
+            f"reports/{address.path_safe_spec}/TEST-junit-jupiter.xml": dedent(
+                """\
+                <testsuite name="JUnit Jupiter">
+                  <testcase name="testSlow()" classname="org.pantsbuild.example.SlowTest" time="9"/>
+                  <testcase name="testFast()" classname="org.pantsbuild.example.FastTest" time="1"/>
+                </testsuite>
+                """
+            ),
+        }
+    )
+
+    test_result = run_junit_test(
+        rule_runner,
+        "example-test",
+        "SimpleTest.java",
+        extra_args=["--junit-shards=2", "--junit-shard-reports-dir=reports"],
+    )
+
+    # The new test class runs in the shard with the fast test class, and fails it.
+    assert test_result.exit_code == 1
+    # Only the attempts of the failing shard are reported.
+    assert len(test_result.process_results) == ATTEMPTS_DEFAULT_OPTION
+    assert test_result.xml_results
+    assert sorted(test_result.xml_results.dirs) == [
+        address.path_safe_spec,
+        f"{address.path_safe_spec}/shard-0",
+        f"{address.path_safe_spec}/shard-1",
+    ]
+    stdout_text = test_result.stdout_bytes.decode()
+    assert re.search(r"Finished:\s+testSlow", stdout_text) is not None
+    assert re.search(r"Finished:\s+testFast", stdout_text) is not None
+    assert re.search(r"1 tests failed", stdout_text) is not None
+
+
 @maybe_skip_jdk_test
 def test_jupiter_success_with_dep(
     rule_runner: RuleRunner, junit5_lockfile: JVMLockfileFixture
@@ -1428,8 +1428,10 @@ class BootstrapOptions:
         help=softwrap(
             """
             Whether or not to use nailgun to run JVM requests that are marked as supporting nailgun.
-            Note that nailgun only works correctly on JDK <= 17 and must be disabled manually for
-            later versions.
+
+            Nailgun keeps JVM tools such as compilers warm across processes. Note that nailgun
+            only works correctly on JDK <= 17, so processes which run with later versions
+            always start a new JVM.
             """
         ),
         advanced=True,
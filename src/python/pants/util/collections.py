@@ -106,6 +106,7 @@ def partition_sequentially(
     key: Callable[[_T], str],
     size_target: int,
     size_max: int | None = None,
+    preserve_order: bool = False,
 ) -> Iterator[list[_T]]:
     """Stably partitions the given items into batches of around `size_target` items.
 
@@ -116,6 +117,10 @@ def partition_sequentially(
     Batches will optionally be capped to `size_max`, but note that this can weaken the stability
     properties of the bucketing, by forcing bucket boundaries to be created where they otherwise
     might not.
+
+    Items are sorted by their key before being partitioned, unless `preserve_order` is set, in
+    which case the batches are contiguous runs of the items in the order given. Batch boundaries
+    are still stable when items are added, but not when items are reordered.
     """
 
     # To stably partition the arguments into ranges of approximately `size_target`, we sort them,
@@ -142,7 +147,8 @@ def partition_sequentially(
     keyed_items = []
     for item in items:
         keyed_items.append((key(item), item))
-    keyed_items.sort()
+    if not preserve_order:
+        keyed_items.sort()
 
     for item_key, item in keyed_items:
         batch.append(item)
@@ -107,3 +107,10 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_sequentially_preserve_order() -> None:
+    items = [f"item{i}" for i in reversed(range(0, 256))]
+    batches = list(partition_sequentially(items, key=str, size_target=8, preserve_order=True))
+    assert len(batches) > 1
+    assert [item for batch in batches for item in batch] == items
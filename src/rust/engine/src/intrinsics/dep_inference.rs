@@ -9,7 +9,8 @@ use dep_inference::dockerfile::ParsedDockerfileDependencies;
 use dep_inference::javascript::ParsedJavascriptDependencies;
 use dep_inference::python::ParsedPythonDependencies;
 use dep_inference::{dockerfile, javascript, python};
-use fs::{DirectoryDigest, Entry, SymlinkBehavior};
+use fs::{DigestTrie, DirectoryDigest, Entry, SymlinkBehavior};
+use futures::future;
 use grpc_util::prost::MessageExt;
 use hashing::Digest;
 use protos::pb::pants::cache::{
@@ -23,7 +24,7 @@ use store::Store;
 use workunit_store::{Level, in_workunit};
 
 use crate::externs::dep_inference::PyNativeDependenciesRequest;
-use crate::externs::{PyGeneratorResponseNativeCall, store_dict};
+use crate::externs::{PyGeneratorResponseNativeCall, store_dict, store_utf8};
 use crate::nodes::{NodeResult, task_get_context};
 use crate::python::{Failure, Value};
 use crate::{Core, externs};
@@ -32,6 +33,7 @@ pub fn register(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(parse_dockerfile_info, m)?)?;
     m.add_function(wrap_pyfunction!(parse_python_deps, m)?)?;
     m.add_function(wrap_pyfunction!(parse_javascript_deps, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_javascript_deps_batch, m)?)?;
 
     Ok(())
 }
@@ -57,18 +59,70 @@ impl PreparedInferenceRequest {
             metadata,
         } = Python::attach(|py| deps_request.bind(py).extract().map_err(PyErr::from))?;
 
+        Self::for_one_file(directory_digest, metadata, store, backend, impl_hash).await
+    }
+
+    async fn for_one_file(
+        directory_digest: DirectoryDigest,
+        metadata: Option<dependency_inference_request::Metadata>,
+        store: &Store,
+        backend: &str,
+        impl_hash: &str,
+    ) -> NodeResult<Self> {
         let (path, digest) = Self::find_one_file(directory_digest, store, backend).await?;
-        let str_path = path.display().to_string();
+        Ok(Self::new(path, digest, metadata, impl_hash))
+    }
+
+    /// Prepare one request per file in the request's digest, all sharing the same metadata.
+    ///
+    /// Each prepared request is identical to the one `::prepare()` would create for a digest
+    /// containing only that file, so results are cached (and reused) per file.
+    pub async fn prepare_all(
+        deps_request: Value,
+        store: &Store,
+        impl_hash: &str,
+    ) -> NodeResult<Vec<Self>> {
+        let PyNativeDependenciesRequest {
+            directory_digest,
+            metadata,
+        } = Python::attach(|py| deps_request.bind(py).extract().map_err(PyErr::from))?;
 
-        Ok(Self {
+        let trie = store.load_digest_trie(directory_digest).await?;
+        Ok(Self::for_files(&trie, metadata, impl_hash))
+    }
+
+    fn for_files(
+        trie: &DigestTrie,
+        metadata: Option<dependency_inference_request::Metadata>,
+        impl_hash: &str,
+    ) -> Vec<Self> {
+        let mut files = Vec::new();
+        trie.walk(SymlinkBehavior::Oblivious, &mut |node_path, entry| {
+            if let Entry::File(file) = entry {
+                files.push((node_path.to_owned(), file.digest()));
+            }
+        });
+        files
+            .into_iter()
+            .map(|(path, digest)| Self::new(path, digest, metadata.clone(), impl_hash))
+            .collect()
+    }
+
+    fn new(
+        path: PathBuf,
+        digest: Digest,
+        metadata: Option<dependency_inference_request::Metadata>,
+        impl_hash: &str,
+    ) -> Self {
+        Self {
             digest,
             inner: DependencyInferenceRequest {
-                input_file_path: str_path,
+                input_file_path: path.display().to_string(),
                 input_file_digest: Some(digest.into()),
                 metadata,
                 impl_hash: impl_hash.to_string(),
             },
-        })
+        }
     }
 
     pub async fn read_digest(&self, store: &Store) -> NodeResult<String> {
@@ -249,6 +303,51 @@ fn parse_python_deps(deps_request: Value) -> PyGeneratorResponseNativeCall {
     })
 }
 
+fn parse_javascript_file(
+    content: &str,
+    request: PreparedInferenceRequest,
+) -> Result<ParsedJavascriptDependencies, String> {
+    if let Some(dependency_inference_request::Metadata::Js(metadata)) = request.inner.metadata {
+        javascript::get_dependencies(content, request.inner.input_file_path.into(), metadata)
+    } else {
+        Err(format!(
+            "{:?} is not valid metadata for Javascript dependency inference",
+            request.inner.metadata
+        ))
+    }
+}
+
+fn javascript_deps_to_py(
+    py: Python,
+    core: &Arc<Core>,
+    result: ParsedJavascriptDependencies,
+) -> Result<Value, Failure> {
+    let import_items = result
+        .imports
+        .into_iter()
+        .map(|(string, info)| -> Result<_, PyErr> {
+            Ok((
+                string.into_pyobject(py)?.into_any().into(),
+                externs::unsafe_call(
+                    py,
+                    core.types.parsed_javascript_deps_candidate_result,
+                    &[
+                        info.file_imports.into_pyobject(py)?.into_any().into(),
+                        info.package_imports.into_pyobject(py)?.into_any().into(),
+                    ],
+                ),
+            ))
+        })
+        .collect::<Result<Vec<_>, PyErr>>()
+        .map_err(|e| Failure::from_py_err_with_gil(py, e))?;
+
+    Ok(externs::unsafe_call(
+        py,
+        core.types.parsed_javascript_deps_result,
+        &[store_dict(py, import_items).map_err(|e| Failure::from_py_err_with_gil(py, e))?],
+    ))
+}
+
 #[pyfunction]
 fn parse_javascript_deps(deps_request: Value) -> PyGeneratorResponseNativeCall {
     PyGeneratorResponseNativeCall::new(async move {
@@ -276,51 +375,64 @@ fn parse_javascript_deps(deps_request: Value) -> PyGeneratorResponseNativeCall {
                     core,
                     &store,
                     prepared_inference_request,
-                    |content, request| {
-                        if let Some(dependency_inference_request::Metadata::Js(metadata)) =
-                            request.inner.metadata
-                        {
-                            javascript::get_dependencies(
-                                content,
-                                request.inner.input_file_path.into(),
-                                metadata,
+                    parse_javascript_file,
+                )
+                .await?;
+
+                Python::attach(|py| javascript_deps_to_py(py, core, result))
+            }
+        )
+        .await
+    })
+}
+
+#[pyfunction]
+fn parse_javascript_deps_batch(deps_request: Value) -> PyGeneratorResponseNativeCall {
+    PyGeneratorResponseNativeCall::new(async move {
+        let context = task_get_context();
+
+        let core = &context.core;
+        let store = core.store();
+        let prepared_inference_requests =
+            PreparedInferenceRequest::prepare_all(deps_request, &store, javascript::IMPL_HASH)
+                .await?;
+
+        in_workunit!(
+            "parse_javascript_dependencies_batch",
+            Level::Debug,
+            desc = Some(format!(
+                "Determine Javascript dependencies for {} files",
+                prepared_inference_requests.len()
+            )),
+            |_workunit| async move {
+                let store = &store;
+                let results = future::try_join_all(prepared_inference_requests.into_iter().map(
+                    |request| async move {
+                        let path = request.inner.input_file_path.clone();
+                        let result: ParsedJavascriptDependencies =
+                            get_or_create_inferred_dependencies(
+                                core,
+                                store,
+                                request,
+                                parse_javascript_file,
                             )
-                        } else {
-                            Err(format!(
-                                "{:?} is not valid metadata for Javascript dependency inference",
-                                request.inner.metadata
-                            ))
-                        }
+                            .await?;
+                        Ok::<_, Failure>((path, result))
                     },
-                )
+                ))
                 .await?;
 
                 Python::attach(|py| -> Result<_, Failure> {
-                    let import_items = result
-                        .imports
+                    let items = results
                         .into_iter()
-                        .map(|(string, info)| -> Result<_, PyErr> {
+                        .map(|(path, result)| {
                             Ok((
-                                string.into_pyobject(py)?.into_any().into(),
-                                externs::unsafe_call(
-                                    py,
-                                    core.types.parsed_javascript_deps_candidate_result,
-                                    &[
-                                        info.file_imports.into_pyobject(py)?.into_any().into(),
-                                        info.package_imports.into_pyobject(py)?.into_any().into(),
-                                    ],
-                                ),
+                                store_utf8(py, &path),
+                                javascript_deps_to_py(py, core, result)?,
                             ))
                         })
-                        .collect::<Result<Vec<_>, PyErr>>()
-                        .map_err(|e| Failure::from_py_err_with_gil(py, e))?;
-
-                    Ok(externs::unsafe_call(
-                        py,
-                        core.types.parsed_javascript_deps_result,
-                        &[store_dict(py, import_items)
-                            .map_err(|e| Failure::from_py_err_with_gil(py, e))?],
-                    ))
+                        .collect::<Result<Vec<_>, Failure>>()?;
+                    store_dict(py, items).map_err(|e| Failure::from_py_err_with_gil(py, e))
                 })
             }
         )
@@ -367,3 +479,6 @@ pub(crate) async fn lookup_inferred_dependencies<T: serde::de::DeserializeOwned>
         .and_then(|bytes| serde_json::from_slice(&bytes).ok())
         .flatten())
 }
+
+#[cfg(test)]
+mod tests;
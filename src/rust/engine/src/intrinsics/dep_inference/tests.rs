@@ -0,0 +1,99 @@
+// Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+// Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+use std::collections::{HashMap, HashSet};
+use std::path::{Path, PathBuf};
+
+use fs::{DigestTrie, TypedPath};
+use hashing::Digest;
+use protos::pb::pants::cache::dependency_inference_request;
+use store::Store;
+use tempfile::TempDir;
+
+use crate::intrinsics::dep_inference::{PreparedInferenceRequest, parse_javascript_file};
+
+fn make_trie(files: &[(&str, &str)]) -> DigestTrie {
+    let file_digests: HashMap<PathBuf, Digest> = files
+        .iter()
+        .map(|(path, content)| (PathBuf::from(path), Digest::of_bytes(content.as_bytes())))
+        .collect();
+    let typed_paths = files
+        .iter()
+        .map(|(path, _)| TypedPath::File {
+            path: Path::new(path),
+            is_executable: false,
+        })
+        .collect::<Vec<_>>();
+    DigestTrie::from_unique_paths(typed_paths, &file_digests).unwrap()
+}
+
+fn js_metadata() -> Option<dependency_inference_request::Metadata> {
+    Some(dependency_inference_request::Metadata::Js(
+        Default::default(),
+    ))
+}
+
+const FILES: [(&str, &str); 2] = [
+    ("src/a.js", "import b from './b.js';"),
+    ("src/b.js", "const _ = require('lodash');"),
+];
+
+#[tokio::test]
+async fn batch_prepares_one_request_per_file() {
+    let dir = TempDir::new().unwrap();
+    let store = Store::local_only(task_executor::Executor::new(), dir.path()).unwrap();
+
+    let requests = PreparedInferenceRequest::for_files(&make_trie(&FILES), js_metadata(), "hash");
+    assert_eq!(
+        vec!["src/a.js", "src/b.js"],
+        requests
+            .iter()
+            .map(|request| request.inner.input_file_path.as_str())
+            .collect::<Vec<_>>()
+    );
+
+    // Each file is cached under the same key as when `parse_javascript_deps` parses it on its own.
+    for ((path, content), request) in FILES.iter().zip(&requests) {
+        let directory_digest = store
+            .record_digest_trie(make_trie(&[(*path, *content)]), false)
+            .await
+            .unwrap();
+        let single = PreparedInferenceRequest::for_one_file(
+            directory_digest,
+            js_metadata(),
+            &store,
+            "Javascript",
+            "hash",
+        )
+        .await
+        .unwrap();
+        assert_eq!(Digest::of_bytes(content.as_bytes()), single.digest);
+        assert_eq!(single.cache_key(), request.cache_key());
+    }
+}
+
+#[test]
+fn batch_parses_each_file() {
+    let requests = PreparedInferenceRequest::for_files(&make_trie(&FILES), js_metadata(), "hash");
+    let imports = FILES
+        .iter()
+        .zip(requests)
+        .map(|((path, content), request)| {
+            let parsed = parse_javascript_file(content, request).unwrap();
+            (path.to_string(), parsed.imports.into_keys().collect())
+        })
+        .collect::<HashMap<String, HashSet<String>>>();
+    assert_eq!(
+        HashMap::from([
+            (
+                "src/a.js".to_string(),
+                HashSet::from(["./b.js".to_string()])
+            ),
+            (
+                "src/b.js".to_string(),
+                HashSet::from(["lodash".to_string()])
+            ),
+        ]),
+        imports
+    );
+}